@@ -0,0 +1,256 @@
+# benchmarks/page_flows.py
+import os
+
+# Benchmarks only ever drive the local stand-in: set before config is imported so every page targets it
+os.environ["COGNISAAS_ENV"] = "local"
+
+import argparse
+import sys
+import time
+from config.base_config import BaseConfig
+from config.environments import Environments
+from benchmarks import results
+from utilities import seeded_random
+from utilities.logger import setup_logger, clear_log_context
+from utilities.profiler import StepProfiler
+
+logger = setup_logger("benchmarks")
+
+CLIENT_DROPDOWNS = ("select_random_segment", "select_random_industry", "select_random_stage",
+                    "select_random_sales_owner", "select_random_cs_owner", "select_random_implementation_manager")
+PROJECT_DROPDOWNS = ("select_project_template", "select_project_delivery_manager", "select_project_priority",
+                     "select_category", "select_stage", "select_client", "select_teammate")
+
+
+class FlowPages:
+    """The page objects one iteration drives; built after the iteration's RNG is seeded"""
+    def __init__(self, driver):
+        from pages.login_page import LoginPage
+        from pages.client_onboarding_page import ClientOnboardingPage
+        from pages.project_import_page import ProjectImportPageCase
+
+        self.driver = driver
+        self.login = LoginPage(driver)
+        self.clients = ClientOnboardingPage(driver)
+        self.projects = ProjectImportPageCase(driver)
+
+
+# Setups run untimed before each iteration; flows are what is measured
+def logged_out(pages):
+    pages.driver.delete_all_cookies()
+    pages.driver.get(Environments.LOCAL)
+    pages.driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+
+
+def client_form(pages):
+    pages.clients.navigate_to_clients()
+    pages.clients.click_new_client()
+    pages.clients.verify_onboarding_header()
+
+
+def project_form(pages):
+    pages.projects.navigate_to_projects_page()
+    pages.projects.click_new_project()
+
+
+def login(pages):
+    pages.login.open()
+    pages.login.enter_email()
+    pages.login.enter_password()
+    pages.login.click_login()
+    pages.login.verify_login()
+
+
+def onboard_client(pages):
+    client_form(pages)
+    pages.clients.select_random_segment()
+    pages.clients.enter_random_client_name()
+    for method in CLIENT_DROPDOWNS[1:]:
+        getattr(pages.clients, method)()
+    pages.clients.click_save()
+    pages.clients.verify_client_created()
+
+
+def import_project(pages):
+    project_form(pages)
+    for method in PROJECT_DROPDOWNS:
+        getattr(pages.projects, method)()
+    pages.projects.enter_random_project_name()
+    pages.projects.enter_random_implementation_fee()
+    pages.projects.enter_random_arr()
+    pages.projects.enter_random_project_description()
+    pages.projects.click_project_save()
+
+
+def dropdown(page, method):
+    return lambda pages: getattr(getattr(pages, page), method)()
+
+
+class Scenario:
+    def __init__(self, name, flow, setup=None, logged_in=True):
+        self.name = name
+        self.flow = flow
+        self.setup = setup
+        self.logged_in = logged_in
+
+
+SCENARIOS = [
+    Scenario("login", login, setup=logged_out, logged_in=False),
+    Scenario("client_onboarding", onboard_client),
+    Scenario("project_import", import_project),
+] + [
+    Scenario(f"dropdown.clients.{method}", dropdown("clients", method), setup=client_form)
+    for method in CLIENT_DROPDOWNS
+] + [
+    Scenario(f"dropdown.projects.{method}", dropdown("projects", method), setup=project_form)
+    for method in PROJECT_DROPDOWNS
+]
+
+
+class BenchmarkRunner:
+    """Runs each scenario `warmup` + `iterations` times in pooled browsers, timing the flow with the
+    step profiler so every sample carries its wall time, WebDriver commands, waits and sleeps"""
+    def __init__(self, scenarios=SCENARIOS, iterations=BaseConfig.BENCHMARK_ITERATIONS,
+                 warmup=BaseConfig.BENCHMARK_WARMUP, clients=BaseConfig.BENCHMARK_CLIENTS,
+                 out_dir=BaseConfig.BENCHMARK_DIR):
+        self.scenarios = scenarios
+        self.iterations = iterations
+        self.warmup = warmup
+        self.clients = clients
+        # Step-level records land next to the results, readable with python -m utilities.profiler --history
+        self.profiler = StepProfiler(history_path=os.path.join(out_dir, "benchmark_steps.jsonl"))
+
+    def run(self):
+        """Returns {scenario name: [sample, ...]}"""
+        from local_app.server import ensure_local_app
+        from utilities.data_seeder import DataSeeder
+        from utilities.fixtures import logged_in_browser, release_browser
+
+        if Environments.DEFAULT_ENV != Environments.LOCAL:
+            raise RuntimeError(f"Benchmarks only run against the local stand-in, not {Environments.DEFAULT_ENV}")
+        ensure_local_app()
+        self.profiler.install()
+        seeder = None
+        try:
+            if self.clients and any(s.logged_in for s in self.scenarios):
+                seeder = DataSeeder.from_driver(logged_in_browser("session").driver)
+                seeder.create_clients(self.clients)
+            return {scenario.name: self._run_scenario(scenario) for scenario in self.scenarios}
+        finally:
+            self.profiler.uninstall()
+            if seeder is not None:
+                seeder.cleanup()
+                seeder.close()
+            release_browser("session")
+
+    def _run_scenario(self, scenario):
+        from utilities.driver_setup import get_driver_pool
+        from utilities.fixtures import logged_in_browser
+
+        browser = logged_in_browser("session") if scenario.logged_in else None
+        driver = browser.driver if browser else get_driver_pool().acquire()
+        samples = []
+        try:
+            for iteration in range(self.warmup + self.iterations):
+                sample = self._run_once(scenario, iteration, driver, browser)
+                if iteration >= self.warmup:
+                    samples.append(sample)
+        finally:
+            if browser is None:
+                get_driver_pool().release(driver)
+        passed = sum(1 for s in samples if s["success"])
+        print(f"{scenario.name}: {passed}/{len(samples)} passed")
+        return samples
+
+    def _run_once(self, scenario, iteration, driver, browser):
+        test_id = f"benchmark.{scenario.name}#{iteration}"
+        # A fixed seed per iteration, so every run (and the baseline) makes the same choices
+        seeded_random.start_test(test_id, seed=BaseConfig.RNG_SEED or "benchmark", replay=None)
+        sample = {"wall_ms": None, "commands": 0, "sleep_ms": 0.0, "wait_ms": 0.0, "retries": 0, "success": False}
+        try:
+            if browser is not None:
+                browser.reset()
+            pages = FlowPages(driver)
+            if scenario.setup:
+                scenario.setup(pages)
+            self.profiler.start_test(test_id, driver)
+            start = time.perf_counter()
+            try:
+                scenario.flow(pages)
+                sample["success"] = True
+            finally:
+                sample["wall_ms"] = (time.perf_counter() - start) * 1000
+                steps = self.profiler.finish_test(test_id)
+                sample["commands"] = sum(r.commands for r in steps)
+                sample["sleep_ms"] = sum(r.sleep_ms for r in steps)
+                sample["wait_ms"] = sum(r.wait_ms for r in steps)
+                sample["retries"] = sum(r.retries for r in steps)
+        except Exception as e:
+            logger.error(f"{test_id} failed: {e}")
+        finally:
+            seeded_random.finish_test(failed=not sample["success"])
+            # Steps only count once start_test names the iteration, so the next setup goes untimed
+            clear_log_context()
+        return sample
+
+
+def settings(clients):
+    """What the numbers depend on besides the code; a baseline is only comparable under the same settings"""
+    return {
+        "browser": BaseConfig.BROWSER,
+        "headless": BaseConfig.HEADLESS,
+        "latency_ms": BaseConfig.LOCAL_APP_LATENCY_MS,
+        "jitter_ms": BaseConfig.LOCAL_APP_JITTER_MS,
+        "render_delay_ms": BaseConfig.LOCAL_APP_RENDER_DELAY_MS,
+        "list_page": BaseConfig.LOCAL_APP_LIST_PAGE,
+        "clients": clients,
+        "option_cache": BaseConfig.OPTION_CACHE,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the page-object flows against the local stand-in")
+    parser.add_argument("--iterations", type=int, default=BaseConfig.BENCHMARK_ITERATIONS)
+    parser.add_argument("--warmup", type=int, default=BaseConfig.BENCHMARK_WARMUP)
+    parser.add_argument("--only", default="", help="Comma-separated scenario name prefixes, e.g. login,dropdown.")
+    parser.add_argument("--clients", type=int, default=BaseConfig.BENCHMARK_CLIENTS)
+    parser.add_argument("--out-dir", default=BaseConfig.BENCHMARK_DIR)
+    parser.add_argument("--baseline", default=BaseConfig.BENCHMARK_BASELINE)
+    parser.add_argument("--threshold", type=float, default=BaseConfig.BENCHMARK_THRESHOLD)
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the new baseline")
+    args = parser.parse_args(argv)
+
+    prefixes = [p for p in args.only.split(",") if p]
+    scenarios = [s for s in SCENARIOS if not prefixes or any(s.name.startswith(p) for p in prefixes)]
+    if not scenarios:
+        print(f"No scenarios match {args.only}")
+        return 2
+
+    runner = BenchmarkRunner(scenarios, args.iterations, args.warmup, args.clients, args.out_dir)
+    result = results.build_result(runner.run(), settings(args.clients))
+    path = results.save(result, args.out_dir)
+
+    baseline = results.load(args.baseline)
+    print(results.format_table(result, baseline))
+    print(f"Results written to {path}")
+    if args.save_baseline:
+        results.write(result, args.baseline)
+        print(f"Saved as baseline {args.baseline}")
+        return 0
+    if baseline is None:
+        print(f"No baseline at {args.baseline}; create one with --save-baseline")
+        return 0
+    if baseline.get("settings") != result["settings"]:
+        print(f"Warning: baseline settings differ ({baseline.get('settings')}), comparison may not be meaningful")
+
+    regressions = results.compare(result, baseline, args.threshold)
+    for r in regressions:
+        print(f"REGRESSION {r['scenario']} {r['metric']}: {r['baseline']} -> {r['current']}")
+    if not regressions:
+        print(f"No regressions over {args.threshold:.0%} against the baseline from {baseline.get('run_at')}")
+    return 1 if regressions else 0
+
+
+# Example usage: python -m benchmarks.page_flows --iterations 10 --only login,dropdown.
+if __name__ == "__main__":
+    sys.exit(main())
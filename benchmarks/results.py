@@ -0,0 +1,110 @@
+# benchmarks/results.py
+import json
+import os
+import subprocess
+from datetime import datetime
+from config.base_config import BaseConfig
+from utilities.profiler import _percentile
+
+# Compared against the baseline, in report order
+METRICS = ("mean_ms", "p95_ms", "mean_commands", "mean_sleep_ms")
+
+# Increases below these are noise whatever the ratio: a 3 ms helper taking 4 ms is not a regression
+MIN_DELTA = {"mean_ms": 5.0, "p95_ms": 10.0, "mean_commands": 1.0, "mean_sleep_ms": 5.0}
+
+
+def summarize(samples):
+    """Mean/p95 wall time and mean commands, sleeps and waits over the successful samples of a scenario"""
+    passed = [s for s in samples if s["success"]]
+    summary = {"runs": len(samples), "failures": len(samples) - len(passed)}
+    if not passed:
+        return summary
+    walls = [s["wall_ms"] for s in passed]
+    summary.update({
+        "mean_ms": round(sum(walls) / len(passed), 1),
+        "p95_ms": round(_percentile(walls, 95), 1),
+        "min_ms": round(min(walls), 1),
+        "mean_commands": round(sum(s["commands"] for s in passed) / len(passed), 1),
+        "mean_sleep_ms": round(sum(s["sleep_ms"] for s in passed) / len(passed), 1),
+        "mean_wait_ms": round(sum(s["wait_ms"] for s in passed) / len(passed), 1),
+        "retries": sum(s["retries"] for s in passed),
+    })
+    return summary
+
+
+def build_result(samples, settings):
+    """One benchmark run: per-scenario summaries plus what they were measured against"""
+    return {
+        "run_at": datetime.now().isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "settings": settings,
+        "scenarios": {name: summarize(rows) for name, rows in samples.items()},
+    }
+
+
+def save(result, out_dir=BaseConfig.BENCHMARK_DIR):
+    """Write the run to a timestamped file and to latest.json; returns the timestamped path"""
+    path = os.path.join(out_dir, f"benchmark_{result['run_at'].replace(':', '')}.json")
+    write(result, path)
+    write(result, os.path.join(out_dir, "latest.json"))
+    return path
+
+
+def write(result, path):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(result, f, indent=2)
+
+
+def load(path):
+    """A saved run, or None if there is none at `path`"""
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(current, baseline, threshold=BaseConfig.BENCHMARK_THRESHOLD):
+    """Regressions of `current` against `baseline`: every metric that grew by more than `threshold`
+    (and MIN_DELTA), and scenarios that now fail. Scenarios missing from either side are skipped"""
+    regressions = []
+    for name, now in current["scenarios"].items():
+        before = baseline["scenarios"].get(name)
+        if before is None:
+            continue
+        if now["failures"] > before.get("failures", 0):
+            regressions.append({"scenario": name, "metric": "failures",
+                                "baseline": before.get("failures", 0), "current": now["failures"]})
+        for metric in METRICS:
+            if metric not in now or metric not in before:
+                continue
+            limit = max(before[metric] * (1 + threshold), before[metric] + MIN_DELTA[metric])
+            if now[metric] > limit:
+                regressions.append({"scenario": name, "metric": metric,
+                                    "baseline": before[metric], "current": now[metric]})
+    return regressions
+
+
+def format_table(current, baseline=None):
+    """Plain-text table of every scenario, with the change against `baseline` where there is one"""
+    lines = [f"{'scenario':<44}{'runs':>5}{'fail':>5}" + "".join(f"{m:>16}" for m in METRICS)]
+    for name, now in sorted(current["scenarios"].items()):
+        before = (baseline or {}).get("scenarios", {}).get(name, {})
+        cells = []
+        for metric in METRICS:
+            if metric not in now:
+                cells.append(f"{'-':>16}")
+            elif before.get(metric):
+                cells.append(f"{now[metric]:>9} {(now[metric] / before[metric] - 1) * 100:+5.0f}%")
+            else:
+                cells.append(f"{now[metric]:>16}")
+        lines.append(f"{name:<44}{now['runs']:>5}{now['failures']:>5}" + "".join(cells))
+    return "\n".join(lines)
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
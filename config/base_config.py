@@ -1,8 +1,151 @@
 # config/base_config.py
+import os
+
 class BaseConfig:
     # Default timeout for WebDriverWait (in seconds)
     DEFAULT_TIMEOUT = 10
 
+    # Retry policy for flaky UI steps (see utilities/retry_policy.py)
+    RETRY_ATTEMPTS = 3
+    RETRY_DEADLINE = 15             # A retried step gives up after this long in total (in seconds)
+    RETRY_BASE_DELAY = 0.2          # Backoff before the 2nd attempt; doubles per attempt, with full jitter
+    RETRY_MAX_DELAY = 2.0
+
     # Default browser settings
     BROWSER = "chrome"
-    HEADLESS = False
\ No newline at end of file
+    HEADLESS = os.getenv("COGNISAAS_HEADLESS", "0") == "1"
+
+    # Browser profile: "default" (headed, maximized) or "fast" (new headless, fixed viewport, blocked assets)
+    BROWSER_PROFILE = os.getenv("COGNISAAS_BROWSER_PROFILE", "default")
+    WINDOW_SIZE = (1920, 1080)      # Fixed viewport used by the fast profile instead of maximize
+    BLOCKED_URLS = [                # Requests the fast profile never makes (Network.setBlockedURLs patterns)
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.ico",
+        "*.woff", "*.woff2", "*.ttf", "*.otf",
+        "*google-analytics.com*", "*googletagmanager.com*", "*hotjar.com*", "*segment.io*",
+        "*intercom.io*", "*mixpanel.com*", "*clarity.ms*", "*fullstory.com*",
+    ]
+    # Locator registry: serve exact CSS translations of id/attribute-only XPaths (see utilities/locator_registry.py)
+    TRANSLATE_LOCATORS = os.getenv("COGNISAAS_TRANSLATE_LOCATORS", "1") == "1"
+
+    # Driver binary resolution (see utilities/driver_resolver.py)
+    CHROMEDRIVER_PATH = os.getenv("COGNISAAS_CHROMEDRIVER", "")  # Fixed chromedriver; skips resolution entirely
+    CHROME_BINARY = os.getenv("COGNISAAS_CHROME_BINARY", "")     # Used to read the installed Chrome version
+    DRIVER_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cognisaas", "drivers")  # Shared per machine
+
+    # HTTP connection to the driver server (see utilities/remote_connection.py)
+    TUNE_REMOTE_CONNECTION = os.getenv("COGNISAAS_TUNE_REMOTE_CONNECTION", "1") == "1"
+    REMOTE_POOL_SIZE = int(os.getenv("COGNISAAS_REMOTE_POOL_SIZE", "4"))  # Keep-alive sockets kept per browser
+    REMOTE_CONNECT_TIMEOUT = 5      # Connecting to the driver server (in seconds)
+    REMOTE_READ_TIMEOUT = 120       # Waiting for one command's response (in seconds)
+    REMOTE_LOOPBACK = True          # Talk to a local driver on 127.0.0.1 instead of resolving "localhost"
+
+    # DevTools network monitor (Chrome only, see utilities/network_monitor.py)
+    NETWORK_MONITOR = os.getenv("COGNISAAS_NETWORK_MONITOR", "1") == "1"  # Verify saves from the API response
+    NETWORK_POLL_INTERVAL = 0.05    # How often waits drain the browser's network events (in seconds)
+    NETWORK_SAVE_GRACE = 1.0        # With no save request seen after this long and the network idle, fall back
+    CLIENT_SAVE_API = os.getenv("COGNISAAS_CLIENT_SAVE_API", r"/clients/?(\?.*)?$")   # POST that saves a client
+    PROJECT_SAVE_API = os.getenv("COGNISAAS_PROJECT_SAVE_API", r"/projects/?(\?.*)?$")  # POST that saves a project
+
+    # Pre-warmed Chrome user-data-dir; each browser gets its own copy. Empty means a fresh profile
+    USER_DATA_TEMPLATE = os.getenv("COGNISAAS_USER_DATA_TEMPLATE", "")
+
+    # Output locations (the parallel runner points these at per-worker paths)
+    SCREENSHOT_DIR = os.getenv("COGNISAAS_SCREENSHOT_DIR", "screenshots")
+    LOG_DIR = os.getenv("COGNISAAS_LOG_DIR", "logs")
+    LOG_FILE = os.getenv("COGNISAAS_LOG_FILE", "test_logs.jsonl")
+
+    # Prefix mixed into generated names (Client_<n>, Project_<xxxxx>) so parallel workers never collide
+    DATA_TAG = os.getenv("COGNISAAS_DATA_TAG", "")
+    WORKER_ID = None
+
+    # Logging backend settings
+    LOG_FORMAT = os.getenv("COGNISAAS_LOG_FORMAT", "json")  # json (one object per line) or text
+    LOG_ROTATION = "size"           # size or time
+    LOG_MAX_BYTES = 5 * 1024 * 1024
+    LOG_ROTATE_WHEN = "midnight"    # Used when LOG_ROTATION is "time"
+    LOG_BACKUP_COUNT = 5
+
+    # Step profiler settings
+    PROFILE_STEPS = os.getenv("COGNISAAS_PROFILE_STEPS", "0") == "1"
+    PROFILE_HISTORY = os.path.join("reports", "step_timings.jsonl")  # Appended to on every profiled run
+    PROFILE_REPORT_DIR = "reports"
+
+    # WebDriver command metrics settings
+    COMMAND_METRICS = os.getenv("COGNISAAS_COMMAND_METRICS", "1") == "1"  # Count and time every wire command
+    COMMAND_METRICS_FILE = os.path.join("reports", "command_metrics.jsonl")  # Per-test summaries, appended
+    METRICS_PORT = int(os.getenv("COGNISAAS_METRICS_PORT", "0"))  # Serve Prometheus /metrics live; 0 disables
+    METRICS_TEXTFILE = os.getenv("COGNISAAS_METRICS_TEXTFILE", "")  # Write the Prometheus dump here at exit
+
+    # Screenshot pipeline settings
+    SCREENSHOT_POLICY = os.getenv("COGNISAAS_SCREENSHOT_POLICY", "always")  # always, on_failure, sampled, ring_buffer
+    SCREENSHOT_FORMAT = "png"       # png, jpeg or webp (jpeg/webp and scaling need Pillow)
+    SCREENSHOT_SCALE = 1.0          # Downscale factor applied before encoding
+    SCREENSHOT_QUALITY = 80         # Encoder quality for jpeg/webp
+    SCREENSHOT_SAMPLE_RATE = 0.1    # Fraction of non-failure captures kept by the sampled policy
+    SCREENSHOT_RING_SIZE = 5        # Captures kept in memory by the ring_buffer policy
+    SCREENSHOT_QUEUE_SIZE = 32      # Pending writes before captures start being dropped
+
+    # Flight recorder settings
+    FLIGHT_RECORDER_STEPS = 10                  # Step snapshots kept per test
+    FLIGHT_RECORDER_MAX_BYTES = 20 * 1024 * 1024  # Memory cap across all kept snapshots
+    FLIGHT_RECORDER_DOM_CHARS = 200000          # DOM is trimmed to this many characters
+
+    # Driver pool settings
+    DRIVER_POOL_SIZE = 2            # Browsers launched up front and leased to tests
+    DRIVER_POOL_MAX_LEASES = 25     # Recycle a browser after this many leases
+    DRIVER_POOL_MAX_AGE = 1800      # Recycle a browser older than this (in seconds)
+    DRIVER_POOL_ACQUIRE_TIMEOUT = 120
+
+    # Bulk onboarding settings (utilities/bulk_onboarding.py)
+    BULK_WORKERS = 4                # Browsers, each logged in once and reused for every record it takes
+    BULK_CHECKPOINT = os.path.join("reports", "bulk_checkpoint.jsonl")  # Finished records; resumed runs skip them
+    BULK_PROGRESS_EVERY = 10        # Log throughput every N records
+
+    # Seeded test randomness (see utilities/seeded_random.py)
+    RNG_SEED = os.getenv("COGNISAAS_SEED", "")          # Run-wide seed; each test derives its own from it
+    RNG_REPLAY = os.getenv("COGNISAAS_RNG_REPLAY", "")  # "1" replays each test's recorded choices, or a record path
+    RNG_RECORD_DIR = os.path.join("reports", "rng")     # Seed and choice sequence of every failed test
+
+    # Shared logged-in browser fixtures (see utilities/fixtures.py)
+    FIXTURE_SCOPE = os.getenv("COGNISAAS_FIXTURE_SCOPE", "class")  # class, module or session
+    FIXTURE_DRAFT_KEYS = "draft"    # Web storage keys (regex) cleared between tests
+    FIXTURE_RESET_BUDGET = 2.0      # Warn when resetting a shared browser takes longer (in seconds)
+
+    # Authenticated session cache settings
+    SESSION_CACHE_DIR = ".session_cache"
+    SESSION_CACHE_TTL = 3600        # Re-login through the UI after this long (in seconds)
+    SESSION_VERIFY_TIMEOUT = 5      # How long to wait for an injected session to show the dashboard
+
+    # Large dropdowns (clients, teammates): reach one entry by typing or paging instead of reading the list
+    TYPEAHEAD_PREFIX = 12           # Characters of the target typed into type-to-filter inputs
+    LIST_GROWTH_GRACE = 0.75        # At the end of a lazy list, how long to wait for its next page (in seconds)
+    # Draw random clients/teammates from the API list; off until the list endpoints are confirmed on the real app
+    FULL_LIST_SAMPLING = os.getenv("COGNISAAS_FULL_LIST_SAMPLING", "0") == "1"
+
+    # Dropdown option cache for stable vocabularies (see utilities/option_cache.py)
+    OPTION_CACHE = os.getenv("COGNISAAS_OPTION_CACHE", "1") == "1"
+    OPTION_CACHE_DIR = ".option_cache"
+    OPTION_CACHE_TTL = 24 * 3600    # Re-read a dropdown's options after this long (in seconds)
+    TENANT = os.getenv("COGNISAAS_TENANT", "")  # Cache partition; empty means the login email
+
+    # API data seeding settings
+    SEED_VIA_API = os.getenv("COGNISAAS_SEED_VIA_API", "0") == "1"  # Create preconditions over HTTP instead of the UI
+    API_BASE_URL = os.getenv("COGNISAAS_API_URL", "")  # Empty means "<environment>/api"
+    API_TOKEN_STORAGE_KEY = os.getenv("COGNISAAS_API_TOKEN_KEY", "")  # localStorage key holding a bearer token, if any
+    API_POOL_SIZE = 8               # Keep-alive connections kept open by the seeding session
+    API_TIMEOUT = 10                # Per-request timeout (in seconds)
+    API_LIST_MAX_PAGES = 50         # Most pages list_names follows before sampling from what it has
+
+    # Page-object benchmarks against the local stand-in (python -m benchmarks.page_flows)
+    BENCHMARK_ITERATIONS = 5
+    BENCHMARK_WARMUP = 1            # Untimed iterations per scenario, so caches and JIT are warm
+    BENCHMARK_DIR = os.path.join("reports", "benchmarks")
+    BENCHMARK_BASELINE = os.path.join("benchmarks", "baseline.json")
+    BENCHMARK_THRESHOLD = 0.2       # Fractional increase over the baseline reported as a regression
+    BENCHMARK_CLIENTS = 200         # Clients seeded so the client dropdown is longer than one rendered page
+
+    # Local stand-in app settings (used when Environments.DEFAULT_ENV is Environments.LOCAL)
+    LOCAL_APP_LATENCY_MS = int(os.getenv("COGNISAAS_LOCAL_LATENCY_MS", "0"))  # Added to every HTTP response
+    LOCAL_APP_JITTER_MS = int(os.getenv("COGNISAAS_LOCAL_JITTER_MS", "0"))    # Random extra latency, 0..N ms
+    LOCAL_APP_RENDER_DELAY_MS = int(os.getenv("COGNISAAS_LOCAL_RENDER_DELAY_MS", "0"))  # Delay before listboxes render
+    LOCAL_APP_LIST_PAGE = 50        # Listboxes render this many options, appending more as they are scrolled
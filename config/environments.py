@@ -1,7 +1,11 @@
 # config/environments.py
+import os
+
 class Environments:
     STAGING = "https://app.staging.gcp.cognisaas.net"
     PRODUCTION = "https://app.cognisaas.net"  
+    # Local stand-in app (local_app/server.py), started on demand by ensure_local_app()
+    LOCAL = os.getenv("COGNISAAS_LOCAL_URL", "http://127.0.0.1:8765")
 
-    # Default environment
-    DEFAULT_ENV = PRODUCTION
\ No newline at end of file
+    # Default environment (COGNISAAS_ENV=production, staging or local)
+    DEFAULT_ENV = {"staging": STAGING, "local": LOCAL}.get(os.getenv("COGNISAAS_ENV", "production"), PRODUCTION)
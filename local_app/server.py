@@ -0,0 +1,304 @@
+# local_app/server.py
+import argparse
+import json
+import os
+import random
+import re
+import secrets
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from string import Template
+from urllib.parse import parse_qs, urlparse
+from config.base_config import BaseConfig
+from config.credentials import Credentials
+from config.environments import Environments
+from utilities.logger import setup_logger
+
+logger = setup_logger("local_app")
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_TEMPLATES = os.path.join(_HERE, "templates")
+
+# Vocabularies behind every dropdown, shaped like the real app's options (value, label)
+OPTIONS = {
+    "segment": ["Enterprise", "Mid-Market", "SMB", "Strategic"],
+    "industry": ["Banking", "Education", "Healthcare", "Insurance", "Logistics", "Manufacturing",
+                 "Media", "Retail", "Software", "Telecom"],
+    "client_stage": ["Lead", "Prospect", "Onboarding", "Live", "Churned"],
+    "users": ["Aarav Shah", "Diya Patel", "Kabir Mehta", "Meera Iyer", "Rohan Gupta", "Sara Khan"],
+    "templates": ["Standard Implementation", "Quick Start", "Enterprise Rollout", "Data Migration"],
+    "priority": ["Critical", "High", "Medium", "Low"],
+    "category": ["Implementation", "Integration", "Upgrade", "Training"],
+    "project_stage": ["Not Started", "In Progress", "On Hold", "Completed"],
+}
+
+
+def _options(labels, placeholder=None):
+    options = [{"value": re.sub(r"\W+", "_", label.lower()), "label": label} for label in labels]
+    if placeholder:
+        options.insert(0, placeholder)
+    return options
+
+
+def _page_options():
+    options = {name: _options(labels) for name, labels in OPTIONS.items()}
+    # The real delivery manager list starts with a DONT_UPDATE placeholder the page object must skip
+    options["delivery_managers"] = _options(OPTIONS["users"], {"value": "DONT_UPDATE", "label": "Don't update"})
+    return options
+
+
+class _Store:
+    """In-memory clients, projects and sessions; shared by every request thread"""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.sessions = set()
+        self.records = {"clients": {}, "projects": {}}
+        self._next_id = 1
+
+    def create(self, kind, payload):
+        with self.lock:
+            record = dict(payload, id=self._next_id)
+            self._next_id += 1
+            self.records[kind][record["id"]] = record
+            return record
+
+    def delete(self, kind, ids):
+        with self.lock:
+            return sum(1 for record_id in ids if self.records[kind].pop(int(record_id), None) is not None)
+
+    def list(self, kind):
+        with self.lock:
+            return list(self.records[kind].values())
+
+    def get(self, kind, record_id):
+        with self.lock:
+            return self.records[kind].get(record_id)
+
+
+class _Handler(SimpleHTTPRequestHandler):
+    """Serves the page replicas, /static assets and the JSON API, with injected latency"""
+    app = None  # Set per server by LocalApp
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=_HERE, **kwargs)
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    def do_GET(self):
+        self._delay()
+        path = urlparse(self.path).path
+        if path.startswith("/static/"):
+            return super().do_GET()
+        if path.startswith("/api/"):
+            return self._api("GET", path)
+        self._page(path)
+
+    def do_POST(self):
+        self._delay()
+        self._api("POST", urlparse(self.path).path)
+
+    def do_DELETE(self):
+        self._delay()
+        self._api("DELETE", urlparse(self.path).path)
+
+    def _delay(self):
+        latency = self.app.latency_ms + random.uniform(0, self.app.jitter_ms)
+        if latency:
+            time.sleep(latency / 1000)
+
+    def _session(self):
+        cookie = self.headers.get("Cookie", "")
+        match = re.search(r"(?:^|;\s*)session=([^;]+)", cookie)
+        return match and match.group(1) in self.app.store.sessions and match.group(1)
+
+    def _page(self, path):
+        store = self.app.store
+        if path in ("/", "/login"):
+            if self._session():
+                return self._redirect("/dashboard")
+            return self._html("Login", self.app.render("login"))
+        if not self._session():
+            return self._redirect("/")
+
+        if path == "/dashboard":
+            content = self.app.render("dashboard")
+        elif path == "/clients":
+            rows = "".join(f"<li class='client-row'>{c['name']}</li>" for c in store.list("clients"))
+            content = self.app.render("clients", rows=rows)
+        elif path == "/onboard-new-account":
+            content = self.app.render("onboard")
+        elif path == "/projects":
+            rows = "".join(f"<li class='project-row'>{p['name']}</li>" for p in store.list("projects"))
+            content = self.app.render("projects", rows=rows)
+        elif path == "/projects/new":
+            query = parse_qs(urlparse(self.path).query)
+            client = store.get("clients", int(query.get("client", ["0"])[0] or 0))
+            content = self.app.render(
+                "project_form",
+                custom_fields=self.app.render("custom_fields") if "onboarded" in query else "",
+                client_id=client["id"] if client else "",
+                client_name=client["name"] if client else "",
+            )
+        elif re.fullmatch(r"/projects/\d+", path) and store.get("projects", int(path.rsplit("/", 1)[1])):
+            project = store.get("projects", int(path.rsplit("/", 1)[1]))
+            client = store.get("clients", int(project.get("client_id") or 0))
+            content = self.app.render("project_detail", name=project.get("name", ""),
+                                      client_name=client["name"] if client else "")
+        else:
+            return self.send_error(404)
+        self._html(path.strip("/").title() or "Home",
+                   self.app.render("chrome", email=Credentials.VALID_EMAIL, content=content))
+
+    def _api(self, method, path):
+        store = self.app.store
+        body = self._json_body() if method == "POST" else {}
+        if path == "/api/login" and method == "POST":
+            if body.get("email") != Credentials.VALID_EMAIL or body.get("password") != Credentials.VALID_PASSWORD:
+                return self._json({"error": "Invalid email or password"}, 401)
+            token = secrets.token_hex(16)
+            with store.lock:
+                store.sessions.add(token)
+            return self._json({"ok": True}, headers={"Set-Cookie": f"session={token}; Path=/; HttpOnly"})
+
+        session = self._session()
+        if not session:
+            return self._json({"error": "Not authenticated"}, 401)
+        if path == "/api/logout" and method == "POST":
+            with store.lock:
+                store.sessions.discard(session)
+            return self._json({"ok": True}, headers={"Set-Cookie": "session=; Path=/; Max-Age=0"})
+
+        if path == "/api/users" and method == "GET":
+            return self._json([{"id": index + 1, "name": name} for index, name in enumerate(OPTIONS["users"])])
+
+        match = re.fullmatch(r"/api/(clients|projects)(?:/(\d+|batch-delete))?", path)
+        if not match:
+            return self._json({"error": "Not found"}, 404)
+        kind, item = match.groups()
+        if method == "GET" and item is None:
+            return self._json(store.list(kind))
+        if method == "POST" and item is None:
+            if not body.get("name"):
+                return self._json({"error": "name is required"}, 400)
+            return self._json(store.create(kind, body), 201)
+        if method == "POST" and item == "batch-delete":
+            return self._json({"deleted": store.delete(kind, body.get("ids", []))})
+        if method == "DELETE" and item and item.isdigit():
+            if not store.delete(kind, [item]):
+                return self._json({"error": "Not found"}, 404)
+            return self._json({"deleted": 1})
+        return self._json({"error": "Method not allowed"}, 405)
+
+    def _json_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            return json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            return {}
+
+    def _json(self, payload, status=200, headers=None):
+        self._send(status, "application/json", json.dumps(payload).encode(), headers)
+
+    def _html(self, title, body):
+        html = self.app.render("layout", title=title, body=body, config=json.dumps(self.app.page_config))
+        self._send(200, "text/html; charset=utf-8", html.encode())
+
+    def _redirect(self, location):
+        self._send(302, "text/plain", b"", {"Location": location})
+
+    def _send(self, status, content_type, data, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Cache-Control", "no-store")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class LocalApp:
+    """Threaded HTTP stand-in for CogniSaaS serving replicas of the pages the page objects drive,
+    with the same ids and XPaths, an in-memory API, and configurable latency"""
+    def __init__(self, host="127.0.0.1", port=8765, latency_ms=BaseConfig.LOCAL_APP_LATENCY_MS,
+                 jitter_ms=BaseConfig.LOCAL_APP_JITTER_MS, render_delay_ms=BaseConfig.LOCAL_APP_RENDER_DELAY_MS,
+                 list_page=BaseConfig.LOCAL_APP_LIST_PAGE):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.store = _Store()
+        self.page_config = {"renderDelayMs": render_delay_ms, "listPage": list_page, "options": _page_options()}
+        self._templates = {}
+        handler = type("LocalAppHandler", (_Handler,), {"app": self})
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def render(self, name, **values):
+        if name not in self._templates:
+            with open(os.path.join(_TEMPLATES, f"{name}.html"), encoding="utf-8") as f:
+                self._templates[name] = Template(f.read())
+        return self._templates[name].safe_substitute(values)
+
+    def seed_clients(self, count, prefix="Client_Seed"):
+        """Fill the store with `count` clients, e.g. to exercise dropdowns far larger than one rendered page"""
+        for index in range(count):
+            self.store.create("clients", {"name": f"{prefix}{index:05d}"})
+        return self
+
+    def start(self):
+        """Serve on a background thread; returns self"""
+        self._thread = threading.Thread(target=self.server.serve_forever, name="local-app", daemon=True)
+        self._thread.start()
+        logger.info(f"Local CogniSaaS stand-in listening on {self.url}")
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+_shared_app = None
+_shared_app_lock = threading.Lock()
+
+def ensure_local_app(base_url=Environments.LOCAL):
+    """Start the stand-in in this process when tests target Environments.LOCAL; no-op otherwise.
+    Returns the running app, or None if not needed or another process already serves the port"""
+    global _shared_app
+    if Environments.DEFAULT_ENV != Environments.LOCAL:
+        return None
+    with _shared_app_lock:
+        if _shared_app is None:
+            address = urlparse(base_url)
+            try:
+                _shared_app = LocalApp(address.hostname, address.port or 80).start()
+            except OSError:
+                # Port already bound, e.g. by another parallel worker or a standalone server
+                logger.info(f"Local stand-in already running at {base_url}")
+                return None
+        return _shared_app
+
+
+# Example usage: python -m local_app.server --port 8765 --latency-ms 50
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the local CogniSaaS stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=urlparse(Environments.LOCAL).port or 8765)
+    parser.add_argument("--latency-ms", type=int, default=BaseConfig.LOCAL_APP_LATENCY_MS)
+    parser.add_argument("--jitter-ms", type=int, default=BaseConfig.LOCAL_APP_JITTER_MS)
+    parser.add_argument("--render-delay-ms", type=int, default=BaseConfig.LOCAL_APP_RENDER_DELAY_MS)
+    parser.add_argument("--list-page", type=int, default=BaseConfig.LOCAL_APP_LIST_PAGE)
+    parser.add_argument("--clients", type=int, default=0, help="Pre-seed this many clients")
+    cli_args = parser.parse_args()
+    app = LocalApp(cli_args.host, cli_args.port, cli_args.latency_ms, cli_args.jitter_ms, cli_args.render_delay_ms,
+                   cli_args.list_page).seed_clients(cli_args.clients)
+    try:
+        app.server.serve_forever()
+    except KeyboardInterrupt:
+        app.stop()
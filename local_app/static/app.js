@@ -0,0 +1,205 @@
+// local_app/static/app.js
+// Minimal stand-ins for the MUI widgets the page objects drive: Select (popover + backdrop + listbox),
+// Autocomplete (popper + listbox, single value or chips) and the toast. Markup mirrors what MUI renders
+// closely enough that the production locators and in-page wait scripts work unchanged.
+(function () {
+    var config = window.__LOCAL_APP__ || {renderDelayMs: 0, options: {}};
+
+    var api = function (method, path, body) {
+        return fetch(path, {
+            method: method,
+            credentials: 'same-origin',
+            headers: {'Content-Type': 'application/json'},
+            body: body ? JSON.stringify(body) : undefined
+        }).then(function (response) {
+            if (!response.ok) throw new Error(method + ' ' + path + ' failed: ' + response.status);
+            return response.json();
+        });
+    };
+
+    var loadOptions = function (source) {
+        if (source === 'clients') {
+            return api('GET', '/api/clients').then(function (clients) {
+                return clients.map(function (c) { return {value: String(c.id), label: c.name}; });
+            });
+        }
+        return Promise.resolve(config.options[source] || []);
+    };
+
+    var closePopups = function () {
+        Array.prototype.forEach.call(document.querySelectorAll('.local-popup'), function (popup) {
+            popup.remove();
+        });
+    };
+
+    var openListbox = function (anchor, source, filter, onPick, modal) {
+        closePopups();
+        var root = document.createElement('div');
+        root.className = 'local-popup ' + (modal ? 'MuiPopover-root MuiMenu-root' : 'MuiAutocomplete-popper');
+        root.setAttribute('role', 'presentation');
+        if (modal) {
+            var backdrop = document.createElement('div');
+            backdrop.className = 'MuiBackdrop-root MuiBackdrop-invisible';
+            backdrop.addEventListener('click', closePopups);
+            root.appendChild(backdrop);
+        }
+        var paper = document.createElement('div');
+        paper.className = 'MuiPaper-root';
+        var rect = anchor.getBoundingClientRect();
+        paper.style.top = (rect.bottom + window.scrollY) + 'px';
+        paper.style.left = (rect.left + window.scrollX) + 'px';
+        paper.style.minWidth = rect.width + 'px';
+        var list = document.createElement('ul');
+        list.setAttribute('role', 'listbox');
+        list.className = 'MuiList-root MuiMenu-list';
+        paper.appendChild(list);
+        root.appendChild(paper);
+        document.body.appendChild(root);
+
+        loadOptions(source).then(function (options) {
+            setTimeout(function () {
+                if (!root.isConnected) return;
+                var matching = options.filter(function (o) {
+                    return !filter || o.label.toLowerCase().indexOf(filter.toLowerCase()) !== -1;
+                });
+                // Long lists render a page at a time and grow as they are scrolled, like a lazy MUI list
+                var rendered = 0, pageSize = config.listPage || matching.length || 1;
+                var renderMore = function () {
+                    matching.slice(rendered, rendered + pageSize).forEach(appendItem);
+                    rendered = Math.min(matching.length, rendered + pageSize);
+                };
+                paper.addEventListener('scroll', function () {
+                    if (rendered < matching.length && paper.scrollTop + paper.clientHeight >= paper.scrollHeight - 40) {
+                        renderMore();
+                    }
+                });
+                var appendItem = function (option) {
+                    var item = document.createElement('li');
+                    item.setAttribute('role', 'option');
+                    item.setAttribute('data-value', option.value);
+                    item.className = 'MuiMenuItem-root';
+                    item.textContent = option.label;
+                    if (option.disabled) {
+                        item.setAttribute('aria-disabled', 'true');
+                        item.classList.add('Mui-disabled');
+                    } else {
+                        item.addEventListener('click', function () {
+                            onPick(option);
+                            closePopups();
+                        });
+                    }
+                    list.appendChild(item);
+                };
+                renderMore();
+            }, config.renderDelayMs);
+        });
+    };
+
+    // Select: <div role="button" data-select="<source>">, committed label shown as the div's text
+    var initSelect = function (anchor) {
+        anchor.addEventListener('click', function () {
+            openListbox(anchor, anchor.getAttribute('data-select'), null, function (option) {
+                anchor.textContent = option.label;
+                anchor.setAttribute('data-value', option.value);
+            }, true);
+        });
+    };
+
+    // Autocomplete: <input data-autocomplete="<source>">, data-multiple adds chips instead of a value
+    var setNativeValue = function (input, value) {
+        Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set.call(input, value);
+        input.dispatchEvent(new Event('input', {bubbles: true}));
+    };
+    var initAutocomplete = function (input) {
+        var source = input.getAttribute('data-autocomplete');
+        var multiple = input.hasAttribute('data-multiple');
+        var pick = function (option) {
+            if (!multiple) {
+                input.setAttribute('data-value', option.value);
+                return setNativeValue(input, option.label);
+            }
+            var chip = document.createElement('span');
+            chip.className = 'MuiChip-root';
+            chip.setAttribute('data-value', option.value);
+            chip.textContent = option.label;
+            input.parentNode.insertBefore(chip, input);
+            setNativeValue(input, '');
+        };
+        input.addEventListener('click', function () { openListbox(input, source, null, pick, false); });
+        input.addEventListener('input', function (event) {
+            if (event.isTrusted) openListbox(input, source, input.value, pick, false);
+        });
+    };
+
+    var showToast = function (message, durationMs) {
+        var toast = document.createElement('div');
+        toast.className = 'Toastify__toast Toastify__toast--success';
+        toast.textContent = message;
+        document.body.appendChild(toast);
+        setTimeout(function () { toast.remove(); }, durationMs);
+    };
+
+    var fieldValue = function (el) {
+        if (el.tagName === 'INPUT') return el.getAttribute('data-value') || el.value;
+        return el.getAttribute('data-value') || el.textContent;
+    };
+
+    var onSave = function (form) {
+        var kind = form.getAttribute('data-save');
+        var payload = {};
+        Array.prototype.forEach.call(form.querySelectorAll('[data-field]'), function (el) {
+            payload[el.getAttribute('data-field')] = fieldValue(el);
+        });
+        if (kind === 'project') {
+            payload.teammates = Array.prototype.map.call(form.querySelectorAll('.MuiChip-root'), function (chip) {
+                return chip.getAttribute('data-value');
+            });
+            payload.description = (document.querySelector("[role='textbox']") || {}).textContent;
+        }
+        return api('POST', kind === 'client' ? '/api/clients' : '/api/projects', payload).then(function (record) {
+            window.location.href = kind === 'client'
+                ? '/projects/new?client=' + record.id + '&onboarded=1'
+                : '/projects/' + record.id;
+        });
+    };
+
+    document.addEventListener('DOMContentLoaded', function () {
+        Array.prototype.forEach.call(document.querySelectorAll('[data-select]'), initSelect);
+        Array.prototype.forEach.call(document.querySelectorAll('[data-autocomplete]'), initAutocomplete);
+        Array.prototype.forEach.call(document.querySelectorAll('[data-href]'), function (el) {
+            el.addEventListener('click', function () { window.location.href = el.getAttribute('data-href'); });
+        });
+        Array.prototype.forEach.call(document.querySelectorAll('[data-save]'), function (form) {
+            form.querySelector("button[label='Save']").addEventListener('click', function () { onSave(form); });
+        });
+
+        var profile = document.querySelector('.css-axqrh9 + button');
+        if (profile) {
+            profile.addEventListener('click', function () {
+                document.getElementById('profile-menu').style.display = 'block';
+            });
+            document.getElementById('logout').addEventListener('click', function () {
+                api('POST', '/api/logout').then(function () { window.location.href = '/'; });
+            });
+        }
+
+        var login = document.getElementById('login-form');
+        if (login) {
+            login.querySelector('button').addEventListener('click', function () {
+                api('POST', '/api/login', {
+                    email: document.getElementById('user_email').value,
+                    password: document.getElementById('password').value
+                }).then(function () {
+                    window.location.href = '/dashboard';
+                }).catch(function () {
+                    document.getElementById('login-error').textContent = 'Invalid email or password';
+                });
+            });
+        }
+
+        var params = new URLSearchParams(window.location.search);
+        if (params.get('onboarded')) showToast('Onboarded As Draft Successfully!', 1500);
+        var skip = document.querySelector("button[label='Skip']");
+        if (skip) skip.addEventListener('click', function () { skip.parentNode.remove(); });
+    });
+})();
@@ -0,0 +1,65 @@
+# pages/locators.py
+from selenium.webdriver.common.by import By
+
+# Every page-object locator, as authored. utilities/locator_registry.py compiles these (XPath to CSS where
+# the translation is exact) and flags the expensive ones; page objects read them through the registry.
+LOCATORS = {
+    "login": {
+        "email_field": (By.ID, "user_email"),
+        "password_field": (By.ID, "password"),
+        "login_button": (By.XPATH, "//button[contains(text(), 'Login')]"),
+        "profile_button": (By.XPATH, "//div[@class='css-axqrh9']/following-sibling::button"),
+    },
+    "logout": {
+        "profile_button": (By.XPATH, "//div[@class='css-axqrh9']/following-sibling::button"),
+        "logout_button": (By.XPATH, "//h6[contains(text(), 'Logout')]"),
+        "email_field": (By.ID, "user_email"),
+    },
+    "client_onboarding": {
+        "clients_page": (By.XPATH, "//div[@id='Clients']"),
+        "new_client_button": (By.XPATH, "//button[@id='new-client-button']"),
+        "onboarding_page_header": (By.XPATH, "//div[@class='OnBoardNewAccount__Header']"),
+        "client_name_input": (By.XPATH, "//input[@id='name']"),
+        "segment_dropdown": (By.XPATH, "//div[@id='segment-select']"),
+        "industry_input": (By.XPATH, "//input[@id='industry']"),
+        "stage_dropdown": (By.XPATH, "//div[@id='stage' and @role='button']"),
+        "sales_owner_dropdown": (By.XPATH, "//div[@id='sales_owner' and @aria-labelledby='sales_owner']"),
+        "cs_owner_dropdown": (By.XPATH, "//div[@id='cs_owner' and @aria-labelledby='cs_owner']"),
+        "implementation_manager_dropdown": (By.XPATH, "//div[@id='implementation_manager' and @aria-labelledby='implementation_manager']"),
+        "client_save_button": (By.XPATH, "//button[@label='Save']"),
+        "client_save_button_fallback": (By.XPATH, "//button[contains(@class, 'MuiButton') and contains(text(), 'Save')]"),
+        "cancel_button": (By.XPATH, "//button[@label='Cancel']"),
+        "skip_button": (By.XPATH, "//button[@label='Skip']"),
+        # After Save: the custom-fields step shows the project template picker once the client exists
+        "client_created_template": (By.XPATH, "//div[@id='template' and @aria-labelledby='template-label template' ]"),
+        # Any of these after Save means the client was saved (used when the API response is not observed)
+        "save_success_draft_toast": (By.XPATH, "//div[contains(text(),'Onboarded As Draft Successfully')]"),
+        "save_success_text": (By.XPATH, "//div[contains(text(),'Successfully')]"),
+        "save_success_toastify": (By.XPATH, "//div[contains(@class, 'Toastify') and contains(text(),'Success')]"),
+        "save_success_alert": (By.XPATH, "//div[contains(@class, 'MuiAlert-message') and contains(text(),'Success')]"),
+        "save_success_class": (By.XPATH, "//div[contains(@class, 'success')]"),
+        "save_success_toast_class": (By.XPATH, "//div[contains(@class, 'toast-success')]"),
+        "client_details": (By.XPATH, "//div[contains(@class, 'client-details')]"),
+    },
+    "project_import": {
+        "project_page": (By.ID, "Projects"),
+        "add_new_project": (By.XPATH, "//button[@label='New Project']"),
+        "client_dropdown": (By.XPATH, "//div[@id='client']"),
+        "choose_project_template": (By.XPATH, "//div[@id='template']"),
+        "project_name_input": (By.ID, "name"),
+        "project_priority": (By.ID, "priority-select"),
+        "project_category": (By.ID, "category-select"),
+        "project_stage": (By.ID, "stage-select"),
+        "project_delivery_manager": (By.XPATH, "//div[@role='button' and @id='delivery_manager']"),
+        "project_planned_start_date": (By.XPATH, "(//*[name()='path'])[59]"),
+        "project_planned_end_date": (By.XPATH, "(//*[name()='path'])[60]"),
+        "project_teammate_dropdown": (By.XPATH, "//input[@placeholder='Choose a team member']"),
+        "project_implementation_fee": (By.ID, "implementation_fee"),
+        "project_arr": (By.ID, "recurring_revenue"),
+        "project_description_box": (By.XPATH, "//div[@role='textbox']"),
+        "project_save_button": (By.XPATH, "//button[@label='Save']"),
+        "client_onboarding_toast": (By.XPATH, "//div[contains(text(),'Onboarded As Draft Successfully!')]"),
+        "Dropdown_frame": (By.XPATH, "//div[@tabindex='-1']"),
+        "project_import_verification": (By.XPATH, "//span[contains(text(),'Overview')]"),
+    },
+}
@@ -6,20 +6,24 @@ from config.environments import Environments
 from config.credentials import Credentials
 from config.base_config import BaseConfig
 from selenium.common.exceptions import TimeoutException
+from utilities.locator_registry import get_locator_registry
+from utilities.logger import setup_logger
 
 class LoginPage:
     def __init__(self, driver):
         self.driver = driver
-        # Define locators as tuples (By locator strategy, value)
-        self.email_field = (By.ID, "user_email")
-        self.password_field = (By.ID, "password")
-        self.login_button = (By.XPATH, "//button[contains(text(), 'Login')]")
-        self.profile_button = (By.XPATH, "//div[@class='css-axqrh9']/following-sibling::button")
+        self.logger = setup_logger("login_page")
+        # Locators are defined in pages/locators.py; the registry hands out compiled (CSS-first) versions
+        locators = get_locator_registry()
+        self.email_field = locators.get("login", "email_field")
+        self.password_field = locators.get("login", "password_field")
+        self.login_button = locators.get("login", "login_button")
+        self.profile_button = locators.get("login", "profile_button")
 
     def open(self):
         """Navigate to the CogniSaaS login page"""
         self.driver.get(Environments.DEFAULT_ENV)
-        print("Opened CogniSaaS login page")
+        self.logger.info("Opened CogniSaaS login page")
 
     def enter_email(self, email=Credentials.VALID_EMAIL):
         """Enter email into the email field"""
@@ -28,7 +32,7 @@ class LoginPage:
         )
         email_element.clear()  # Clear any pre-filled text
         email_element.send_keys(email)
-        print(f"Entered email: {email}")
+        self.logger.info(f"Entered email: {email}")
 
     def enter_password(self, password=Credentials.VALID_PASSWORD):
         """Enter password into the password field"""
@@ -37,7 +41,7 @@ class LoginPage:
         )
         password_element.clear()
         password_element.send_keys(password)
-        print("Entered password")
+        self.logger.info("Entered password")
 
     def click_login(self):
         """Click the login button"""
@@ -45,30 +49,30 @@ class LoginPage:
             EC.element_to_be_clickable(self.login_button)
         )
         login_button.click()
-        print("Clicked login button")
+        self.logger.info("Clicked login button")
 
-    def verify_login(self):
+    def verify_login(self, timeout=BaseConfig.DEFAULT_TIMEOUT):
         """Verify successful login by checking for the profile button"""
         try:
             # Wait for page load
-            WebDriverWait(self.driver, BaseConfig.DEFAULT_TIMEOUT).until(
+            WebDriverWait(self.driver, timeout).until(
                 EC.presence_of_element_located(self.profile_button)
             )
             
             # Wait for element to be clickable
-            WebDriverWait(self.driver, BaseConfig.DEFAULT_TIMEOUT).until(
+            WebDriverWait(self.driver, timeout).until(
                 EC.element_to_be_clickable(self.profile_button)
             )
             
             # Additional check for any loading spinners to disappear
             loading_spinner = (By.CSS_SELECTOR, ".loading-spinner")  # adjust selector as needed
-            WebDriverWait(self.driver, BaseConfig.DEFAULT_TIMEOUT).until(
+            WebDriverWait(self.driver, timeout).until(
                 EC.invisibility_of_element_located(loading_spinner)
             )
             
             return True
         except TimeoutException as e:
-            print("Login verification failed - Profile button not clickable")
+            self.logger.error("Login verification failed - Profile button not clickable")
             raise e
 
     def get_current_url(self):
@@ -1,16 +1,19 @@
 # pages/logout_page.py
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from config.base_config import BaseConfig
+from utilities.locator_registry import get_locator_registry
+from utilities.logger import setup_logger
 
 class LogoutPage:
     def __init__(self, driver):
         self.driver = driver
-        # Define locators as tuples (By locator strategy, value)
-        self.profile_button = (By.XPATH, "//div[@class='css-axqrh9']/following-sibling::button")
-        self.logout_button = (By.XPATH, "//h6[contains(text(), 'Logout')]")
-        self.email_field = (By.ID, "user_email")
+        self.logger = setup_logger("logout_page")
+        # Locators are defined in pages/locators.py; the registry hands out compiled (CSS-first) versions
+        locators = get_locator_registry()
+        self.profile_button = locators.get("logout", "profile_button")
+        self.logout_button = locators.get("logout", "logout_button")
+        self.email_field = locators.get("logout", "email_field")
 
     def click_profile(self):
         """Click the profile button to open the dropdown"""
@@ -18,7 +21,7 @@ class LogoutPage:
             EC.element_to_be_clickable(self.profile_button)
         )
         profile_button.click()
-        print("Clicked profile button")
+        self.logger.info("Clicked profile button")
 
     def click_logout(self):
         """Click the logout button"""
@@ -26,14 +29,14 @@ class LogoutPage:
             EC.element_to_be_clickable(self.logout_button)
         )
         logout_button.click()
-        print("Clicked logout button")
+        self.logger.info("Clicked logout button")
 
     def verify_logout(self):
         """Verify logout by checking for the email field on the login page"""
         WebDriverWait(self.driver, BaseConfig.DEFAULT_TIMEOUT).until(
             EC.presence_of_element_located(self.email_field)
         )
-        print("Logout verified - Back to login page")
+        self.logger.info("Logout verified - Back to login page")
 
     def get_current_url(self):
         """Return the current URL for verification"""
@@ -1,27 +1,34 @@
-import random
 import re
-import time
 import string
-import os
 from datetime import datetime, timedelta
 from functools import wraps
 from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
 from selenium.webdriver.common.keys import Keys  # Importing Keys class to simulate keyboard keys
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys  # Importing Keys class
 
 from config.base_config import BaseConfig
-from utilities import logger
+from utilities.locator_registry import get_locator_registry
+from utilities.logger import setup_logger, log_step
+from utilities.waits import PageWaits
+from utilities.screenshot import get_screenshot_pipeline
+from utilities.flight_recorder import record_step
+from utilities.dropdown_selector import DropdownSelector
+from utilities.data_seeder import DataSeeder
+from utilities.form_filler import FormFiller, Field, DROPDOWN, choose
+from utilities.network_monitor import get_network_monitor
+from utilities.seeded_random import get_test_rng
 
 def screenshot_decorator(func):
     @wraps(func)
     def wrapper(self, *args, **kwargs):
         try:
-            result = func(self, *args, **kwargs)
-            # Take screenshot after successful execution
-            self.take_screenshot(f"success_{func.__name__}")
+            with log_step(func.__name__):
+                result = func(self, *args, **kwargs)
+            # Keep the step in the flight recorder; fall back to a policy-driven screenshot without one
+            if not record_step(self.driver, func.__name__):
+                self.take_screenshot(f"success_{func.__name__}", failed=False)
             return result
         except Exception as e:
             # Take screenshot on error
@@ -30,54 +37,56 @@ def screenshot_decorator(func):
     return wrapper
 
 class ProjectImportPageCase:
-    def __init__(self, driver):
+    # Fields fill_project_form() accepts explicit values for
+    PROJECT_FORM_FIELDS = ("template", "delivery_manager", "priority", "category", "stage", "teammate",
+                           "project_name", "implementation_fee", "arr", "description")
+
+    def __init__(self, driver, rng=None):
         self.driver = driver
-        self.logger = logger  # Ensure logger is initialized
-
-        # Create screenshots directory if it doesn't exist
-        self.screenshot_dir = os.path.join(os.getcwd(), 'screenshots')
-        os.makedirs(self.screenshot_dir, exist_ok=True)
-
-        # Locators
-        self.project_page = (By.ID, "Projects")
-        self.add_new_project = (By.XPATH, "//button[@label='New Project']")
-        self.client_dropdown = (By.XPATH, "//div[@id='client']")
-        self.choose_project_template = (By.XPATH, "//div[@id='template']")
-        self.project_name_input = (By.ID, "name")
-        self.project_priority = (By.ID, "priority-select")
-        self.project_category = (By.ID, "category-select")
-        self.project_stage = (By.ID, "stage-select")
-        self.project_delivery_manager = (By.XPATH, "//div[@role='button' and @id='delivery_manager']")
-        self.project_planned_start_date = (By.XPATH, "(//*[name()='path'])[59]")
-        self.project_planned_end_date = (By.XPATH, "(//*[name()='path'])[60]")
-        self.project_teammate_dropdown = (By.XPATH, "//input[@placeholder='Choose a team member']")
-        self.project_implementation_fee = (By.ID, "implementation_fee")
-        self.project_arr = (By.ID, "recurring_revenue")
-        self.project_description_box = (By.XPATH, "//div[@role='textbox']")
-        self.project_save_button = (By.XPATH, "//button[@label='Save']")
-        self.client_onboarding_toast = (By.XPATH, "//div[contains(text(),'Onboarded As Draft Successfully!')]")
-        self.Dropdown_frame = (By.XPATH, "//div[@tabindex='-1']")
-        self.project_import_verification = (By.XPATH, "//span[contains(text(),'Overview')]")
-
-    def take_screenshot(self, name):
-        """Take a screenshot and save it with timestamp."""
-        try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{name}_{timestamp}.png"
-            filepath = os.path.join(self.screenshot_dir, filename)
-            self.driver.save_screenshot(filepath)
-            print(f"Screenshot saved: {filepath}")
-        except Exception as e:
-            print(f"Failed to take screenshot: {e}")
+        self.logger = setup_logger("project_import_page")
+        # Every random value and option comes from the test's seeded RNG, so failures can be replayed
+        self.rng = rng or get_test_rng()
+        self.waits = PageWaits(driver)
+        self.dropdowns = DropdownSelector(driver, rng=self.rng)
+        self.forms = FormFiller(driver, self.dropdowns)
+
+        # Screenshots are written in the background by the shared pipeline
+        self.screenshots = get_screenshot_pipeline()
+
+        # Locators (defined in pages/locators.py, served compiled by the registry)
+        locators = get_locator_registry()
+        self.project_page = locators.get("project_import", "project_page")
+        self.add_new_project = locators.get("project_import", "add_new_project")
+        self.client_dropdown = locators.get("project_import", "client_dropdown")
+        self.choose_project_template = locators.get("project_import", "choose_project_template")
+        self.project_name_input = locators.get("project_import", "project_name_input")
+        self.project_priority = locators.get("project_import", "project_priority")
+        self.project_category = locators.get("project_import", "project_category")
+        self.project_stage = locators.get("project_import", "project_stage")
+        self.project_delivery_manager = locators.get("project_import", "project_delivery_manager")
+        self.project_planned_start_date = locators.get("project_import", "project_planned_start_date")
+        self.project_planned_end_date = locators.get("project_import", "project_planned_end_date")
+        self.project_teammate_dropdown = locators.get("project_import", "project_teammate_dropdown")
+        self.project_implementation_fee = locators.get("project_import", "project_implementation_fee")
+        self.project_arr = locators.get("project_import", "project_arr")
+        self.project_description_box = locators.get("project_import", "project_description_box")
+        self.project_save_button = locators.get("project_import", "project_save_button")
+        self.client_onboarding_toast = locators.get("project_import", "client_onboarding_toast")
+        self.Dropdown_frame = locators.get("project_import", "Dropdown_frame")
+        self.project_import_verification = locators.get("project_import", "project_import_verification")
+
+    def take_screenshot(self, name, failed=True):
+        """Queue a screenshot on the async pipeline; success captures are subject to the capture policy."""
+        self.screenshots.capture(self.driver, name, failed=failed)
 
     def clientOnboardingToastInvisibility(self):
         try:
             WebDriverWait(self.driver, BaseConfig.DEFAULT_TIMEOUT).until(
                 EC.invisibility_of_element_located(self.client_onboarding_toast)
             )
-            print("Client Onboarding toast is invisible.")
+            self.logger.info("Client Onboarding toast is invisible.")
         except Exception as e:
-            print(f"Error waiting for Client Onboarding toast to disappear: {e}")
+            self.logger.error(f"Error waiting for Client Onboarding toast to disappear: {e}")
 
     @screenshot_decorator
     def navigate_to_projects_page(self):
@@ -93,12 +102,12 @@ class ProjectImportPageCase:
             WebDriverWait(self.driver, BaseConfig.DEFAULT_TIMEOUT).until(
                 EC.element_to_be_clickable(self.project_page)
             ).click()
-            print("Navigated to Projects page.")
+            self.logger.info("Navigated to Projects page.")
             
             # Add assertion to verify navigation
             assert "projects" in self.driver.current_url.lower(), "Failed to navigate to Projects page"
         except Exception as e:
-            print(f"Error navigating to Projects page: {e}")
+            self.logger.error(f"Error navigating to Projects page: {e}")
             raise
 
     @screenshot_decorator
@@ -109,352 +118,157 @@ class ProjectImportPageCase:
                 EC.element_to_be_clickable(self.add_new_project)
             )
             new_project_button.click()
-            print("Clicked New Project button.")
-            time.sleep(2)
+            self.logger.info("Clicked New Project button.")
+            self.waits.dom_settled(replaced_sleep=2)
             
             # Add assertion to verify form is opened
             assert WebDriverWait(self.driver, BaseConfig.DEFAULT_TIMEOUT).until(
                 EC.presence_of_element_located(self.project_name_input)
             ).is_displayed(), "New Project form did not open"
         except Exception as e:
-            print(f"Error clicking New Project button: {e}")
+            self.logger.error(f"Error clicking New Project button: {e}")
             raise
 
     @screenshot_decorator
     def select_project_template(self):
-        """Clicks on 'choose_project_template', prints all options, and selects a random one."""
+        """Clicks on 'choose_project_template' and selects a random template."""
         try:
             # Wait for any overlays or loading elements to disappear
-            time.sleep(2)  # Give time for any animations to complete
-            
-            templateDropdown = WebDriverWait(self.driver, BaseConfig.DEFAULT_TIMEOUT).until(
-                EC.element_to_be_clickable(self.choose_project_template)
-            )
-            templateDropdown.click()
-            print("Project Template Dropdown opened.")
+            self.waits.dom_settled(replaced_sleep=2)  # Give time for any animations to complete
             
-            templateElements = WebDriverWait(self.driver, BaseConfig.DEFAULT_TIMEOUT).until(
-                EC.presence_of_all_elements_located((By.XPATH, "//ul[@role='listbox']/li"))
-            )
-
-            templateOptions = [(option, option.text.strip()) for option in templateElements if option.text.strip()]
-            valid_templateOptions = [(el, txt) for el, txt in templateOptions if txt]
-
-            if valid_templateOptions:
-                random_template_element, random_template_text = random.choice(valid_templateOptions)
-                # Scroll the option into view and click using JavaScript
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", random_template_element)
-                time.sleep(1)
-                self.driver.execute_script("arguments[0].click();", random_template_element)
-                print(f"Selected Random Project Template: {random_template_text}")
-                
-                # Add assertion to verify selection with more flexible text matching
-                try:
-                    selected_element = WebDriverWait(self.driver, BaseConfig.DEFAULT_TIMEOUT).until(
-                        EC.presence_of_element_located(self.choose_project_template)
-                    )
-                    selected_value = selected_element.text.strip()
-                    
-                    # Check if the selected text is contained within the expected text or vice versa
-                    assert (selected_value in random_template_text or random_template_text in selected_value), \
-                        f"Template selection failed. Expected text to contain or be contained in: '{random_template_text}', Got: '{selected_value}'"
-                    
-                    print(f"Template selection verified. Selected value: {selected_value}")
-                except Exception as verify_error:
-                    print(f"Warning: Template selection verification failed: {verify_error}")
-                    # Take an additional screenshot of the verification failure
-                    self.take_screenshot("template_verification_error")
-                    
-                return random_template_text
-            else:
-                print("No valid Project Template options available to select.")
+            # Option text, click and committed value are handled in two script round-trips
+            option = self.dropdowns.select(self.choose_project_template, label="Project Template",
+                                           cache_key="project.template")
+            if option is None:
+                self.logger.warning("No valid Project Template options available to select.")
                 return None
+            return option["text"]
         except Exception as e:
-            print(f"Error selecting Project Template: {e}")
+            self.logger.error(f"Error selecting Project Template: {e}")
             # Take an additional screenshot of the error state
             self.take_screenshot("template_selection_error")
             raise
 
     @screenshot_decorator
-    def select_client(self):
-        """Clicks the 'Client' dropdown, prints all options, and selects a random one."""
+    def select_client(self, name=None):
+        """Clicks the 'Client' dropdown and selects `name`, or a random client when no name is given."""
         try:
             # Wait for any overlays or loading elements to disappear
-            time.sleep(2)  # Give time for any animations to complete
-            
-            # Wait for client dropdown to be present and visible
-            clientDropdown = WebDriverWait(self.driver, BaseConfig.DEFAULT_TIMEOUT).until(
-                EC.presence_of_element_located(self.client_dropdown)
-            )
+            self.waits.dom_settled(replaced_sleep=2)  # Give time for any animations to complete
             
-            # Scroll element into view
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", clientDropdown)
-            time.sleep(1)  # Allow scrolling to complete
-            
-            # Try to click using JavaScript if normal click is intercepted
-            try:
-                clientDropdown.click()
-            except:
-                self.driver.execute_script("arguments[0].click();", clientDropdown)
-            
-            print("Client Dropdown opened.")
-            
-            # Wait for dropdown options with increased timeout
-            clientElements = WebDriverWait(self.driver, BaseConfig.DEFAULT_TIMEOUT).until(
-                EC.presence_of_all_elements_located((By.XPATH, "//ul[@role='listbox']/li"))
-            )
-            
-            # Store WebElements and clean text together
-            clientOptions = [(option, option.text.strip()) for option in clientElements if option.text.strip()]
-            valid_clientOptions = [(el, txt) for el, txt in clientOptions if txt]
-
-            if valid_clientOptions:
-                random_client_element, random_client_text = random.choice(valid_clientOptions)
-                
-                # Scroll the option into view and click using JavaScript
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", random_client_element)
-                time.sleep(1)
-                self.driver.execute_script("arguments[0].click();", random_client_element)
-                
-                print(f"Selected Random Client: {random_client_text}")
-                
-                # Add assertion to verify selection
-                try:
-                    selected_value = WebDriverWait(self.driver, BaseConfig.DEFAULT_TIMEOUT).until(
-                        EC.presence_of_element_located(self.client_dropdown)
-                    ).text.strip()
-                    assert selected_value == random_client_text, f"Client selection failed. Expected: {random_client_text}, Got: {selected_value}"
-                except:
-                    print("Warning: Could not verify client selection, but proceeding...")
-                
-                return random_client_text
-            else:
-                print("No valid Client options available to select.")
+            # Tenants can have thousands of clients: the listbox is paged to the target in the browser, and
+            # a random client is drawn from the API's full list rather than the rendered window
+            names = None if name else self._list_names(DataSeeder.CLIENTS_PATH, "Client")
+            option = self.dropdowns.select_large(self.client_dropdown, names=names, value=name or None,
+                                                 scroll=True, label="Client")
+            if option is None:
+                self.logger.warning("No valid Client options available to select.")
                 return None
+            return option["text"]
 
         except Exception as e:
-            print(f"Error selecting Client: {e}")
+            self.logger.error(f"Error selecting Client: {e}")
             # Take an additional screenshot of the error state
             self.take_screenshot("client_selection_error")
             raise
 
     @screenshot_decorator
     def select_project_priority(self):
-        """Clicks the 'Project Priority' dropdown, prints all options, and selects the first available option."""
+        """Clicks the 'Project Priority' dropdown and selects a random priority."""
         try:
-            priorityDropdown = WebDriverWait(self.driver, BaseConfig.DEFAULT_TIMEOUT).until(
-                EC.element_to_be_clickable(self.project_priority)
-            )
-            priorityDropdown.click()
-
-            # Wait for the dropdown options to appear
-            priorityElements = WebDriverWait(self.driver, BaseConfig.DEFAULT_TIMEOUT).until(
-                EC.presence_of_all_elements_located((By.XPATH, "//li[@role='option']"))
-            )
-
-            # Store all priority options
-            priorityOptions = [(option, self.re.sub(r'\s+', ' ', option.text).strip()) for option in priorityElements if option.text.strip()]
-                 # Filter out any invalid or empty options
-            valid_priorityOptions = [(el, txt) for el, txt in priorityOptions if txt.lower()]
-
-            if valid_priorityOptions:
-                random_priority_element, random_priority_text = random.choice(valid_priorityOptions)
-                random_priority_element.click()  # Click the WebElement, not the text
-                print(f"Selected Random Priority: {random_priority_text}")
-                return random_priority_text  # Return selected option text
-            else:
-                print("No valid categories available to select.")
-                return None
+            option = self.dropdowns.select(self.project_priority, option_selector=DropdownSelector.MENU_OPTIONS,
+                                           verify=False, label="Priority", cache_key="project.priority")
+            return option["text"] if option else None
         except (TimeoutException, StaleElementReferenceException) as e:
-            print(f"Error occurred while selecting project category: {e}")
+            self.logger.error(f"Error occurred while selecting project priority: {e}")
             return None
 
     @screenshot_decorator
     def select_category(self):
-        """Clicks the 'Project Category' dropdown, switches to the frame, selects a random category, and prints the selected category."""
-        
+        """Clicks the 'Project Category' dropdown and selects a random category."""
         try:
-            # Step 1: Click the 'Project Category' dropdown
-            categoryDropdown = WebDriverWait(self.driver, BaseConfig.DEFAULT_TIMEOUT).until(
-                EC.element_to_be_clickable(self.project_category)
-            )
-            categoryDropdown.click()
-            time.sleep(1)  # Allow dropdown to expand
-
-            # Get all category elements
-            categoryElements = WebDriverWait(self.driver, BaseConfig.DEFAULT_TIMEOUT).until(
-                EC.presence_of_all_elements_located((By.XPATH, "//li[@role='option']"))
-            )
-
-            # Store WebElements and clean text together
-            categoryOptions = [(option, self.re.sub(r'\s+', ' ', option.text).strip()) for option in categoryElements if option.text.strip()]
-
-            # Filter out any invalid or empty options
-            valid_categoryOptions = [(el, txt) for el, txt in categoryOptions if txt.lower()]
-
-            if valid_categoryOptions:
-                random_category_element, random_category_text = random.choice(valid_categoryOptions)
-                random_category_element.click()  # Click the WebElement, not the text
-                print(f"Selected Random Category: {random_category_text}")
-                return random_category_text  # Return selected option text
-            else:
-                print("No valid categories available to select.")
-                return None
+            option = self.dropdowns.select(self.project_category, option_selector=DropdownSelector.MENU_OPTIONS,
+                                           verify=False, label="Category", cache_key="project.category")
+            return option["text"] if option else None
         except (TimeoutException, StaleElementReferenceException) as e:
-            print(f"Error occurred while selecting project category: {e}")
+            self.logger.error(f"Error occurred while selecting project category: {e}")
             return None
 
-       
     @screenshot_decorator
     def select_stage(self):
-        """Clicks the 'Project Stage' dropdown, selects a random stage from the dropdown, and prints the selected stage."""
-        
+        """Clicks the 'Project Stage' dropdown and selects a random stage."""
         try:
-            # Step 1: Click the 'Project Stage' dropdown
-            StageDropdown = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable(self.project_stage)
-            )
-            StageDropdown.click()
-            time.sleep(1)  # Allow dropdown to expand
-
-            # Step 2: Wait for options to appear
-            WebDriverWait(self.driver, 5).until(
-                EC.presence_of_all_elements_located((By.XPATH, "//li[@role='option']"))
-            )
-
-            # Step 3: Refetch the options before selecting
-            options = self.driver.find_elements(By.XPATH, "//li[@role='option']")
-
-            if not options:
-                print("No options available!")
-                return
-
-            print(f"Total options found: {len(options)}")
-
-            # Step 4: Select a random option (get fresh reference)
-            random_option = random.choice(options)
-
-            # Get text BEFORE clicking to avoid stale element issues
-            selected_text = random_option.text.strip()
-            print(f"Selected Project Stage (Before Click): {selected_text}")
-
-            # Scroll into view and click
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", random_option)
-            time.sleep(1)  # Let it scroll properly
-            random_option.click()
-            time.sleep(1)  # Allow selection to register
-
-            # Step 5: Print selected stage after clicking
-            print(f"Selected Project Stage (After Click): {selected_text}")  # Printing the captured text
-            
-            return selected_text  # Return the selected stage if needed
+            option = self.dropdowns.select(self.project_stage, option_selector=DropdownSelector.MENU_OPTIONS,
+                                           verify=False, label="Project Stage", cache_key="project.stage")
+            if option is None:
+                return None
+            self.waits.backdrop_gone(replaced_sleep=1)  # Allow selection to register
+            return option["text"]
 
         except (TimeoutException, StaleElementReferenceException) as e:
-            print(f"Error occurred while selecting project stage: {e}")
+            self.logger.error(f"Error occurred while selecting project stage: {e}")
             return None 
 
-
-    import re
-
     @screenshot_decorator
     def select_project_delivery_manager(self):
         """Opens the project delivery manager dropdown and selects a valid option."""
         try:
             # Wait for any overlays or loading elements to disappear
-            time.sleep(2)  # Give time for any animations to complete
+            self.waits.dom_settled(replaced_sleep=2)  # Give time for any animations to complete
             
-            project_deliveryManager = WebDriverWait(self.driver, BaseConfig.DEFAULT_TIMEOUT).until(
-                EC.element_to_be_clickable(self.project_delivery_manager)
+            # Skip placeholder entries such as DONT_UPDATE
+            option = self.dropdowns.select(
+                self.project_delivery_manager,
+                predicate=lambda o: o["value"] and "dont_update" not in o["value"].lower(),
+                scroll=True,
+                label="Delivery Manager",
             )
-            
-            # Scroll element into view
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", project_deliveryManager)
-            time.sleep(1)  # Allow scrolling to complete
-            
-            project_deliveryManager.click()
-            print("Delivery Manager Dropdown opened.")
-
-            # Wait for options with increased timeout
-            options = WebDriverWait(self.driver, BaseConfig.DEFAULT_TIMEOUT).until(
-                EC.presence_of_all_elements_located((By.XPATH, "//ul[@role='listbox']/li"))
-            )
-
-            # Filter only enabled options with safe attribute checking
-            valid_options = []
-            for option in options:
-                if option.is_enabled():
-                    data_value = option.get_attribute("data-value")
-                    # Check if data_value exists and doesn't contain DONT_UPDATE
-                    if data_value and "DONT_UPDATE" not in data_value.lower():
-                        valid_options.append(option)
-            
-            if valid_options:
-                random_option = random.choice(valid_options)
-                # Scroll the option into view and click using JavaScript
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", random_option)
-                time.sleep(1)
-                self.driver.execute_script("arguments[0].click();", random_option)
-                
-                selected_text = random_option.text.strip()
-                print(f"Selected Delivery Manager: {selected_text}")
-                
-                # Verify selection
-                try:
-                    selected_value = WebDriverWait(self.driver, BaseConfig.DEFAULT_TIMEOUT).until(
-                        EC.presence_of_element_located(self.project_delivery_manager)
-                    ).text.strip()
-                    assert selected_value == selected_text, f"Delivery Manager selection failed. Expected: {selected_text}, Got: {selected_value}"
-                except:
-                    print("Warning: Could not verify delivery manager selection, but proceeding...")
-                
-                return selected_text
-            else:
-                print("No valid delivery manager options available to select.")
+            if option is None:
                 self.take_screenshot("no_valid_delivery_managers")
                 return None
+            return option["text"]
 
         except Exception as e:
-            print(f"Error selecting Delivery Manager: {e}")
+            self.logger.error(f"Error selecting Delivery Manager: {e}")
             self.take_screenshot("delivery_manager_selection_error")
             raise
 
-
-
     @screenshot_decorator
-    def select_teammate(self):
-        """Clicks the 'Teammate' dropdown, prints all options, and selects the first available option."""
+    def select_teammate(self, name=None):
+        """Clicks the 'Teammate' dropdown and selects `name`, or a random teammate when no name is given."""
         try:
-            # Wait for dropdown to be clickable and then click
-            teammateDropdown = WebDriverWait(self.driver, BaseConfig.DEFAULT_TIMEOUT).until(
-                EC.element_to_be_clickable(self.project_teammate_dropdown)
+            # Teammates render as chips, so the input never shows the committed value. The autocomplete
+            # filters as it is typed into, so a prefix of the target narrows the list to a few options
+            names = None if name else self._list_names(DataSeeder.USERS_PATH, "Teammate")
+            option = self.dropdowns.select_large(
+                self.project_teammate_dropdown,
+                names=names,
+                value=name or None,
+                typeahead=True,
+                predicate=lambda o: o["text"].lower() != "select",
+                verify=False,
+                label="Teammate",
             )
-            teammateDropdown.click()
-            print("TeamMates Dropdown opened.")
-
-            # Wait for options to appear
-            teammateElements = WebDriverWait(self.driver, BaseConfig.DEFAULT_TIMEOUT).until(
-                EC.presence_of_all_elements_located((By.XPATH, "//ul[@role='listbox']/li"))
-            )
-
-            # Extract clean text while keeping original WebElements
-            teammateOptions = [(option, self.re.sub(r'\s+', ' ', option.text).strip()) for option in teammateElements if option.text.strip()]
-
-            # Get valid options (excluding empty or placeholder ones)
-            valid_teammates = [(el, txt) for el, txt in teammateOptions if txt and txt.lower() != "select"]
-
-            if valid_teammates:
-                random_teammate_element, random_teammate_text = random.choice(valid_teammates)
-                random_teammate_element.click()  # Click the WebElement, not the text
-                print(f"Selected Random Teammate: {random_teammate_text}")
-                return random_teammate_text  # Return selected option's text
-            else:
-                print("No valid teammates available to select.")
-                return None
+            return option["text"] if option else None
 
         except (TimeoutException, StaleElementReferenceException) as e:
-            print(f"Error selecting Teammate: {e}")
+            self.logger.error(f"Error selecting Teammate: {e}")
             return None
         
+    def _list_names(self, path, label):
+        """Every name the API lists under `path`, or None (sample the rendered options instead)"""
+        if not BaseConfig.FULL_LIST_SAMPLING:
+            return None
+        try:
+            seeder = DataSeeder.from_driver(self.driver)
+            try:
+                return seeder.list_names(path) or None
+            finally:
+                seeder.close()
+        except Exception as e:
+            self.logger.info(f"Full {label} list unavailable, choosing from the rendered options: {e}")
+            return None
+
     def _set_date_using_js(self, date_picker_locator, date_name, days_offset=0):
         """Set a date in the date picker using JavaScript."""
         try:
@@ -466,10 +280,10 @@ class ProjectImportPageCase:
             selected_date = (datetime.today() + timedelta(days=days_offset)).strftime("%Y-%m-%d")
             self.driver.execute_script(f"arguments[0].setAttribute('value', '{selected_date}');", date_field)
 
-            print(f"Selected {date_name}: {selected_date}")
+            self.logger.info(f"Selected {date_name}: {selected_date}")
             return selected_date
         except Exception as e:
-            print(f"Error selecting {date_name}: {e}")
+            self.logger.error(f"Error selecting {date_name}: {e}")
             return None
 
     def select_random_planned_start_date(self):
@@ -478,19 +292,22 @@ class ProjectImportPageCase:
     def select_random_planned_end_date(self):
         return self._set_date_using_js(self.project_planned_end_date, "Planned End Date", days_offset=7)
 
+    def _random_text(self, label, text_length=5):
+        return f"{label}_{BaseConfig.DATA_TAG}{''.join(self.rng.choices(string.ascii_letters + string.digits, k=text_length))}"
+
     def enter_random_text(self, locator, label, text_length=5):
         """Enter a random text into an input field."""
         try:
-            random_text = f"{label}_{''.join(random.choices(string.ascii_letters + string.digits, k=text_length))}"
+            random_text = self._random_text(label, text_length)
             input_field = WebDriverWait(self.driver, BaseConfig.DEFAULT_TIMEOUT).until(
                 EC.presence_of_element_located(locator)
             )
             input_field.clear()
             input_field.send_keys(random_text)
-            print(f"Entered {label}: {random_text}")
+            self.logger.info(f"Entered {label}: {random_text}")
             return random_text
         except Exception as e:
-            print(f"Error entering {label}: {e}")
+            self.logger.error(f"Error entering {label}: {e}")
             return None
 
     @screenshot_decorator
@@ -506,7 +323,7 @@ class ProjectImportPageCase:
             assert entered_value == random_name, f"Project name entry failed. Expected: {random_name}, Got: {entered_value}"
             return random_name
         except Exception as e:
-            print(f"Error entering project name: {e}")
+            self.logger.error(f"Error entering project name: {e}")
             raise
 
     @screenshot_decorator
@@ -522,50 +339,87 @@ class ProjectImportPageCase:
             assert entered_value == random_description, f"Project description entry failed. Expected: {random_description}, Got: {entered_value}"
             return random_description
         except Exception as e:
-            print(f"Error entering project description: {e}")
+            self.logger.error(f"Error entering project description: {e}")
             raise
     
     @screenshot_decorator
     def enter_random_implementation_fee(self):
         """Enter a random numeric implementation fee."""
         try:
-            random_fee = str(random.randint(1000, 100000))
+            random_fee = str(self.rng.randint(1000, 100000))
             input_field = WebDriverWait(self.driver, BaseConfig.DEFAULT_TIMEOUT).until(
                 EC.presence_of_element_located(self.project_implementation_fee)
             )
             input_field.clear()
             input_field.send_keys(random_fee)
-            print(f"Entered Implementation Fee: {random_fee}")
+            self.logger.info(f"Entered Implementation Fee: {random_fee}")
             
             # Add assertion to verify entered value
             entered_value = input_field.get_attribute("value").replace(",", "")
             assert entered_value == random_fee, f"Implementation fee entry failed. Expected: {random_fee}, Got: {entered_value}"
             return random_fee
         except Exception as e:
-            print(f"Error entering Implementation Fee: {e}")
+            self.logger.error(f"Error entering Implementation Fee: {e}")
             raise
 
     @screenshot_decorator
     def enter_random_arr(self):
         """Enter a random numeric ARR (Annual Recurring Revenue)."""
         try:
-            random_arr = str(random.randint(5000, 200000))
+            random_arr = str(self.rng.randint(5000, 200000))
             input_field = WebDriverWait(self.driver, BaseConfig.DEFAULT_TIMEOUT).until(
                 EC.element_to_be_clickable(self.project_arr)
             )
             input_field.clear()
             input_field.send_keys(random_arr)
-            print(f"Entered ARR: {random_arr}")
+            self.logger.info(f"Entered ARR: {random_arr}")
             
             # Add assertion to verify entered value, handling numeric formatting
             entered_value = input_field.get_attribute("value").replace(",", "").lstrip("0")
             assert entered_value == random_arr, f"ARR entry failed. Expected: {random_arr}, Got: {entered_value}"
             return random_arr
         except Exception as e:
-            print(f"Error entering ARR: {e}")
+            self.logger.error(f"Error entering ARR: {e}")
             self.take_screenshot("arr_entry_error")
             raise
 
+    @screenshot_decorator
+    def fill_project_form(self, client=None, include_client=True, verify=True, **values):
+        """Fill the whole New Project form in a few script calls; returns {field: value}.
+        `client` selects that client by name; include_client=False keeps a preselected client.
+        Any field in PROJECT_FORM_FIELDS can be given explicitly; the rest are random."""
+        unknown = set(values) - set(self.PROJECT_FORM_FIELDS)
+        if unknown:
+            raise TypeError(f"Unknown project form fields: {', '.join(sorted(unknown))}")
+        plain_number = lambda v: v.replace(",", "").lstrip("0")
+        fields = [
+            Field("template", self.choose_project_template, kind=DROPDOWN, cache_key="project.template",
+                  **choose(values.get("template"))),
+            Field("delivery_manager", self.project_delivery_manager, kind=DROPDOWN, scroll=True,
+                  predicate=lambda o: o["value"] and "dont_update" not in o["value"].lower(),
+                  **choose(values.get("delivery_manager"))),
+            Field("priority", self.project_priority, kind=DROPDOWN, verify=False, cache_key="project.priority",
+                  option_selector=DropdownSelector.MENU_OPTIONS, **choose(values.get("priority"))),
+            Field("category", self.project_category, kind=DROPDOWN, verify=False, cache_key="project.category",
+                  option_selector=DropdownSelector.MENU_OPTIONS, **choose(values.get("category"))),
+            Field("stage", self.project_stage, kind=DROPDOWN, verify=False, cache_key="project.stage",
+                  option_selector=DropdownSelector.MENU_OPTIONS, **choose(values.get("stage"))),
+            Field("teammate", self.project_teammate_dropdown, kind=DROPDOWN, verify=False,
+                  predicate=lambda o: o["text"].lower() != "select", **choose(values.get("teammate"))),
+            Field("project_name", self.project_name_input, value=values.get("project_name") or self._random_text("Project")),
+            Field("implementation_fee", self.project_implementation_fee,
+                  value=str(values.get("implementation_fee") or self.rng.randint(1000, 100000)), normalize=plain_number),
+            Field("arr", self.project_arr, value=str(values.get("arr") or self.rng.randint(5000, 200000)),
+                  normalize=plain_number),
+            Field("description", self.project_description_box,
+                  value=values.get("description") or self._random_text("Description")),
+        ]
+        if include_client:
+            fields.insert(1, Field("client", self.client_dropdown, kind=DROPDOWN, scroll=True, **choose(client)))
+        values = self.forms.fill(fields, verify=verify)
+        self.logger.info(f"Filled project form: {values}")
+        return values
+
     @screenshot_decorator
     def click_project_save(self):
         """Click the Save button to submit the project form."""
@@ -573,8 +427,14 @@ class ProjectImportPageCase:
             save_button = WebDriverWait(self.driver, 10).until(
                 EC.element_to_be_clickable(self.project_save_button)
             )
+            network = get_network_monitor(self.driver)
+            cursor = network.mark() if network else 0
             save_button.click()
-            print("Save button clicked.")
+            self.logger.info("Save button clicked.")
+
+            # The API response is authoritative; the toast is only checked when no save request was seen
+            if network and network.verify_saved(BaseConfig.PROJECT_SAVE_API, cursor, what="Project"):
+                return
             
             # Add assertion to verify save action
             try:
@@ -585,5 +445,5 @@ class ProjectImportPageCase:
             except TimeoutException:
                 assert False, "Save confirmation toast did not appear"
         except Exception as e:
-            print(f"Error clicking save button: {e}")
+            self.logger.error(f"Error clicking save button: {e}")
             raise
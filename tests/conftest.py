@@ -0,0 +1,53 @@
+# tests/conftest.py
+import pytest
+from config.base_config import BaseConfig
+from utilities import seeded_random
+from utilities.fixtures import logged_in_browser, release_browser
+from utilities.logger import set_log_context, clear_log_context
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "browser_scope(scope): share the logged-in browser per class, module or session")
+
+
+@pytest.fixture(scope="session")
+def session_browser():
+    yield logged_in_browser("session")
+    release_browser("session")
+
+
+@pytest.fixture(scope="module")
+def module_browser(request):
+    key = request.module.__name__
+    yield logged_in_browser("module", key)
+    release_browser("module", key)
+
+
+@pytest.fixture(scope="class")
+def class_browser(request):
+    key = request.node.nodeid
+    yield logged_in_browser("class", key)
+    release_browser("class", key)
+
+
+@pytest.fixture
+def logged_in_driver(request):
+    """A logged-in driver on the landing page, shared per @pytest.mark.browser_scope (default FIXTURE_SCOPE)"""
+    marker = request.node.get_closest_marker("browser_scope")
+    scope = marker.args[0] if marker else BaseConfig.FIXTURE_SCOPE
+    browser = request.getfixturevalue(f"{scope}_browser")
+    set_log_context(test_id=request.node.nodeid)
+    seeded_random.start_test(request.node.nodeid)
+    browser.reset()
+    yield browser.driver
+    report = getattr(request.node, "rep_call", None)
+    seeded_random.finish_test(failed=report is not None and report.failed)
+    clear_log_context()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    # Exposes the test outcome to fixtures during teardown as item.rep_<phase>
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
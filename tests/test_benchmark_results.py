@@ -0,0 +1,47 @@
+import unittest
+from benchmarks import results
+
+
+def sample(wall_ms, commands=10, success=True):
+    return {"wall_ms": wall_ms, "commands": commands, "sleep_ms": 0.0, "wait_ms": 0.0, "retries": 0,
+            "success": success}
+
+
+def run(**scenarios):
+    return {"scenarios": scenarios}
+
+
+class TestBenchmarkResults(unittest.TestCase):
+    def test_summary_ignores_failed_samples(self):
+        summary = results.summarize([sample(100), sample(200), sample(5000, success=False)])
+        self.assertEqual(summary["runs"], 3)
+        self.assertEqual(summary["failures"], 1)
+        self.assertEqual(summary["mean_ms"], 150)
+        self.assertEqual(summary["p95_ms"], 200)
+
+    def test_all_failed_has_no_timings(self):
+        summary = results.summarize([sample(None, success=False)])
+        self.assertEqual(summary["failures"], 1)
+        self.assertNotIn("mean_ms", summary)
+
+    def test_regression_over_threshold(self):
+        baseline = run(login=results.summarize([sample(1000)]))
+        current = run(login=results.summarize([sample(1300, commands=10)]))
+        regressions = results.compare(current, baseline, threshold=0.2)
+        self.assertEqual({r["metric"] for r in regressions}, {"mean_ms", "p95_ms"})
+
+    def test_small_absolute_changes_are_noise(self):
+        baseline = run(helper=results.summarize([sample(3, commands=2)]))
+        current = run(helper=results.summarize([sample(6, commands=3)]))
+        self.assertEqual(results.compare(current, baseline, threshold=0.2), [])
+
+    def test_new_failures_and_unknown_scenarios(self):
+        baseline = run(login=results.summarize([sample(1000)]))
+        current = run(login=results.summarize([sample(1000), sample(None, success=False)]),
+                      added=results.summarize([sample(10)]))
+        regressions = results.compare(current, baseline)
+        self.assertEqual([(r["scenario"], r["metric"]) for r in regressions], [("login", "failures")])
+
+
+if __name__ == "__main__":
+    unittest.main()
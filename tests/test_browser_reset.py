@@ -0,0 +1,32 @@
+import unittest
+from config.base_config import BaseConfig
+from utilities.fixtures import LoggedInTestCase
+
+
+class TestBrowserReset(LoggedInTestCase):
+    def test_reset_returns_to_a_clean_landing_page(self):
+        """Drafts, dialogs and navigation left by a test are gone after a reset"""
+        self.driver.get(self.browser.environment.rstrip("/") + "/clients")
+        # Left on the page the test ended on, so the reset itself has to remove them
+        self.driver.execute_script("""
+            window.localStorage.setItem('projectFormDraft', '{"project_name": "half typed"}');
+            var dialog = document.createElement('div');
+            dialog.className = 'MuiDialog-root';
+            document.body.appendChild(dialog);
+        """)
+
+        self.browser.reset()
+
+        self.assertEqual(self.driver.current_url, self.browser.home_url)
+        self.assertIsNone(self.driver.execute_script("return window.localStorage.getItem('projectFormDraft');"))
+        self.assertEqual(self.driver.execute_script("return document.querySelectorAll('.MuiDialog-root').length;"), 0)
+
+    def test_reset_is_cheap_and_repeatable(self):
+        """Back-to-back resets land on the same page well inside the budget"""
+        for _ in range(3):
+            self.assertLess(self.browser.reset(), BaseConfig.FIXTURE_RESET_BUDGET)
+            self.assertEqual(self.driver.current_url, self.browser.home_url)
+
+
+if __name__ == "__main__":
+    unittest.main()
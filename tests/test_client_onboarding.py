@@ -3,37 +3,25 @@ import unittest
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from utilities.driver_setup import DriverSetup
 from utilities.logger import setup_logger
+from utilities.fixtures import LoggedInTestCase
 from utilities.screenshot import capture_screenshot
 from pages.login_page import LoginPage
 from pages.project_import_page import ProjectImportPageCase
 from pages.client_onboarding_page import ClientOnboardingPage
-from config.credentials import Credentials
 from config.environments import Environments
 
-class TestClientOnboarding(unittest.TestCase):
+class TestClientOnboarding(LoggedInTestCase):
     def setUp(self):
         self.logger = setup_logger(log_name="client_onboarding_test")
-        self.driver_setup = DriverSetup()
-        self.driver = self.driver_setup.get_driver()
-
+        # Resets the shared logged-in browser and starts the per-test recorders (LoggedInTestCase)
+        super().setUp()
         self.login_page = LoginPage(self.driver)
         self.client_onboarding_page = ClientOnboardingPage(self.driver)
         self.project_import_page = ProjectImportPageCase(self.driver)
 
-        # Perform login
-        self.logger.info("Logging in for client onboarding test")
-        self.login_page.open()
-        self.login_page.enter_email(Credentials.VALID_EMAIL)
-        self.login_page.enter_password(Credentials.VALID_PASSWORD)
-        self.login_page.click_login()
-        self.login_page.verify_login()
-        self.logger.info("Login successful")
-
     def tearDown(self):
-        self.driver.quit()
-        self.logger.info("Teardown complete: WebDriver closed")
+        self.logger.info("Teardown complete: browser kept for the next test in this class")
 
     def test_successful_login_and_client_onboarding(self):
         """Test client onboarding process"""
@@ -0,0 +1,101 @@
+import unittest
+import requests
+from config.credentials import Credentials
+from local_app.server import LocalApp
+from utilities.data_seeder import DataSeeder
+
+
+class FakeDriver:
+    """Just enough of a logged-in browser for DataSeeder.from_driver"""
+    def __init__(self, cookies):
+        self.cookies = cookies
+
+    def get_cookies(self):
+        return self.cookies
+
+    def execute_script(self, script, *args):
+        return "test-agent" if "userAgent" in script else None
+
+
+class TestDataSeeder(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = LocalApp(port=0).start()
+        cls.addClassCleanup(cls.app.stop)
+        login = requests.post(f"{cls.app.url}/api/login", timeout=5,
+                              json={"email": Credentials.VALID_EMAIL, "password": Credentials.VALID_PASSWORD})
+        login.raise_for_status()
+        cls.cookies = [{"name": "session", "value": login.cookies["session"], "domain": "127.0.0.1", "path": "/"}]
+
+    def setUp(self):
+        self.seeder = DataSeeder.from_driver(FakeDriver(self.cookies), base_url=f"{self.app.url}/api")
+        self.addCleanup(self.seeder.close)
+
+    def test_create_list_and_cleanup(self):
+        """Seeded clients and projects are listed by the API and all deleted by cleanup"""
+        clients = self.seeder.create_clients(3)
+        self.seeder.create_project(clients[0]["id"])
+        self.assertTrue({c["name"] for c in clients} <= set(self.seeder.list_names(DataSeeder.CLIENTS_PATH)))
+
+        self.assertEqual(self.seeder.cleanup(), 4)
+        self.assertEqual(self.app.store.list("clients"), [])
+        self.assertEqual(self.app.store.list("projects"), [])
+
+    def test_session_cookie_stays_on_its_host(self):
+        """The browser's session cookie is only sent to the host it belongs to"""
+        prepare = lambda url: self.seeder.session.prepare_request(requests.Request("GET", url))
+        self.assertIn("session=", prepare(f"{self.app.url}/api/clients").headers.get("Cookie", ""))
+        self.assertIsNone(prepare("http://example.com/api/clients").headers.get("Cookie"))
+
+
+class FakeResponse:
+    def __init__(self, url, body, next_link=None):
+        self.url = url
+        self.body = body
+        self.links = {"next": {"url": next_link}} if next_link else {}
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.body
+
+
+class TestListNames(unittest.TestCase):
+    def setUp(self):
+        self.seeder = DataSeeder(base_url="http://app.test/api")
+        self.addCleanup(self.seeder.close)
+        self.requests = []
+
+    def _serve(self, pages):
+        def get(url, params=None, timeout=None):
+            self.requests.append((url, params))
+            return pages[len(self.requests) - 1](url, params)
+        self.seeder.session.get = get
+
+    def test_follows_every_pagination_style(self):
+        """Link headers, next URLs, cursors and page numbers all lead to the rest of the list"""
+        self._serve([
+            lambda url, params: FakeResponse(url, [{"name": "a"}], next_link="/api/users?after=a"),
+            lambda url, params: FakeResponse(url, {"data": [{"name": "b"}], "next": "http://app.test/api/users?after=b"}),
+            lambda url, params: FakeResponse(url, {"items": [{"name": "c"}], "next_cursor": "c1"}),
+            lambda url, params: FakeResponse(url, {"data": [{"name": "d"}], "page": 1, "total_pages": 2}),
+            lambda url, params: FakeResponse(url, {"data": [{"name": "e"}], "page": 2, "total_pages": 2}),
+        ])
+        self.assertEqual(self.seeder.list_names(DataSeeder.USERS_PATH), ["a", "b", "c", "d", "e"])
+        self.assertEqual(self.requests, [
+            ("http://app.test/api/users", None),
+            ("http://app.test/api/users?after=a", None),
+            ("http://app.test/api/users?after=b", None),
+            ("http://app.test/api/users?after=b", {"cursor": "c1"}),
+            ("http://app.test/api/users?after=b", {"page": 2}),
+        ])
+
+    def test_stops_at_the_page_cap(self):
+        self._serve([lambda url, params: FakeResponse(url, {"data": [{"name": "x"}], "next_cursor": "more"})] * 3)
+        self.assertEqual(self.seeder.list_names(DataSeeder.USERS_PATH, max_pages=3), ["x", "x", "x"])
+        self.assertEqual(len(self.requests), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+from selenium.common.exceptions import SessionNotCreatedException
+from utilities.driver_setup import DriverPool, DriverSetup, _PooledDriver
+
+
+class FakeSetup:
+    def __init__(self, pool):
+        self.pool = pool
+        self.quit = False
+
+    def get_driver(self):
+        return object()
+
+    def quit_driver(self):
+        self.quit = True
+        with self.pool.lock:
+            self.pool.alive -= 1
+
+
+class SlowPool(DriverPool):
+    """A pool of fake browsers whose launch, health check and reset each take a little while"""
+    def __init__(self, size):
+        super().__init__(size=size, max_leases=100, max_age=3600)
+        self.lock = threading.Lock()
+        self.alive = 0
+        self.peak = 0
+        self.launched = []
+
+    def _launch(self):
+        with self.lock:
+            self.alive += 1
+            self.peak = max(self.peak, self.alive)
+        time.sleep(0.01)
+        entry = _PooledDriver(FakeSetup(self))
+        self.launched.append(entry)
+        return entry
+
+    def _is_healthy(self, driver):
+        time.sleep(0.01)
+        return True
+
+    def _reset(self, driver):
+        time.sleep(0.01)
+        return True
+
+
+class TestDriverPool(unittest.TestCase):
+    def test_concurrent_leases_never_exceed_size(self):
+        """Browsers being launched, health-checked or reset still count against the pool size"""
+        pool = SlowPool(size=2)
+
+        def lease_repeatedly():
+            for _ in range(5):
+                driver = pool.acquire(timeout=5)
+                time.sleep(0.005)
+                pool.release(driver)
+
+        threads = [threading.Thread(target=lease_repeatedly) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        pool.shutdown()
+
+        self.assertLessEqual(pool.peak, 2)
+        self.assertTrue(all(entry.driver_setup.quit for entry in pool.launched))
+
+    def test_browser_released_during_shutdown_is_quit(self):
+        pool = SlowPool(size=1)
+        driver = pool.acquire()
+        releasing = threading.Thread(target=pool.release, args=(driver,))
+        releasing.start()
+        time.sleep(0.002)  # Inside _reset
+        pool.shutdown()
+        releasing.join()
+        self.assertTrue(pool.launched[0].driver_setup.quit)
+
+
+
+class TestDriverSetup(unittest.TestCase):
+    def test_failed_launch_removes_the_profile_copy(self):
+        """A browser that cannot start leaves no copied user-data-dir behind"""
+        template = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, template, True)
+        copies = []
+        real_mkdtemp = tempfile.mkdtemp
+
+        def mkdtemp(**kwargs):
+            copies.append(real_mkdtemp(**kwargs))
+            return copies[-1]
+
+        with mock.patch("config.base_config.BaseConfig.USER_DATA_TEMPLATE", template), \
+                mock.patch("utilities.driver_setup.tempfile.mkdtemp", mkdtemp), \
+                mock.patch("utilities.driver_setup.get_driver_resolver"), \
+                mock.patch("utilities.driver_setup.Service"), \
+                mock.patch("utilities.driver_setup.webdriver.Chrome", side_effect=SessionNotCreatedException("no")):
+            with self.assertRaises(SessionNotCreatedException):
+                DriverSetup(browser="chrome", profile="fast")
+        self.assertEqual(len(copies), 1)
+        self.assertFalse(os.path.exists(copies[0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
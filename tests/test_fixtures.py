@@ -0,0 +1,110 @@
+import base64
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from utilities import seeded_random
+from utilities.fixtures import LoggedInTestCase
+
+
+class _FakeDriver:
+    def execute_script(self, script, *args):
+        return ["http://app.test/clients", "<html><body>clients</body></html>"]
+
+    def get_screenshot_as_base64(self):
+        return base64.b64encode(b"png").decode()
+
+    def get_log(self, kind):
+        return []
+
+
+class _FakeBrowser:
+    def __init__(self):
+        self.driver = _FakeDriver()
+
+    def reset(self):
+        return 0.0
+
+
+def _case(name):
+    """A LoggedInTestCase on a fake browser, so its cleanups run without Chrome. Built on demand so
+    neither unittest nor pytest collects its deliberately failing tests"""
+    class Case(LoggedInTestCase):
+        @classmethod
+        def setUpClass(cls):
+            cls.browser = _FakeBrowser()
+            cls.driver = cls.browser.driver
+
+        @classmethod
+        def tearDownClass(cls):
+            pass
+
+        def test_fails(self):
+            self.fail("boom")
+
+        def test_errors(self):
+            raise RuntimeError("boom")
+
+        def test_passes(self):
+            pass
+    return Case(name)
+
+
+class TestFailureArtifacts(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, True)
+        patcher = mock.patch("config.base_config.BaseConfig.SCREENSHOT_DIR", self.directory)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _run(self, name):
+        case = _case(name)
+        # The replay record goes where COGNISAAS_RNG_REPLAY=1 looks for it
+        record = seeded_random.record_path(case.id())
+        if os.path.exists(record):
+            os.remove(record)
+        self.addCleanup(lambda: os.path.exists(record) and os.remove(record))
+        self.record = record
+        result = unittest.TestResult()
+        unittest.TestSuite([case]).run(result)
+        return result
+
+    def _dumps(self):
+        directory = os.path.join(self.directory, "flight_recorder")
+        return os.listdir(directory) if os.path.isdir(directory) else []
+
+    def test_failing_test_dumps_the_flight_recorder(self):
+        """A failure reported to the runner is what the recorder's cleanup sees"""
+        result = self._run("test_fails")
+        self.assertEqual(len(result.failures), 1)
+        dumps = self._dumps()
+        self.assertEqual(len(dumps), 1)
+        self.assertTrue(os.path.exists(os.path.join(self.directory, "flight_recorder", dumps[0], "manifest.json")))
+
+    def test_erroring_test_dumps_the_flight_recorder(self):
+        result = self._run("test_errors")
+        self.assertEqual(len(result.errors), 1)
+        self.assertEqual(len(self._dumps()), 1)
+
+    def test_passing_test_writes_nothing(self):
+        result = self._run("test_passes")
+        self.assertTrue(result.wasSuccessful())
+        self.assertEqual(self._dumps(), [])
+        self.assertFalse(os.path.exists(self.record))
+
+    def test_failing_test_saves_its_rng_record_for_replay(self):
+        """The seed and draws of a failed test are saved, and a replay of it picks them up"""
+        self._run("test_fails")
+        self.assertTrue(os.path.exists(self.record))
+        with open(self.record) as f:
+            saved = json.load(f)
+        replayed = seeded_random.start_test(saved["test_id"], replay="1")
+        self.addCleanup(seeded_random.finish_test, failed=False)
+        self.assertEqual(replayed.seed_value, saved["seed"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,34 +1,33 @@
 import time
 import unittest
-from config.credentials import Credentials
+from config.base_config import BaseConfig
 from pages.login_page import LoginPage
 from pages.project_import_page import ProjectImportPageCase
-from utilities.driver_setup import DriverSetup
 from utilities.logger import setup_logger
+from utilities.fixtures import LoggedInTestCase
+from utilities.data_seeder import DataSeeder
 from selenium.webdriver.common.by import By
 
 
-class TestProjectImport(unittest.TestCase):
+class TestProjectImport(LoggedInTestCase):
     def setUp(self):
         self.logger = setup_logger(log_name="Project_import_test")
-        self.driver_setup = DriverSetup()
-        self.driver = self.driver_setup.get_driver()
-        
+        # Resets the shared logged-in browser and starts the per-test recorders (LoggedInTestCase)
+        super().setUp()
         self.login_page = LoginPage(self.driver)
         self.project_import_page = ProjectImportPageCase(self.driver)
-        
-        # Perform login
-        self.logger.info("Logging in for project import test")
-        self.login_page.open()
-        self.login_page.enter_email(Credentials.VALID_EMAIL)
-        self.login_page.enter_password(Credentials.VALID_PASSWORD)
-        self.login_page.click_login()
-        self.login_page.verify_login()
-        self.logger.info("Login successful")
+
+        # Seed the client this test imports into over the API, instead of depending on whatever exists
+        self.seeded_client = None
+        if BaseConfig.SEED_VIA_API:
+            self.seeder = DataSeeder.from_driver(self.driver)
+            self.addCleanup(self.seeder.close)
+            self.addCleanup(self.seeder.cleanup)
+            self.seeded_client = self.seeder.create_client()
+            self.logger.info(f"Seeded client: {self.seeded_client['name']}")
     
     def tearDown(self):
-        self.driver.quit()
-        self.logger.info("Teardown complete: WebDriver closed")
+        self.logger.info("Teardown complete: browser kept for the next test in this class")
     
     def test_import_project(self):
         """Testing import a project from project page"""
@@ -61,7 +60,9 @@ class TestProjectImport(unittest.TestCase):
         self.logger.info(f"Project Stage: {project_stage}")
 
         # Fill out project import details
-        project_client_name = self.project_import_page.select_client()
+        project_client_name = self.project_import_page.select_client(
+            self.seeded_client["name"] if self.seeded_client else None
+        )
         self.logger.info(f"Selected client: {project_client_name}")
         
         project_name = self.project_import_page.enter_random_project_name()
@@ -0,0 +1,40 @@
+import unittest
+from selenium.webdriver.common.by import By
+from utilities.locator_registry import LocatorRegistry, xpath_to_css, expensive_patterns
+
+
+class TestLocatorRegistry(unittest.TestCase):
+    def test_translates_id_and_attribute_xpaths(self):
+        """Id/attribute-only XPaths become equivalent CSS selectors"""
+        self.assertEqual(xpath_to_css("//div[@id='Clients']"), "div#Clients")
+        self.assertEqual(xpath_to_css("//div[@id='stage' and @role='button']"), "div#stage[role='button']")
+        self.assertEqual(xpath_to_css("//ul[@role='listbox']/li"), "ul[role='listbox'] > li")
+        self.assertEqual(xpath_to_css("//div[@class='css-axqrh9']/following-sibling::button"),
+                         "div[class='css-axqrh9'] ~ button")
+        self.assertEqual(xpath_to_css("//div[contains(@class, 'client-details')]"), "div[class*='client-details']")
+
+    def test_leaves_untranslatable_xpaths_alone(self):
+        """Text matches and positional XPaths have no exact CSS form"""
+        self.assertIsNone(xpath_to_css("//button[contains(text(), 'Login')]"))
+        self.assertIsNone(xpath_to_css("(//*[name()='path'])[59]"))
+        self.assertIsNone(xpath_to_css("/html/body/div"))
+
+    def test_flags_expensive_patterns(self):
+        """Positional, name() and wildcard XPaths are flagged; CSS and ids are not"""
+        self.assertEqual(len(expensive_patterns(By.XPATH, "(//*[name()='path'])[59]")), 3)
+        self.assertEqual(expensive_patterns(By.ID, "user_email"), [])
+        self.assertEqual(expensive_patterns(By.XPATH, "//div[@id='client']"), [])
+
+    def test_registry_serves_compiled_tuples(self):
+        """Registry entries are plain locator tuples that remember the authored form"""
+        registry = LocatorRegistry({"page": {"save": (By.XPATH, "//button[@label='Save']")}})
+        locator = registry.get("page", "save")
+        self.assertEqual(tuple(locator), (By.CSS_SELECTOR, "button[label='Save']"))
+        self.assertEqual(locator.original, (By.XPATH, "//button[@label='Save']"))
+
+        untranslated = LocatorRegistry({"page": {"save": (By.XPATH, "//button[@label='Save']")}}, translate=False)
+        self.assertEqual(tuple(untranslated.get("page", "save")), (By.XPATH, "//button[@label='Save']"))
+
+
+if __name__ == "__main__":
+    unittest.main()
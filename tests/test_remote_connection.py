@@ -0,0 +1,30 @@
+import unittest
+import urllib3
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from utilities.remote_connection import tune_connection
+
+
+class FakeDriver:
+    def __init__(self, executor):
+        self.command_executor = executor
+
+
+class TestRemoteConnection(unittest.TestCase):
+    def test_tunes_a_real_chromium_connection(self):
+        """The pool, address and per-request timeout are swapped on Selenium's own connection class"""
+        executor = ChromiumRemoteConnection("http://localhost:9515", vendor_prefix="goog", browser_name="chrome")
+        original = executor._conn
+
+        tune_connection(FakeDriver(executor), pool_size=3, connect_timeout=2, read_timeout=30)
+
+        self.assertIsNot(executor._conn, original)
+        self.assertEqual(executor._conn.connection_pool_kw["maxsize"], 3)
+        self.assertEqual(executor._client_config.remote_server_addr, "http://127.0.0.1:9515")
+        self.assertIsInstance(executor._client_config.timeout, urllib3.Timeout)
+        self.assertEqual(executor._client_config.timeout.connect_timeout, 2)
+        self.assertEqual(executor._client_config.timeout.read_timeout, 30)
+        self.assertTrue(executor._client_config.keep_alive)
+
+
+if __name__ == "__main__":
+    unittest.main()
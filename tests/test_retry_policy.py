@@ -0,0 +1,58 @@
+import unittest
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from utilities.retry_policy import RetryPolicy, RetryStats, STALE, TIMEOUT
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def setUp(self):
+        self.stats = RetryStats()
+        self.recovered = []
+        self.policy = RetryPolicy(driver=None, attempts=3, deadline=5, base_delay=0, max_delay=0,
+                                  recoveries={STALE: [lambda driver, error: self.recovered.append(error)]},
+                                  stats=self.stats)
+
+    def test_retries_transient_failures_and_runs_recoveries(self):
+        """A stale element is recovered from and counted"""
+        outcomes = [StaleElementReferenceException("stale"), "clicked"]
+
+        def action(timeout):
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        self.assertEqual(self.policy.run(action, name="save"), "clicked")
+        self.assertEqual(len(self.recovered), 1)
+        self.assertEqual(self.stats.summary()["save"]["recovered"], 1)
+        self.assertEqual(self.stats.summary()["save"]["kinds"], {STALE: 1})
+
+    def test_real_errors_are_not_retried(self):
+        """Errors outside the transient kinds surface on the first attempt"""
+        calls = []
+
+        def action(timeout):
+            calls.append(timeout)
+            raise ValueError("bad data")
+
+        with self.assertRaises(ValueError):
+            self.policy.run(action, name="fill")
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(self.stats.summary()["fill"]["failed"], 1)
+
+    def test_attempt_timeouts_are_capped_by_the_deadline(self):
+        """No attempt is given more time than the step has left"""
+        timeouts = []
+
+        def action(timeout):
+            timeouts.append(timeout)
+            raise TimeoutException("never clickable")
+
+        with self.assertRaises(TimeoutException):
+            self.policy.run(action, name="open", timeout=10)
+        self.assertEqual(len(timeouts), 3)
+        self.assertTrue(all(timeout <= 5 for timeout in timeouts))
+        self.assertEqual(self.stats.summary()["open"]["kinds"], {TIMEOUT: 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import base64
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from utilities.logger import set_log_context, clear_log_context
+from utilities.screenshot import ScreenshotPipeline, RING_BUFFER
+
+
+class _FakeDriver:
+    def get_screenshot_as_base64(self):
+        return base64.b64encode(b"png").decode()
+
+
+class TestRingBuffer(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, True)
+        patcher = mock.patch("config.base_config.BaseConfig.SCREENSHOT_DIR", self.directory)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(clear_log_context)
+        self.pipeline = ScreenshotPipeline(policy=RING_BUFFER, image_format="png", scale=1, ring_size=10)
+        self.driver = _FakeDriver()
+
+    def _written(self):
+        self.pipeline.flush(timeout=5)
+        return sorted(name.rsplit("_", 3)[0] for name in os.listdir(self.directory))
+
+    def test_failure_dumps_only_the_failing_tests_frames(self):
+        """Frames buffered by an earlier, passing test are not written with a later failure"""
+        set_log_context(test_id="test_a")
+        self.pipeline.start_test()
+        self.pipeline.capture(self.driver, "a_step")
+        set_log_context(test_id="test_b")
+        self.pipeline.start_test()
+        self.pipeline.capture(self.driver, "b_step")
+        self.pipeline.capture(self.driver, "b_error", failed=True)
+        self.assertEqual(self._written(), ["b_error", "b_step"])
+
+    def test_start_test_drops_frames_left_by_a_previous_run(self):
+        """A rerun of the same test starts with an empty buffer"""
+        set_log_context(test_id="test_a")
+        self.pipeline.capture(self.driver, "first_run")
+        self.pipeline.start_test()
+        self.pipeline.capture(self.driver, "a_error", failed=True)
+        self.assertEqual(self._written(), ["a_error"])
+
+
+if __name__ == "__main__":
+    unittest.main()
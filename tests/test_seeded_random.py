@@ -0,0 +1,44 @@
+import unittest
+from utilities.seeded_random import SeededRandom, derive_seed
+
+
+class TestSeededRandom(unittest.TestCase):
+    OPTIONS = [{"index": 0, "text": "Select"}, {"index": 1, "text": "Asha"}, {"index": 2, "text": "Ravi"}]
+
+    def test_same_seed_same_choices(self):
+        """A logged seed reproduces the whole draw sequence"""
+        first, second = SeededRandom(42), SeededRandom(42)
+        self.assertEqual([first.choice(self.OPTIONS), first.randint(1, 1000)],
+                         [second.choice(self.OPTIONS), second.randint(1, 1000)])
+        self.assertEqual(derive_seed("7", "test_a"), derive_seed("7", "test_a"))
+        self.assertNotEqual(derive_seed("7", "test_a"), derive_seed("7", "test_b"))
+
+    def test_replay_reproduces_recorded_choices(self):
+        """Recorded draws win over the seed, matched by option text even when indexes moved"""
+        recorded = [{"step": "x", "kind": "choice", "value": {"index": 0, "text": "Select"}},
+                    {"step": "y", "kind": "randint", "value": 777}]
+        reordered = [self.OPTIONS[1], self.OPTIONS[2], dict(self.OPTIONS[0], index=2)]
+        rng = SeededRandom(1, replay=recorded)
+        self.assertEqual(rng.choice(reordered), {"index": 2, "text": "Select"})
+        self.assertEqual(rng.randint(1, 1000), 777)
+        self.assertEqual([draw["kind"] for draw in rng.draws], ["choice", "randint"])
+
+    def test_replay_falls_back_when_the_option_is_gone(self):
+        """A recorded option that no longer exists is replaced by the seeded draw"""
+        rng = SeededRandom(1, replay=[{"step": "x", "kind": "choice", "value": {"text": "Gone"}}])
+        self.assertIn(rng.choice(self.OPTIONS), self.OPTIONS)
+
+
+    def test_rewind_gives_the_next_draw_the_undone_position(self):
+        """Undoing a draw leaves the same sequence as never having made it"""
+        rewound, straight = SeededRandom(5), SeededRandom(5)
+        checkpoint = rewound.checkpoint()
+        rewound.choice(["stale", "cached", "options"])
+        rewound.rewind(checkpoint)
+        self.assertEqual([rewound.choice(self.OPTIONS), rewound.randint(1, 1000)],
+                         [straight.choice(self.OPTIONS), straight.randint(1, 1000)])
+        self.assertEqual(rewound.draws, straight.draws)
+
+
+if __name__ == "__main__":
+    unittest.main()
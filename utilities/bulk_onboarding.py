@@ -0,0 +1,292 @@
+# utilities/bulk_onboarding.py
+import argparse
+import csv
+import json
+import os
+import queue
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from config.base_config import BaseConfig
+from config.credentials import Credentials
+from config.environments import Environments
+from utilities.logger import setup_logger, set_log_context, clear_log_context
+
+logger = setup_logger("bulk_onboarding")
+
+# Record columns understood by the flow; anything left empty is chosen at random on the form.
+# Client "stage" and project "project_stage" share a field name on their forms, hence the prefix.
+CLIENT_COLUMNS = ("client_name", "segment", "industry", "stage", "sales_owner", "cs_owner", "implementation_manager")
+PROJECT_COLUMNS = ("template", "project_name", "delivery_manager", "priority", "category", "project_stage",
+                   "teammate", "implementation_fee", "arr", "description")
+
+
+def load_records(path):
+    """Read records from a .csv (header row) or .jsonl file; each gets a stable record_id for checkpointing"""
+    records = []
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.endswith(".jsonl"):
+            rows = (json.loads(line) for line in f if line.strip())
+        else:
+            rows = csv.DictReader(f)
+        for index, row in enumerate(rows):
+            row = {key: value for key, value in row.items() if value not in (None, "")}
+            row.setdefault("record_id", f"{os.path.basename(path)}:{row.get('id', index)}")
+            records.append(row)
+    return records
+
+
+def generate_records(count, seed=0):
+    """Reproducible records: the same seed always yields the same names and amounts. Names carry the
+    seed and record index, so no two records of a run (or of runs with different seeds) collide"""
+    rng = random.Random(seed)
+    records = []
+    for index in range(count):
+        records.append({
+            "record_id": f"seed{seed}:{index}",
+            "client_name": f"Client_{BaseConfig.DATA_TAG}s{seed}_{index}",
+            "project_name": f"Project_{BaseConfig.DATA_TAG}s{seed}_{index}",
+            "implementation_fee": str(rng.randint(1000, 100000)),
+            "arr": str(rng.randint(5000, 200000)),
+        })
+    return records
+
+
+class Checkpoint:
+    """Append-only JSONL log of record progress. A resumed run skips every record that succeeded, and
+    for records whose client was saved before the project failed, only the project is onboarded again"""
+    def __init__(self, path=BaseConfig.BULK_CHECKPOINT):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def completed(self):
+        return {entry["record_id"] for entry in self._entries() if entry.get("status") == "ok"}
+
+    def created_clients(self):
+        """{record_id: client name} for every record whose client was saved"""
+        return {entry["record_id"]: entry["client"] for entry in self._entries()
+                if entry.get("status") == "client_saved"}
+
+    def _entries(self):
+        try:
+            with open(self.path) as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue  # A run killed mid-write leaves at most one partial line
+        except FileNotFoundError:
+            return
+
+    def mark(self, record_id, status, **details):
+        line = json.dumps({"record_id": record_id, "status": status, "at": time.time(), **details})
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "a") as f:
+                f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+
+class _Throughput:
+    """Thread-safe counters with a records/min figure logged every `every` records"""
+    def __init__(self, total, every):
+        self.total = total
+        self.every = every
+        self.succeeded = 0
+        self.failed = 0
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def record(self, ok):
+        with self._lock:
+            if ok:
+                self.succeeded += 1
+            else:
+                self.failed += 1
+            finished = self.succeeded + self.failed
+            if finished % self.every == 0 or finished == self.total:
+                logger.info(f"Bulk progress: {finished}/{self.total} ({self.failed} failed), "
+                            f"{self.per_minute():.1f} records/min")
+
+    def per_minute(self):
+        elapsed = time.monotonic() - self.started
+        return (self.succeeded + self.failed) / elapsed * 60 if elapsed else 0.0
+
+
+class BulkOnboarder:
+    """Streams records through the ClientOnboardingPage -> ProjectImportPageCase flow, with one
+    logged-in browser per worker thread that is reused for every record the worker takes"""
+    def __init__(self, workers=BaseConfig.BULK_WORKERS, checkpoint=None, environment=Environments.DEFAULT_ENV):
+        self.workers = workers
+        self.checkpoint = checkpoint or Checkpoint()
+        self.environment = environment
+
+    def run(self, records):
+        """Onboard every record not already in the checkpoint; returns a summary dict"""
+        from local_app.server import ensure_local_app
+        from utilities.driver_setup import DriverPool
+
+        done = self.checkpoint.completed()
+        pending = [record for record in records if record["record_id"] not in done]
+        logger.info(f"Bulk onboarding {len(pending)} record(s) with {self.workers} worker(s); "
+                    f"{len(records) - len(pending)} already done")
+        stats = _Throughput(len(pending), BaseConfig.BULK_PROGRESS_EVERY)
+        if not pending:
+            return self._summary(stats, len(records), skipped=len(records))
+        clients = self.checkpoint.created_clients()
+
+        ensure_local_app()
+        work = queue.SimpleQueue()
+        for record in pending:
+            work.put(record)
+        workers = min(self.workers, len(pending))
+        pool = DriverPool(size=workers)
+        try:
+            pool.warm_up()
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bulk") as executor:
+                for future in [executor.submit(self._worker, pool, work, stats, clients) for _ in range(workers)]:
+                    future.result()
+        finally:
+            pool.shutdown()
+
+        # Left over only when workers stopped early, e.g. none of them could log in
+        not_run = 0
+        while True:
+            try:
+                record = work.get_nowait()
+            except queue.Empty:
+                break
+            self.checkpoint.mark(record["record_id"], "not_run")
+            not_run += 1
+        if not_run:
+            logger.error(f"{not_run} record(s) were not run: no worker was left to take them")
+        return self._summary(stats, len(records), skipped=len(records) - len(pending), not_run=not_run)
+
+    def _worker(self, pool, work, stats, clients):
+        from utilities.session_cache import get_session_cache
+
+        driver = pool.acquire()
+        try:
+            try:
+                get_session_cache().login(driver, Credentials.VALID_EMAIL, Credentials.VALID_PASSWORD, self.environment)
+            except Exception as e:
+                # Leave this worker's share in the queue for the workers that did log in
+                logger.error(f"Bulk worker could not log in, stopping it: {e}")
+                return
+            while True:
+                try:
+                    record = work.get_nowait()
+                except queue.Empty:
+                    return
+                stats.record(self._onboard(driver, record, clients.get(record["record_id"])))
+        finally:
+            pool.release(driver)
+
+    def _onboard(self, driver, record, saved_client=None):
+        """Run one record through the flow; with `saved_client` (a resumed record whose client was
+        saved by an earlier run) the client step is skipped and the project is created for it"""
+        from pages.client_onboarding_page import ClientOnboardingPage
+        from pages.project_import_page import ProjectImportPageCase
+        from utilities.profiler import get_profiler
+        from utilities.screenshot import capture_screenshot, get_screenshot_pipeline
+
+        record_id = record["record_id"]
+        set_log_context(test_id=f"bulk:{record_id}")
+        get_screenshot_pipeline().start_test()
+        started = time.monotonic()
+        try:
+            client_page = ClientOnboardingPage(driver)
+            project_page = ProjectImportPageCase(driver)
+
+            project_values = {column: record[column] for column in PROJECT_COLUMNS if column in record}
+            if "project_stage" in project_values:
+                project_values["stage"] = project_values.pop("project_stage")
+
+            if saved_client:
+                logger.info(f"Client {saved_client} was saved by an earlier run, onboarding its project only")
+                client = {"client_name": saved_client}
+                project_page.navigate_to_projects_page()
+                project_page.click_new_project()
+                project = project_page.fill_project_form(client=saved_client, **project_values)
+            else:
+                client_page.navigate_to_clients()
+                client_page.click_new_client()
+                client_page.verify_onboarding_header()
+                client = client_page.fill_client_form(
+                    name=record.get("client_name"),
+                    **{column: record[column] for column in CLIENT_COLUMNS[1:] if column in record}
+                )
+                client_page.click_save()
+                client_page.verify_client_created()
+                # From here on a retry must not create the client a second time
+                self.checkpoint.mark(record_id, "client_saved", client=client["client_name"])
+                client_page.click_skip_button()
+
+                project_page.clientOnboardingToastInvisibility()
+                project = project_page.fill_project_form(include_client=False, **project_values)
+            project_page.click_project_save()
+
+            duration = round(time.monotonic() - started, 2)
+            self.checkpoint.mark(record_id, "ok", client=client["client_name"], project=project["project_name"],
+                                 duration=duration)
+            logger.info(f"Onboarded {client['client_name']} with {project['project_name']} in {duration}s")
+            return True
+        except Exception as e:
+            logger.error(f"Record {record_id} failed: {e}")
+            capture_screenshot(driver, f"bulk_{record_id.replace(':', '_')}_error")
+            self.checkpoint.mark(record_id, "failed", error=str(e)[:500], duration=round(time.monotonic() - started, 2))
+            # Start the next record from a clean page rather than a half-filled form
+            try:
+                driver.get(self.environment)
+            except Exception:
+                pass
+            return False
+        finally:
+            get_profiler().finish_test()
+            clear_log_context()
+
+    def _summary(self, stats, total, skipped, not_run=0):
+        elapsed = time.monotonic() - stats.started
+        return {
+            "records": total,
+            "skipped": skipped,
+            "succeeded": stats.succeeded,
+            "failed": stats.failed,
+            "not_run": not_run,
+            "workers": self.workers,
+            "elapsed_s": round(elapsed, 1),
+            "records_per_min": round(stats.per_minute(), 2),
+            "checkpoint": self.checkpoint.path,
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Onboard many clients and projects through the UI flow")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--input", help="CSV (with header) or JSONL file of records")
+    source.add_argument("--generate", type=int, metavar="N", help="Generate N records from --seed")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=BaseConfig.BULK_WORKERS)
+    parser.add_argument("--checkpoint", default=BaseConfig.BULK_CHECKPOINT)
+    parser.add_argument("--fresh", action="store_true", help="Ignore and replace an existing checkpoint")
+    parser.add_argument("--report", default=os.path.join("reports", "bulk_onboarding.json"))
+    args = parser.parse_args(argv)
+
+    if args.fresh and os.path.exists(args.checkpoint):
+        os.remove(args.checkpoint)
+    records = load_records(args.input) if args.input else generate_records(args.generate, args.seed)
+    summary = BulkOnboarder(workers=args.workers, checkpoint=Checkpoint(args.checkpoint)).run(records)
+
+    os.makedirs(os.path.dirname(args.report) or ".", exist_ok=True)
+    with open(args.report, "w") as f:
+        json.dump(summary, f, indent=2)
+    print(json.dumps(summary, indent=2))
+    return 0 if summary["failed"] == 0 and summary["not_run"] == 0 else 1
+
+
+# Example usage: python -m utilities.bulk_onboarding --generate 500 --seed 7 --workers 4
+if __name__ == "__main__":
+    sys.exit(main())
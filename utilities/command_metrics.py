@@ -0,0 +1,214 @@
+# utilities/command_metrics.py
+import atexit
+import bisect
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from config.base_config import BaseConfig
+from utilities.logger import setup_logger, get_log_context
+
+logger = setup_logger("command_metrics")
+
+# Latency histogram bucket bounds, in seconds (Prometheus "le" labels)
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Frames from these modules are plumbing, never the "caller" of a command
+_PLUMBING = ("selenium", "urllib3", "http.", "utilities.command_metrics", "utilities.profiler", "threading")
+
+
+def _caller():
+    """Outermost page-object method on the stack (the step that caused the command); without one,
+    the nearest non-Selenium frame"""
+    frame = sys._getframe(2)
+    page_frame = fallback = None
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        # Decorators such as screenshot_decorator show up as "wrapper"; the method they wrap is the step
+        if module.startswith("pages.") and frame.f_code.co_name != "wrapper":
+            page_frame = frame
+        elif fallback is None and not module.startswith(_PLUMBING):
+            fallback = frame
+        frame = frame.f_back
+    frame = page_frame or fallback
+    if frame is None:
+        return "unknown"
+    owner = frame.f_locals.get("self")
+    prefix = type(owner).__name__ if owner is not None else frame.f_globals.get("__name__", "")
+    return f"{prefix}.{frame.f_code.co_name}"
+
+
+class _Series:
+    """Count, total and max latency plus histogram buckets for one (caller, command) pair"""
+    __slots__ = ("count", "total", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(BUCKETS) + 1)
+
+    def observe(self, elapsed):
+        self.count += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+        self.buckets[bisect.bisect_left(BUCKETS, elapsed)] += 1
+
+
+class CommandMetrics:
+    """Counts every WebDriver wire command by type and records its latency, attributed to the calling
+    page-object method, both per test and cumulatively for the Prometheus dump"""
+    def __init__(self):
+        self._totals = {}
+        self._tests = {}
+        self._listeners = []
+        self._lock = threading.Lock()
+        self._server = None
+
+    def instrument(self, driver):
+        """Wrap the driver's command executor; every WebElement call goes through it too. Idempotent"""
+        executor = driver.command_executor
+        if getattr(executor, "_command_metrics", None) is self:
+            return driver
+        original = executor.execute
+        metrics = self
+
+        def execute(command, params):
+            start = time.perf_counter()
+            try:
+                return original(command, params)
+            finally:
+                metrics.observe(command, time.perf_counter() - start)
+
+        executor.execute = execute
+        executor._command_metrics = self
+        return driver
+
+    def add_listener(self, listener):
+        """Call `listener(command, elapsed)` on the issuing thread after every command"""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def observe(self, command, elapsed, caller=None):
+        caller = caller or _caller()
+        test_id = get_log_context().get("test_id")
+        with self._lock:
+            self._totals.setdefault((caller, command), _Series()).observe(elapsed)
+            if test_id:
+                self._tests.setdefault(test_id, {}).setdefault((caller, command), _Series()).observe(elapsed)
+        for listener in self._listeners:
+            listener(command, elapsed)
+
+    def summary(self, test_id):
+        """Commands issued by `test_id`: totals by command and a per-caller breakdown"""
+        with self._lock:
+            series = dict(self._tests.get(test_id, {}))
+        by_command, by_caller = {}, {}
+        for (caller, command), s in series.items():
+            entry = by_command.setdefault(command, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            entry["count"] += s.count
+            entry["total_ms"] += s.total * 1000
+            entry["max_ms"] = max(entry["max_ms"], s.max * 1000)
+            by_caller.setdefault(caller, {})[command] = s.count
+        for entry in by_command.values():
+            entry["mean_ms"] = round(entry["total_ms"] / entry["count"], 2)
+            entry["total_ms"] = round(entry["total_ms"], 1)
+            entry["max_ms"] = round(entry["max_ms"], 1)
+        return {
+            "test_id": test_id,
+            "commands": sum(s.count for s in series.values()),
+            "wire_ms": round(sum(s.total for s in series.values()) * 1000, 1),
+            "by_command": dict(sorted(by_command.items(), key=lambda item: -item[1]["count"])),
+            "by_caller": dict(sorted(by_caller.items(), key=lambda item: -sum(item[1].values()))),
+        }
+
+    def finish_test(self, test_id, path=BaseConfig.COMMAND_METRICS_FILE):
+        """Log and append the test's summary, then drop its per-test series. Meant for TestCase.addCleanup"""
+        summary = self.summary(test_id)
+        with self._lock:
+            self._tests.pop(test_id, None)
+        if not summary["commands"]:
+            return summary
+        busiest = ", ".join(f"{caller}={sum(counts.values())}" for caller, counts in list(summary["by_caller"].items())[:3])
+        logger.info(f"{summary['commands']} WebDriver commands, {summary['wire_ms']} ms on the wire; busiest: {busiest}")
+        if path:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "a") as f:
+                f.write(json.dumps(summary) + "\n")
+        return summary
+
+    def render_prometheus(self):
+        """Cumulative counters and latency histograms in the Prometheus text exposition format"""
+        with self._lock:
+            series = sorted(self._totals.items())
+        lines = [
+            "# HELP webdriver_commands_total WebDriver commands issued, by command and calling page method.",
+            "# TYPE webdriver_commands_total counter",
+        ]
+        for (caller, command), s in series:
+            lines.append(f'webdriver_commands_total{{command="{command}",caller="{caller}"}} {s.count}')
+        lines += [
+            "# HELP webdriver_command_duration_seconds WebDriver command round-trip latency.",
+            "# TYPE webdriver_command_duration_seconds histogram",
+        ]
+        for (caller, command), s in series:
+            labels = f'command="{command}",caller="{caller}"'
+            cumulative = 0
+            for bound, count in zip(BUCKETS + ("+Inf",), s.buckets):
+                cumulative += count
+                lines.append(f'webdriver_command_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"webdriver_command_duration_seconds_sum{{{labels}}} {s.total:.6f}")
+            lines.append(f"webdriver_command_duration_seconds_count{{{labels}}} {s.count}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        """Write the text dump atomically (suitable for a node-exporter textfile collector)"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(self.render_prometheus())
+        os.replace(tmp_path, path)
+
+    def serve(self, port, host="127.0.0.1"):
+        """Expose /metrics live on a background thread"""
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = metrics.render_prometheus().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=self._server.serve_forever, name="command-metrics", daemon=True).start()
+        logger.info(f"WebDriver command metrics served at http://{host}:{port}/metrics")
+
+
+_shared_metrics = None
+_shared_metrics_lock = threading.Lock()
+
+def get_command_metrics():
+    """Return the process-wide command metrics, starting the configured live endpoint and dump"""
+    global _shared_metrics
+    with _shared_metrics_lock:
+        if _shared_metrics is None:
+            _shared_metrics = CommandMetrics()
+            if BaseConfig.METRICS_PORT:
+                try:
+                    _shared_metrics.serve(BaseConfig.METRICS_PORT)
+                except OSError as e:
+                    logger.warning(f"Could not serve command metrics on port {BaseConfig.METRICS_PORT}: {e}")
+            if BaseConfig.METRICS_TEXTFILE:
+                atexit.register(_shared_metrics.write_prometheus, BaseConfig.METRICS_TEXTFILE)
+        return _shared_metrics
@@ -0,0 +1,157 @@
+# utilities/data_seeder.py
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from config.base_config import BaseConfig
+from config.environments import Environments
+from utilities.logger import setup_logger
+from utilities.seeded_random import get_test_rng
+
+logger = setup_logger("data_seeder")
+
+
+class DataSeeder:
+    """Creates clients and projects over HTTP with the browser's session, and deletes them in bulk afterwards"""
+    CLIENTS_PATH = "/clients"
+    PROJECTS_PATH = "/projects"
+    USERS_PATH = "/users"
+    BATCH_DELETE_PATH = "/batch-delete"  # Appended to the collection path; per-id DELETE is used if missing
+
+    def __init__(self, base_url=None, environment=Environments.DEFAULT_ENV,
+                 pool_size=BaseConfig.API_POOL_SIZE, timeout=BaseConfig.API_TIMEOUT):
+        self.base_url = (base_url or BaseConfig.API_BASE_URL or f"{environment}/api").rstrip("/")
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.session = requests.Session()
+        # Only connection failures are retried: a POST that reached the server may already have created data
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size,
+                              max_retries=Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.1))
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Accept": "application/json"})
+        self._created = {self.CLIENTS_PATH: [], self.PROJECTS_PATH: []}
+        self._created_lock = threading.Lock()
+
+    @classmethod
+    def from_driver(cls, driver, base_url=None, environment=Environments.DEFAULT_ENV, **kwargs):
+        """Build a seeder that authenticates with the cookies (and optional token) of a logged-in browser"""
+        seeder = cls(base_url=base_url, environment=environment, **kwargs)
+        # Scoped like the browser's own cookies, so the session is never sent to another host
+        for cookie in driver.get_cookies():
+            seeder.session.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain", ""),
+                                       path=cookie.get("path", "/"))
+        seeder.session.headers["User-Agent"] = driver.execute_script("return navigator.userAgent;")
+        if BaseConfig.API_TOKEN_STORAGE_KEY:
+            token = driver.execute_script("return window.localStorage.getItem(arguments[0]);",
+                                          BaseConfig.API_TOKEN_STORAGE_KEY)
+            if token:
+                seeder.session.headers["Authorization"] = f"Bearer {token}"
+        return seeder
+
+    def create_client(self, name=None, **fields):
+        """Create a client and return the API's record for it (always including `id` and `name`)"""
+        return self._create(self.CLIENTS_PATH, {"name": name or self._generate_name("Client"), **fields})
+
+    def create_project(self, client_id, name=None, **fields):
+        """Create a project under `client_id` and return the API's record for it"""
+        payload = {"name": name or self._generate_name("Project"), "client_id": client_id, **fields}
+        return self._create(self.PROJECTS_PATH, payload)
+
+    def create_clients(self, count, **fields):
+        """Create `count` clients concurrently over the pooled connections"""
+        with ThreadPoolExecutor(max_workers=min(count, self.pool_size) or 1) as executor:
+            return list(executor.map(lambda _: self.create_client(**fields), range(count)))
+
+    def list_names(self, path, max_pages=BaseConfig.API_LIST_MAX_PAGES):
+        """Names of every record the API lists under `path`, e.g. the full list behind a dropdown. Pages
+        are followed through a `Link: rel="next"` header, or a `next` URL, `next_cursor` or
+        `page`/`total_pages` in the envelope, up to `max_pages` pages"""
+        url, params, names = self.base_url + path, None, []
+        for _ in range(max_pages):
+            response = self.session.get(url, params=params, timeout=self.timeout)
+            response.raise_for_status()
+            body = response.json()
+            # Accept a bare list and the common {"data": [...]} / {"items": [...]} envelopes
+            records = body.get("data", body.get("items", [])) if isinstance(body, dict) else body
+            names.extend(record["name"] for record in records if record.get("name"))
+
+            envelope = body if isinstance(body, dict) else {}
+            next_url = response.links.get("next", {}).get("url") or envelope.get("next")
+            if next_url:
+                url, params = urljoin(response.url, next_url), None
+            elif envelope.get("next_cursor"):
+                params = {"cursor": envelope["next_cursor"]}
+            elif records and envelope.get("page") and envelope.get("total_pages", 0) > envelope["page"]:
+                params = {"page": envelope["page"] + 1}
+            else:
+                return names
+        logger.warning(f"Listed {len(names)} {path.strip('/')} from the first {max_pages} pages only; "
+                       f"sampling from those")
+        return names
+
+    def cleanup(self):
+        """Delete everything this seeder created, projects before the clients they belong to.
+        Meant for TestCase.addCleanup, so failures are logged rather than raised"""
+        deleted = 0
+        for path in (self.PROJECTS_PATH, self.CLIENTS_PATH):
+            with self._created_lock:
+                ids, self._created[path] = self._created[path], []
+            if ids:
+                deleted += self._delete_many(path, ids)
+        return deleted
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.cleanup()
+        self.close()
+
+    def _create(self, path, payload):
+        response = self.session.post(self.base_url + path, json=payload, timeout=self.timeout)
+        response.raise_for_status()
+        body = response.json()
+        # Accept both a bare record and the common {"data": {...}} envelope
+        record = body.get("data", body) if isinstance(body, dict) else {}
+        if "id" not in record:
+            raise ValueError(f"Unexpected response from POST {path}: {body}")
+        record.setdefault("name", payload["name"])
+        with self._created_lock:
+            self._created[path].append(record["id"])
+        logger.info(f"Seeded {path.strip('/')[:-1]} {record['name']} (id={record['id']})")
+        return record
+
+    def _delete_many(self, path, ids):
+        try:
+            response = self.session.post(self.base_url + path + self.BATCH_DELETE_PATH,
+                                         json={"ids": ids}, timeout=self.timeout)
+            if response.status_code not in (404, 405):
+                response.raise_for_status()
+                logger.info(f"Batch-deleted {len(ids)} {path.strip('/')}")
+                return len(ids)
+        except requests.RequestException as e:
+            logger.warning(f"Batch delete of {path.strip('/')} failed, deleting one by one: {e}")
+
+        def delete(record_id):
+            try:
+                self.session.delete(f"{self.base_url}{path}/{record_id}", timeout=self.timeout).raise_for_status()
+                return True
+            except requests.RequestException as e:
+                logger.error(f"Failed to delete {path.strip('/')[:-1]} {record_id}: {e}")
+                return False
+
+        with ThreadPoolExecutor(max_workers=min(len(ids), self.pool_size)) as executor:
+            deleted = sum(executor.map(delete, ids))
+        logger.info(f"Deleted {deleted}/{len(ids)} {path.strip('/')}")
+        return deleted
+
+    @staticmethod
+    def _generate_name(prefix):
+        # Drawn from the test's seeded RNG, so seeded names are reproduced along with the test's choices
+        return f"{prefix}_{BaseConfig.DATA_TAG}{get_test_rng().randint(100, 999999)}"
@@ -0,0 +1,150 @@
+# utilities/driver_resolver.py
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from config.base_config import BaseConfig
+from utilities.logger import setup_logger
+
+logger = setup_logger("driver_resolver")
+
+# Where Chrome usually lives when it is not on PATH
+_CHROME_CANDIDATES = [
+    "google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+]
+
+
+class _FileLock:
+    """Cross-process lock based on O_EXCL file creation; a lock older than `stale_after` is broken"""
+    def __init__(self, path, timeout=120, stale_after=300):
+        self.path = path
+        self.timeout = timeout
+        self.stale_after = stale_after
+
+    def __enter__(self):
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, str(os.getpid()).encode())
+                os.close(fd)
+                return self
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(self.path) > self.stale_after:
+                        logger.warning(f"Breaking stale driver lock {self.path}")
+                        os.remove(self.path)
+                        continue
+                except FileNotFoundError:
+                    continue
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"Timed out waiting for driver lock {self.path}")
+                time.sleep(0.1)
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class DriverResolver:
+    """Resolves the chromedriver binary once per machine per Chrome major version and remembers the
+    path in a manifest, so later runs and parallel workers never reach webdriver-manager's version check"""
+    def __init__(self, cache_dir=BaseConfig.DRIVER_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.manifest_path = os.path.join(cache_dir, "manifest.json")
+        self._resolved = {}
+        self._lock = threading.Lock()
+
+    def resolve(self):
+        """Return the chromedriver path, downloading it at most once per Chrome version"""
+        if BaseConfig.CHROMEDRIVER_PATH:
+            return BaseConfig.CHROMEDRIVER_PATH
+        with self._lock:
+            if self._resolved:
+                return self._resolved["path"]
+            version = self.chrome_version()
+
+            path = self._lookup(self._read_manifest(), version)
+            if path is None:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                # Only one process per machine runs webdriver-manager; the others wait and read its result
+                with _FileLock(self.manifest_path + ".lock"):
+                    manifest = self._read_manifest()
+                    path = self._lookup(manifest, version)
+                    if path is None:
+                        path = self._install()
+                        manifest[version or "unknown"] = {"path": path, "resolved_at": time.time()}
+                        self._write_manifest(manifest)
+                        logger.info(f"Resolved chromedriver for Chrome {version or 'unknown'}: {path}")
+            # Chrome is not upgraded mid-run, so the path holds for the rest of the process
+            self._resolved = {"version": version, "path": path}
+            return path
+
+    def chrome_version(self):
+        """Installed Chrome major version (e.g. "126"), found without any network access; None if unknown"""
+        output = ""
+        if sys.platform.startswith("win"):
+            try:
+                output = subprocess.run(
+                    ["reg", "query", r"HKCU\Software\Google\Chrome\BLBeacon", "/v", "version"],
+                    capture_output=True, text=True, timeout=5
+                ).stdout
+            except (OSError, subprocess.SubprocessError):
+                pass
+        else:
+            for candidate in [BaseConfig.CHROME_BINARY] + _CHROME_CANDIDATES:
+                binary = candidate and (shutil.which(candidate) or (os.path.exists(candidate) and candidate))
+                if not binary:
+                    continue
+                try:
+                    output = subprocess.run([binary, "--version"], capture_output=True, text=True, timeout=5).stdout
+                    break
+                except (OSError, subprocess.SubprocessError):
+                    continue
+        match = re.search(r"(\d+)\.\d+\.\d+", output)
+        return match.group(1) if match else None
+
+    def _lookup(self, manifest, version):
+        entry = manifest.get(version or "unknown")
+        if entry is None and version is None and manifest:
+            # Chrome version unknown (e.g. unusual install): reuse the most recently resolved driver
+            entry = max(manifest.values(), key=lambda e: e.get("resolved_at", 0))
+        if entry and os.path.exists(entry["path"]):
+            return entry["path"]
+        return None
+
+    def _install(self):
+        from webdriver_manager.chrome import ChromeDriverManager
+        return ChromeDriverManager().install()
+
+    def _read_manifest(self):
+        try:
+            with open(self.manifest_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_manifest(self, manifest):
+        """Write atomically so readers outside the lock never see a partial file"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+
+_shared_resolver = None
+
+def get_driver_resolver():
+    """Return the process-wide driver resolver"""
+    global _shared_resolver
+    if _shared_resolver is None:
+        _shared_resolver = DriverResolver()
+    return _shared_resolver
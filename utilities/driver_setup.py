@@ -1,29 +1,323 @@
 # utilities/driver_setup.py
+import atexit
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from config.base_config import BaseConfig
+from utilities.command_metrics import get_command_metrics
+from utilities.driver_resolver import get_driver_resolver
+from utilities.logger import setup_logger
+from utilities.network_monitor import PERFORMANCE_LOGGING, PERF_LOGGING_PREFS, attach_network_monitor, get_network_monitor
+from utilities.remote_connection import tune_connection
+from utilities.waits import install_network_hooks
+
+logger = setup_logger("driver_setup")
+
+# Chrome switches that drop work the functional tests never look at
+_FAST_ARGUMENTS = [
+    "--headless=new",
+    "--disable-extensions",
+    "--disable-gpu",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--disable-component-update",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--mute-audio",
+]
+
 
 class DriverSetup:
-    def __init__(self, browser=BaseConfig.BROWSER, headless=BaseConfig.HEADLESS):
+    def __init__(self, browser=BaseConfig.BROWSER, headless=BaseConfig.HEADLESS, profile=BaseConfig.BROWSER_PROFILE):
+        if profile not in ("default", "fast"):
+            raise ValueError(f"Unsupported browser profile: {profile}")
+        self.profile = profile
+        self.user_data_dir = None
+        self.driver = None
+        try:
+            self._launch(browser, headless, profile)
+        except Exception:
+            # A browser that failed to start (or to be set up) must not leak its process or profile copy
+            try:
+                self.quit_driver()
+            except Exception as e:
+                logger.warning(f"Could not clean up after a failed browser launch: {e}")
+            raise
+
+    def _launch(self, browser, headless, profile):
         if browser == "chrome":
-            options = webdriver.ChromeOptions()
-            if headless:
+            options = self._fast_chrome_options() if profile == "fast" else webdriver.ChromeOptions()
+            if headless and profile != "fast":
                 options.add_argument("--headless")
+            # Lets the flight recorder read the browser console, and the network monitor the DevTools events
+            logging_prefs = {"browser": "ALL"}
+            if BaseConfig.NETWORK_MONITOR:
+                logging_prefs.update(PERFORMANCE_LOGGING)
+                options.add_experimental_option("perfLoggingPrefs", PERF_LOGGING_PREFS)
+            options.set_capability("goog:loggingPrefs", logging_prefs)
             self.driver = webdriver.Chrome(
-                service=Service(ChromeDriverManager().install()),
+                service=Service(get_driver_resolver().resolve()),
                 options=options
             )
+            if profile == "fast":
+                self._block_urls(BaseConfig.BLOCKED_URLS)
+            install_network_hooks(self.driver)
+            if BaseConfig.NETWORK_MONITOR:
+                attach_network_monitor(self.driver)
         # Add support for other browsers if needed (e.g., Firefox)
         elif browser == "firefox":
             self.driver = webdriver.Firefox()
         else:
             raise ValueError(f"Unsupported browser: {browser}")
-        self.driver.maximize_window()
+        if BaseConfig.TUNE_REMOTE_CONNECTION:
+            tune_connection(self.driver)
+        if BaseConfig.COMMAND_METRICS:
+            get_command_metrics().instrument(self.driver)
+        if profile == "fast":
+            self.driver.set_window_size(*BaseConfig.WINDOW_SIZE)
+        else:
+            self.driver.maximize_window()
+
+    def _fast_chrome_options(self):
+        options = webdriver.ChromeOptions()
+        for argument in _FAST_ARGUMENTS:
+            options.add_argument(argument)
+        options.add_argument("--window-size={},{}".format(*BaseConfig.WINDOW_SIZE))
+        # Images are also blocked by content setting so they are never decoded, cached or not
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        if BaseConfig.USER_DATA_TEMPLATE:
+            # Chrome locks its user-data-dir, so every browser gets a private copy of the template
+            self.user_data_dir = tempfile.mkdtemp(prefix="cognisaas-profile-")
+            shutil.copytree(BaseConfig.USER_DATA_TEMPLATE, self.user_data_dir, dirs_exist_ok=True,
+                            ignore=shutil.ignore_patterns("Singleton*", "*.lock", "lockfile"))
+            options.add_argument(f"--user-data-dir={self.user_data_dir}")
+        return options
+
+    def _block_urls(self, patterns):
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+        except Exception as e:
+            logger.warning(f"Could not install URL blocklist: {e}")
 
     def get_driver(self):
         return self.driver
 
     def quit_driver(self):
-        if self.driver:
-            self.driver.quit()
\ No newline at end of file
+        try:
+            if self.driver:
+                self.driver.quit()
+        finally:
+            if self.user_data_dir:
+                shutil.rmtree(self.user_data_dir, ignore_errors=True)
+                self.user_data_dir = None
+
+
+class _PooledDriver:
+    """Book-keeping for one browser owned by the DriverPool"""
+    def __init__(self, driver_setup):
+        self.driver_setup = driver_setup
+        self.driver = driver_setup.get_driver()
+        self.created_at = time.monotonic()
+        self.lease_count = 0
+
+
+class DriverPool:
+    """Keeps warm browsers around and leases them to tests instead of launching one per test"""
+    def __init__(self, size=BaseConfig.DRIVER_POOL_SIZE, browser=BaseConfig.BROWSER,
+                 headless=BaseConfig.HEADLESS, max_leases=BaseConfig.DRIVER_POOL_MAX_LEASES,
+                 max_age=BaseConfig.DRIVER_POOL_MAX_AGE, profile=BaseConfig.BROWSER_PROFILE):
+        self.size = size
+        self.browser = browser
+        self.headless = headless
+        self.profile = profile
+        self.max_leases = max_leases
+        self.max_age = max_age
+        self._idle = []
+        self._leased = {}
+        # Browsers out of both lists but still owned by the pool: being health-checked, reset, or just launched
+        self._checked_out = {}
+        self._launching = 0
+        self._condition = threading.Condition()
+        self._closed = False
+
+    def _launch(self):
+        return _PooledDriver(DriverSetup(browser=self.browser, headless=self.headless, profile=self.profile))
+
+    def _in_use(self):
+        """Browsers counted against `size` besides the idle ones; call with the condition held"""
+        return len(self._leased) + len(self._checked_out) + self._launching
+
+    def warm_up(self):
+        """Launch browsers in parallel until the pool holds `size` of them"""
+        with self._condition:
+            missing = self.size - len(self._idle) - self._in_use()
+            if missing <= 0:
+                return
+            self._launching += missing
+        with ThreadPoolExecutor(max_workers=missing) as executor:
+            futures = [executor.submit(self._launch) for _ in range(missing)]
+        launched, errors = [], []
+        for future in futures:
+            try:
+                launched.append(future.result())
+            except Exception as e:
+                errors.append(e)
+        with self._condition:
+            self._launching -= missing
+            closed = self._closed
+            if not closed:
+                self._idle.extend(launched)
+            self._condition.notify_all()
+        if closed:
+            for entry in launched:
+                self._discard(entry)
+        if errors:
+            raise errors[0]
+        logger.info(f"Driver pool warmed up with {len(launched)} browser(s)")
+
+    def acquire(self, timeout=BaseConfig.DRIVER_POOL_ACQUIRE_TIMEOUT):
+        """Lease a healthy browser, launching a new one if the pool has spare capacity"""
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._condition:
+                if self._closed:
+                    raise RuntimeError("Driver pool has been shut down")
+                entry = self._idle.pop() if self._idle else None
+                if entry is None:
+                    if self._in_use() >= self.size:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise TimeoutError(f"No browser became available within {timeout}s")
+                        self._condition.wait(remaining)
+                        continue
+                    # Reserve the slot so concurrent callers don't overshoot the pool size
+                    self._launching += 1
+                else:
+                    self._checked_out[id(entry)] = entry
+
+            if entry is None:
+                try:
+                    entry = self._launch()
+                except Exception:
+                    with self._condition:
+                        self._launching -= 1
+                        self._condition.notify()
+                    raise
+                with self._condition:
+                    self._launching -= 1
+                    self._checked_out[id(entry)] = entry
+            elif self._is_expired(entry) or not self._is_healthy(entry.driver):
+                self._retire(entry)
+                continue
+
+            with self._condition:
+                del self._checked_out[id(entry)]
+                if not self._closed:
+                    entry.lease_count += 1
+                    self._leased[id(entry.driver)] = entry
+                    return entry.driver
+            # Shut down while this browser was being launched or checked
+            self._discard(entry)
+            raise RuntimeError("Driver pool has been shut down")
+
+    def release(self, driver):
+        """Return a leased browser to the pool after resetting it to a clean state"""
+        with self._condition:
+            entry = self._leased.pop(id(driver), None)
+            if entry is None:
+                raise ValueError("Driver was not leased from this pool")
+            self._checked_out[id(entry)] = entry
+
+        if not self._closed and not self._is_expired(entry) and self._reset(entry.driver):
+            with self._condition:
+                if not self._closed:
+                    del self._checked_out[id(entry)]
+                    self._idle.append(entry)
+                    self._condition.notify()
+                    return
+        self._retire(entry)
+
+    def shutdown(self):
+        """Quit every browser owned by the pool; browsers checked out at this moment are quit by the
+        thread holding them as soon as it sees the pool is closed"""
+        with self._condition:
+            self._closed = True
+            entries = self._idle + list(self._leased.values())
+            self._idle = []
+            self._leased = {}
+            self._condition.notify_all()
+        for entry in entries:
+            self._discard(entry)
+
+    def _retire(self, entry):
+        """Quit a checked-out browser, then free its slot"""
+        self._discard(entry)
+        with self._condition:
+            self._checked_out.pop(id(entry), None)
+            self._condition.notify()
+
+    def _is_expired(self, entry):
+        age = time.monotonic() - entry.created_at
+        return entry.lease_count >= self.max_leases or age >= self.max_age
+
+    def _is_healthy(self, driver):
+        """Check the browser still answers commands and has an open window"""
+        try:
+            return bool(driver.window_handles) and driver.execute_script("return 1;") == 1
+        except Exception:
+            return False
+
+    def _reset(self, driver):
+        """Close extra tabs, clear cookies and storage, and park the browser on about:blank"""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            driver.execute_script("""
+                try { window.localStorage.clear(); } catch (e) {}
+                try { window.sessionStorage.clear(); } catch (e) {}
+            """)
+            try:
+                # Clears cookies for every domain, not just the current one
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            except Exception:
+                driver.delete_all_cookies()
+
+            driver.get("about:blank")
+            monitor = get_network_monitor(driver)
+            if monitor is not None:
+                # The next test must not see this one's responses
+                monitor.reset()
+            return self._is_healthy(driver)
+        except Exception as e:
+            logger.error(f"Failed to reset pooled browser, discarding it: {e}")
+            return False
+
+    def _discard(self, entry):
+        try:
+            entry.driver_setup.quit_driver()
+        except Exception as e:
+            logger.error(f"Error quitting pooled browser: {e}")
+
+
+_shared_pool = None
+_shared_pool_lock = threading.Lock()
+
+def get_driver_pool():
+    """Return the process-wide driver pool, creating and warming it on first use"""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = DriverPool()
+            _shared_pool.warm_up()
+            atexit.register(_shared_pool.shutdown)
+        return _shared_pool
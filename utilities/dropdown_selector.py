@@ -0,0 +1,287 @@
+# utilities/dropdown_selector.py
+import random
+import re
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from config.base_config import BaseConfig
+from utilities.logger import setup_logger
+from utilities.option_cache import get_option_cache
+from utilities.seeded_random import SeededRandom
+
+logger = setup_logger("dropdown_selector")
+
+# Choice strategies
+RANDOM = "random"
+SEEDED = "seeded"
+FIRST = "first"
+BY_VALUE = "by_value"
+
+# Waits for the open listbox to render, then returns every option's text, data-value and enabled
+# state in one round-trip instead of one `.text` / `get_attribute` call per option.
+_READ_OPTIONS_SCRIPT = """
+var selector = arguments[0], timeoutMs = arguments[1];
+var done = arguments[arguments.length - 1];
+var start = Date.now();
+var read = function () {
+    var nodes = document.querySelectorAll(selector);
+    if (!nodes.length || nodes[0].getClientRects().length === 0) return null;
+    return Array.prototype.map.call(nodes, function (li, i) {
+        return {
+            index: i,
+            text: (li.innerText || li.textContent || '').replace(/\\s+/g, ' ').trim(),
+            value: li.getAttribute('data-value'),
+            enabled: li.getAttribute('aria-disabled') !== 'true' && !li.classList.contains('Mui-disabled')
+        };
+    });
+};
+var loop = function () {
+    var options = read();
+    if (options) return done(options);
+    if (Date.now() - start >= timeoutMs) return done(null);
+    setTimeout(loop, 25);
+};
+loop();
+"""
+
+# Waits for the listbox to render, then clicks the chosen option (re-checking it is still the same option
+# after any re-render) and, if an anchor is given, waits for the anchor to show the committed value.
+# Lazy or virtualized lists only render a window of their options: while the option is not rendered the
+# list's scroll container is paged down a viewport at a time, so any entry is reached in one round-trip.
+# At the end of the list, a server-backed list gets `growMs` (longer while it shows a loading indicator) to
+# append its next page. Returns what the anchor shows; clicked is false once the list is at its end, has
+# stopped growing and still lacks the option.
+_COMMIT_SCRIPT = """
+var selector = arguments[0], index = arguments[1], text = arguments[2], anchor = arguments[3];
+var timeoutMs = arguments[4], growMs = arguments[5];
+var done = arguments[arguments.length - 1];
+var norm = function (s) { return (s || '').replace(/\\s+/g, ' ').trim(); };
+var start = Date.now(), lastCount = -1, lastGrowth = Date.now();
+var scroller = function (node) {
+    for (var el = node && node.parentElement; el; el = el.parentElement) {
+        if (/(auto|scroll)/.test(window.getComputedStyle(el).overflowY) && el.scrollHeight > el.clientHeight) return el;
+    }
+    return null;
+};
+var findOption = function () {
+    var nodes = document.querySelectorAll(selector);
+    if (!nodes.length || nodes[0].getClientRects().length === 0) return undefined;
+    var option = nodes[index];
+    if (!option || norm(option.innerText || option.textContent) !== text) {
+        option = Array.prototype.find.call(nodes, function (li) { return norm(li.innerText || li.textContent) === text; });
+    }
+    return option || null;
+};
+var readAnchor = function () {
+    return norm((anchor.tagName === 'INPUT' || anchor.tagName === 'TEXTAREA') ? anchor.value : (anchor.innerText || anchor.textContent));
+};
+var waitCommitted = function () {
+    var current = readAnchor();
+    if (current === text) {
+        return done({clicked: true, committed: current});
+    }
+    if (Date.now() - start >= timeoutMs) return done({clicked: true, committed: current});
+    window.requestAnimationFrame(waitCommitted);
+};
+var waitRendered = function () {
+    var option = findOption();
+    if (option === undefined) {
+        if (Date.now() - start >= timeoutMs) return done({clicked: false, committed: null});
+        return setTimeout(waitRendered, 25);
+    }
+    if (option === null) {
+        var nodes = document.querySelectorAll(selector), box = scroller(nodes[0]);
+        var atEnd = !box || box.scrollTop + box.clientHeight >= box.scrollHeight - 1;
+        var loading = document.querySelector('.MuiAutocomplete-loading, [role="progressbar"]');
+        if (nodes.length !== lastCount || loading) lastGrowth = Date.now();
+        lastCount = nodes.length;
+        if ((atEnd && Date.now() - lastGrowth >= growMs) || Date.now() - start >= timeoutMs) {
+            return done({clicked: false, committed: null});
+        }
+        if (!atEnd) {
+            box.scrollTop += box.clientHeight;
+            return window.requestAnimationFrame(waitRendered);
+        }
+        return setTimeout(waitRendered, 50);
+    }
+    option.scrollIntoView({block: 'center'});
+    option.click();
+    if (!anchor) return done({clicked: true, committed: null});
+    start = Date.now();
+    waitCommitted();
+};
+waitRendered();
+"""
+
+
+def _normalize(text):
+    return re.sub(r"\s+", " ", text or "").strip()
+
+
+class DropdownSelector:
+    """Opens an MUI dropdown and selects an option with a fixed, small number of WebDriver calls"""
+    LISTBOX_OPTIONS = "ul[role='listbox'] > li"
+    MENU_OPTIONS = "li[role='option']"
+
+    def __init__(self, driver, timeout=BaseConfig.DEFAULT_TIMEOUT, rng=random):
+        self.driver = driver
+        self.timeout = timeout
+        self.rng = rng
+
+    def open(self, locator, scroll=False):
+        """Click the dropdown anchor; returns the anchor element for later verification"""
+        anchor = WebDriverWait(self.driver, self.timeout).until(
+            EC.element_to_be_clickable(locator)
+        )
+        if scroll:
+            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", anchor)
+        try:
+            anchor.click()
+        except WebDriverException:
+            self.driver.execute_script("arguments[0].click();", anchor)
+        return anchor
+
+    def read_options(self, option_selector=LISTBOX_OPTIONS):
+        """Return [{index, text, value, enabled}] for every rendered option in a single call"""
+        options = self.driver.execute_async_script(_READ_OPTIONS_SCRIPT, option_selector, int(self.timeout * 1000))
+        if options is None:
+            raise TimeoutException(f"No options rendered for '{option_selector}' within {self.timeout}s")
+        return options
+
+    def choose(self, options, predicate=None, strategy=RANDOM, value=None, seed=None):
+        """Pick one option from `options`, or None if nothing passes the filter"""
+        candidates = [
+            option for option in options
+            if option["enabled"] and option["text"] and (predicate is None or predicate(option))
+        ]
+        if not candidates:
+            return None
+        if strategy == FIRST:
+            return candidates[0]
+        if strategy == SEEDED:
+            return random.Random(seed).choice(candidates)
+        if strategy == BY_VALUE:
+            wanted = _normalize(str(value))
+            for option in candidates:
+                if option["value"] == value or option["text"] == wanted:
+                    return option
+            return None
+        if strategy == RANDOM:
+            return self.rng.choice(candidates)
+        raise ValueError(f"Unknown choice strategy: {strategy}")
+
+    def commit(self, option, anchor=None, option_selector=LISTBOX_OPTIONS):
+        """Click `option` and return the value the anchor shows afterwards (None without an anchor)"""
+        result = self._commit(option, anchor, option_selector)
+        if not result["clicked"]:
+            raise WebDriverException(f"Option '{option['text']}' disappeared before it could be clicked")
+        return result["committed"]
+
+    def select_from_open(self, anchor, predicate=None, strategy=RANDOM, value=None, seed=None,
+                         option_selector=LISTBOX_OPTIONS, verify=True, label="option", cache_key=None):
+        """Choose and commit an option from a dropdown the caller has already opened. With `cache_key`,
+        the option list is taken from the option cache when fresh, skipping the read round-trip"""
+        if cache_key and BaseConfig.OPTION_CACHE:
+            option = self._select_cached(anchor, cache_key, predicate, strategy, value, seed, option_selector,
+                                         verify, label)
+            if option is not None:
+                return option
+
+        options = self.read_options(option_selector)
+        logger.info(f"Found {len(options)} {label} options")
+        if cache_key and BaseConfig.OPTION_CACHE:
+            get_option_cache().put(cache_key, options)
+
+        option = self.choose(options, predicate=predicate, strategy=strategy, value=value, seed=seed)
+        if option is None:
+            logger.warning(f"No valid {label} options available to select.")
+            return None
+
+        committed = self.commit(option, anchor if verify else None, option_selector)
+        self._log_selected(option, committed, verify, label)
+        return option
+
+    def select(self, locator, predicate=None, strategy=RANDOM, value=None, seed=None,
+               option_selector=LISTBOX_OPTIONS, scroll=False, verify=True, label="option", cache_key=None):
+        """Open the dropdown at `locator`, then choose and commit an option; returns the option dict"""
+        anchor = self.open(locator, scroll=scroll)
+        return self.select_from_open(anchor, predicate=predicate, strategy=strategy, value=value, seed=seed,
+                                     option_selector=option_selector, verify=verify, label=label,
+                                     cache_key=cache_key)
+
+    def select_large(self, locator, names=None, value=None, typeahead=False, predicate=None,
+                     option_selector=LISTBOX_OPTIONS, scroll=False, verify=True, label="option"):
+        """Select one entry of a list too long to read option by option: `value`, or a uniform pick from
+        `names` (the full list, e.g. from the API). The entry is reached by typing a prefix into the
+        type-to-filter input (`typeahead`) or by paging the listbox in the browser, so the number of
+        WebDriver calls does not grow with the list. Without a target, falls back to select()"""
+        if value is None and not names:
+            return self.select(locator, predicate=predicate, option_selector=option_selector, scroll=scroll,
+                               verify=verify, label=label)
+        if value is not None:
+            option = {"index": -1, "text": _normalize(str(value)), "value": None, "enabled": True}
+        else:
+            option = self.choose([{"index": -1, "text": _normalize(name), "value": None, "enabled": True}
+                                  for name in names], predicate=predicate)
+            if option is None:
+                logger.warning(f"No valid {label} options available to select.")
+                return None
+            logger.info(f"Picked {label} from {len(names)} listed entries")
+
+        anchor = self.open(locator, scroll=scroll)
+        typed = option["text"][:BaseConfig.TYPEAHEAD_PREFIX] if typeahead else ""
+        if typed:
+            anchor.send_keys(typed)
+        result = self._commit(option, anchor if verify else None, option_selector)
+        if not result["clicked"]:
+            if typed:
+                # Erase the typed prefix with real keystrokes (the autocomplete only refilters on trusted
+                # input), so the list offers everything again
+                anchor.send_keys(Keys.BACKSPACE * len(typed))
+            if value is None:
+                # The listed entry is not offered here (archived, filtered out): pick what the page offers
+                logger.warning(f"{label} '{option['text']}' is not in the dropdown, choosing from its options")
+                return self.select_from_open(anchor, predicate=predicate, option_selector=option_selector,
+                                             verify=verify, label=label)
+            logger.warning(f"{label} '{option['text']}' is not in the list")
+            if typeahead:
+                anchor.send_keys(Keys.ESCAPE)
+            return None
+        self._log_selected(option, result["committed"], verify, label)
+        return option
+
+    def _select_cached(self, anchor, cache_key, predicate, strategy, value, seed, option_selector, verify, label):
+        """Pick from the cached vocabulary and click it directly; None (with the entry dropped) on a miss"""
+        cache = get_option_cache()
+        options = cache.get(cache_key)
+        if options is None:
+            return None
+        # A miss is followed by a draw from the rendered options; it must take this draw's place, or a
+        # replay with a warm cache would shift every later draw
+        checkpoint = self.rng.checkpoint() if isinstance(self.rng, SeededRandom) else None
+        option = self.choose(options, predicate=predicate, strategy=strategy, value=value, seed=seed)
+        if option is not None:
+            result = self._commit(option, anchor if verify else None, option_selector)
+            if result["clicked"]:
+                logger.info(f"Picked {label} from {len(options)} cached options")
+                self._log_selected(option, result["committed"], verify, label)
+                return option
+        logger.info(f"Cached {label} options no longer match the page, reading them again")
+        cache.invalidate(cache_key)
+        if checkpoint is not None:
+            self.rng.rewind(checkpoint)
+        return None
+
+    def _commit(self, option, anchor, option_selector):
+        return self.driver.execute_async_script(
+            _COMMIT_SCRIPT, option_selector, option["index"], option["text"], anchor, int(self.timeout * 1000),
+            int(BaseConfig.LIST_GROWTH_GRACE * 1000)
+        )
+
+    def _log_selected(self, option, committed, verify, label):
+        logger.info(f"Selected {label}: {option['text']}")
+        # Exact match: a typed prefix or a previous value that is a substring of the target is not a commit.
+        # Chip inputs never show the value, so their callers pass verify=False
+        if verify and _normalize(committed) != _normalize(option["text"]):
+            logger.warning(f"Could not verify {label} selection. Expected: {option['text']}, Got: {committed}")
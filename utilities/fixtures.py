@@ -0,0 +1,260 @@
+# utilities/fixtures.py
+import atexit
+import threading
+import time
+import unittest
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from config.base_config import BaseConfig
+from config.credentials import Credentials
+from config.environments import Environments
+from utilities import seeded_random
+from utilities.logger import setup_logger, set_log_context, clear_log_context
+from utilities.screenshot import get_screenshot_pipeline
+
+logger = setup_logger("fixtures")
+
+SCOPES = ("class", "module", "session")
+
+# Drops whatever the previous test left open in one round-trip: the unsaved-changes prompt, MUI
+# dialogs/menus/popovers and their backdrops, extra windows' focus traps, and form drafts kept in
+# web storage (matched by key). Auth keys are left alone so the session survives.
+_RESET_SCRIPT = """
+var draftPattern = new RegExp(arguments[0], 'i');
+window.onbeforeunload = null;
+if (document.activeElement && document.activeElement.blur) document.activeElement.blur();
+var layers = document.querySelectorAll('.MuiDialog-root, .MuiPopover-root, .MuiModal-root, .MuiBackdrop-root, [role="presentation"]');
+for (var i = layers.length - 1; i >= 0; i--) layers[i].remove();
+var dropped = [];
+[window.localStorage, window.sessionStorage].forEach(function (store) {
+    try {
+        for (var j = store.length - 1; j >= 0; j--) {
+            var key = store.key(j);
+            if (draftPattern.test(key)) { store.removeItem(key); dropped.push(key); }
+        }
+    } catch (e) {}
+});
+return dropped;
+"""
+
+# What a clean page looks like after the reset
+_CLEAN_SCRIPT = """
+return document.querySelectorAll('.MuiDialog-root, .MuiPopover-root, .MuiBackdrop-root').length === 0
+    && document.readyState === 'complete';
+"""
+
+
+class LoggedInBrowser:
+    """A pooled browser logged in once, reset to the post-login landing page before every test"""
+    def __init__(self, scope, environment=Environments.DEFAULT_ENV, email=Credentials.VALID_EMAIL,
+                 password=Credentials.VALID_PASSWORD):
+        if scope not in SCOPES:
+            raise ValueError(f"Unsupported fixture scope: {scope}")
+        self.scope = scope
+        self.environment = environment
+        self.email = email
+        self.password = password
+        self.driver = None
+        self.home_url = None
+        self.resets = []
+
+    def start(self):
+        from local_app.server import ensure_local_app
+        from utilities.driver_setup import get_driver_pool
+        from utilities.session_cache import get_session_cache
+
+        ensure_local_app()
+        self.driver = get_driver_pool().acquire()
+        try:
+            get_session_cache().login(self.driver, self.email, self.password, self.environment)
+        except Exception:
+            self.stop()
+            raise
+        # Wherever login lands is the known route every reset returns to
+        self.home_url = self.driver.current_url
+        logger.info(f"{self.scope}-scoped browser logged in as {self.email}, home {self.home_url}")
+        return self
+
+    def reset(self):
+        """Close dialogs and drafts, return to the landing page and check it is clean; logs in again
+        only if the previous test ended the session. Returns the time taken in seconds"""
+        from utilities.session_cache import get_session_cache
+
+        start = time.perf_counter()
+        driver = self.driver
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        dropped = driver.execute_script(_RESET_SCRIPT, BaseConfig.FIXTURE_DRAFT_KEYS)
+        driver.get(self.home_url)
+        if not self._is_clean():
+            logger.warning("Session lost between tests, restoring it")
+            get_session_cache().login(driver, self.email, self.password, self.environment)
+            driver.get(self.home_url)
+            if not self._is_clean():
+                raise AssertionError(f"Browser could not be reset to {self.home_url}")
+
+        elapsed = time.perf_counter() - start
+        self.resets.append(elapsed)
+        detail = f", dropped drafts {', '.join(dropped)}" if dropped else ""
+        logger.info(f"Reset {self.scope}-scoped browser in {elapsed * 1000:.0f} ms{detail}")
+        if elapsed > BaseConfig.FIXTURE_RESET_BUDGET:
+            logger.warning(f"Browser reset took {elapsed:.2f}s, over the {BaseConfig.FIXTURE_RESET_BUDGET}s budget")
+        return elapsed
+
+    def stop(self):
+        from utilities.driver_setup import get_driver_pool
+
+        if self.driver is not None:
+            # The pool's own reset clears cookies and storage before the next lease
+            get_driver_pool().release(self.driver)
+            self.driver = None
+        if self.resets:
+            logger.info(f"{self.scope}-scoped browser served {len(self.resets)} test(s), "
+                        f"mean reset {sum(self.resets) / len(self.resets) * 1000:.0f} ms")
+
+    def _is_clean(self):
+        from utilities.locator_registry import get_locator_registry
+
+        try:
+            WebDriverWait(self.driver, BaseConfig.SESSION_VERIFY_TIMEOUT).until(
+                EC.presence_of_element_located(get_locator_registry().get("login", "profile_button"))
+            )
+        except TimeoutException:
+            return False
+        return bool(self.driver.execute_script(_CLEAN_SCRIPT))
+
+
+_browsers = {}
+_browsers_lock = threading.Lock()
+_release_registered = False
+
+def logged_in_browser(scope="session", key=None):
+    """Shared logged-in browser for (`scope`, `key`), started on first use. Class and module browsers
+    are keyed by the class or module name; there is one session browser per process"""
+    global _release_registered
+    key = None if scope == "session" else key
+    with _browsers_lock:
+        browser = _browsers.get((scope, key))
+        if browser is None:
+            browser = _browsers[(scope, key)] = LoggedInBrowser(scope).start()
+            if not _release_registered:
+                # atexit runs last-in first-out: registered after the pool's shutdown hook, this runs before it
+                atexit.register(_release_all)
+                _release_registered = True
+        return browser
+
+
+def release_browser(scope, key=None):
+    with _browsers_lock:
+        browser = _browsers.pop((scope, None if scope == "session" else key), None)
+    if browser is not None:
+        browser.stop()
+
+
+def _release_all():
+    for scope, key in list(_browsers):
+        release_browser(scope, key)
+
+
+class _OutcomeResult:
+    """Forwards to the runner's TestResult and notes whether the test failed. Cleanups cannot read
+    this from the test case: unittest runs each cleanup as a fresh part of the test, marked successful"""
+    _FAILURES = ("addError", "addFailure", "addUnexpectedSuccess", "addSubTest")
+
+    def __init__(self, result):
+        self._result = result
+        self.failed = False
+
+    def __getattr__(self, name):
+        attr = getattr(self._result, name)
+        if name not in self._FAILURES:
+            return attr
+
+        def report(*args):
+            # addSubTest is also called for passing subtests, with no error
+            if name != "addSubTest" or args[-1] is not None:
+                self.failed = True
+            return attr(*args)
+        return report
+
+
+class LoggedInTestCase(unittest.TestCase):
+    """unittest base for tests that start from the logged-in landing page.
+
+    The browser is shared per `browser_scope` ("class", "module" or "session") and reset before each
+    test; each test also gets a flight recorder, a step profile and command metrics. Module-scoped
+    browsers are released at exit, or earlier from the module's tearDownModule:
+        def tearDownModule(): release_browser("module", __name__)
+    """
+    browser_scope = BaseConfig.FIXTURE_SCOPE
+
+    def run(self, result=None):
+        if result is None:
+            # As TestCase.run does for a default result
+            result = self.defaultTestResult()
+            result.startTestRun()
+            try:
+                return self.run(result)
+            finally:
+                result.stopTestRun()
+        self._outcome_result = _OutcomeResult(result)
+        super().run(self._outcome_result)
+        return result
+
+    @property
+    def test_failed(self):
+        """Whether the test has failed so far; what the flight recorder and RNG cleanups go by"""
+        outcome_result = getattr(self, "_outcome_result", None)
+        if outcome_result is not None and outcome_result.failed:
+            return True
+        # Before Python 3.11, unittest only reports errors to the result after the cleanups have run
+        errors = getattr(getattr(self, "_outcome", None), "errors", ())
+        return any(exc_info is not None for _, exc_info in errors)
+
+    @classmethod
+    def _browser_key(cls):
+        return {"class": f"{cls.__module__}.{cls.__qualname__}", "module": cls.__module__}.get(cls.browser_scope)
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.browser = logged_in_browser(cls.browser_scope, cls._browser_key())
+        cls.driver = cls.browser.driver
+
+    @classmethod
+    def tearDownClass(cls):
+        if cls.browser_scope == "class":
+            release_browser("class", cls._browser_key())
+        super().tearDownClass()
+
+    def setUp(self):
+        # Every log record from this test carries its id and elapsed time
+        set_log_context(test_id=self.id())
+        self.addCleanup(clear_log_context)
+        # A failure dumps only the ring-buffered screenshots this test took
+        get_screenshot_pipeline().start_test(self.id())
+        # Seeds the RNG pages pick up; a failing test's choices are saved for COGNISAAS_RNG_REPLAY
+        seeded_random.start_test(self.id())
+        self.addCleanup(seeded_random.finish_test, self)
+        self.browser.reset()
+        self._start_recorders()
+
+    def _start_recorders(self):
+        from utilities.command_metrics import get_command_metrics
+        from utilities.flight_recorder import FlightRecorder
+        from utilities.profiler import get_profiler
+
+        # Cleanups run last-in first-out, so the recorder dumps while the browser is still leased
+        self.recorder = FlightRecorder(self.driver, self.id())
+        self.addCleanup(self.recorder.finish, self)
+        # No-op unless BaseConfig.PROFILE_STEPS is enabled
+        self.profiler = get_profiler()
+        self.profiler.start_test(self.id(), self.driver)
+        self.addCleanup(self.profiler.finish_test, self.id())
+        # Logs this test's WebDriver command counts and wire latency by calling page method
+        self.addCleanup(get_command_metrics().finish_test, self.id())
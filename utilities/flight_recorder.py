@@ -0,0 +1,136 @@
+# utilities/flight_recorder.py
+import base64
+import json
+import os
+import re
+import threading
+from collections import deque
+from datetime import datetime
+from config.base_config import BaseConfig
+from utilities.logger import setup_logger
+
+logger = setup_logger("flight_recorder")
+
+# URL and trimmed DOM in one round-trip
+_PAGE_STATE_SCRIPT = """
+var html = document.documentElement ? document.documentElement.outerHTML : '';
+return [window.location.href, html.length > arguments[0] ? html.slice(0, arguments[0]) : html];
+"""
+
+
+class _Snapshot:
+    def __init__(self, step, taken_at, url, dom, screenshot, console):
+        self.step = step
+        self.taken_at = taken_at
+        self.url = url
+        self.dom = dom
+        self.screenshot = screenshot
+        self.console = console
+        self.size = len(dom or "") + len(screenshot or "") + sum(len(entry.get("message", "")) for entry in console)
+
+
+class FlightRecorder:
+    """Keeps the last N step snapshots of a test in memory and writes them out only if the test fails"""
+    _active = {}
+    _active_lock = threading.Lock()
+
+    def __init__(self, driver, test_name, max_steps=BaseConfig.FLIGHT_RECORDER_STEPS,
+                 max_bytes=BaseConfig.FLIGHT_RECORDER_MAX_BYTES, dom_chars=BaseConfig.FLIGHT_RECORDER_DOM_CHARS):
+        self.driver = driver
+        self.test_name = test_name
+        self.max_bytes = max_bytes
+        self.dom_chars = dom_chars
+        self._snapshots = deque(maxlen=max_steps)
+        self._bytes = 0
+        with FlightRecorder._active_lock:
+            FlightRecorder._active[id(driver)] = self
+
+    @classmethod
+    def active_for(cls, driver):
+        """Return the recorder attached to `driver`, or None"""
+        with cls._active_lock:
+            return cls._active.get(id(driver))
+
+    def record(self, step, screenshot=True):
+        """Snapshot screenshot, URL, trimmed DOM and new console entries for `step`"""
+        try:
+            url, dom = self.driver.execute_script(_PAGE_STATE_SCRIPT, self.dom_chars)
+            payload = self.driver.get_screenshot_as_base64() if screenshot else None
+        except Exception as e:
+            logger.warning(f"Flight recorder could not snapshot step {step}: {e}")
+            return
+        snapshot = _Snapshot(step, datetime.now(), url, dom, payload, self._drain_console())
+
+        if len(self._snapshots) == self._snapshots.maxlen:
+            self._bytes -= self._snapshots[0].size
+        self._snapshots.append(snapshot)
+        self._bytes += snapshot.size
+        # Enforce the memory cap by evicting the oldest steps, but always keep the newest one
+        while self._bytes > self.max_bytes and len(self._snapshots) > 1:
+            self._bytes -= self._snapshots.popleft().size
+
+    def finish(self, test_case=None, failed=None):
+        """Detach the recorder; dump to disk if the test failed. Meant for addCleanup on a LoggedInTestCase,
+        whose test_failed carries the outcome (a cleanup cannot see it on a plain TestCase)"""
+        if failed is None:
+            failed = bool(getattr(test_case, "test_failed", False))
+        try:
+            if failed:
+                self.record("failure_state")
+                return self.dump()
+            return None
+        finally:
+            self._snapshots.clear()
+            self._bytes = 0
+            with FlightRecorder._active_lock:
+                if FlightRecorder._active.get(id(self.driver)) is self:
+                    del FlightRecorder._active[id(self.driver)]
+
+    def dump(self):
+        """Write every buffered snapshot plus a manifest; returns the output directory"""
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]+", "_", self.test_name)
+        out_dir = os.path.join(BaseConfig.SCREENSHOT_DIR, "flight_recorder",
+                               f"{safe_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+        os.makedirs(out_dir, exist_ok=True)
+
+        manifest = []
+        for i, snapshot in enumerate(self._snapshots):
+            prefix = f"{i:02d}_{re.sub(r'[^A-Za-z0-9_]+', '_', snapshot.step)}"
+            entry = {
+                "step": snapshot.step,
+                "taken_at": snapshot.taken_at.isoformat(),
+                "url": snapshot.url,
+                "console": snapshot.console,
+            }
+            if snapshot.screenshot:
+                entry["screenshot"] = f"{prefix}.png"
+                with open(os.path.join(out_dir, entry["screenshot"]), "wb") as f:
+                    f.write(base64.b64decode(snapshot.screenshot))
+            if snapshot.dom:
+                entry["dom"] = f"{prefix}.html"
+                with open(os.path.join(out_dir, entry["dom"]), "w", encoding="utf-8") as f:
+                    f.write(snapshot.dom)
+            manifest.append(entry)
+
+        with open(os.path.join(out_dir, "manifest.json"), "w") as f:
+            json.dump({"test": self.test_name, "steps": manifest}, f, indent=2)
+        logger.info(f"Flight recorder dumped {len(manifest)} step(s) to {out_dir}")
+        return out_dir
+
+    def _drain_console(self):
+        """Browser console entries since the last call (Chrome only; empty elsewhere)"""
+        try:
+            entries = self.driver.get_log("browser")
+        except Exception:
+            return []
+        return [{"level": e.get("level"), "message": e.get("message", "")[:2000], "timestamp": e.get("timestamp")}
+                for e in entries]
+
+
+def record_step(driver, step, screenshot=True):
+    """Record `step` on the driver's active flight recorder; returns False when none is attached"""
+    recorder = FlightRecorder.active_for(driver)
+    if recorder is None:
+        return False
+    recorder.record(step, screenshot=screenshot)
+    return True
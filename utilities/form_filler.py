@@ -0,0 +1,158 @@
+# utilities/form_filler.py
+from selenium.common.exceptions import TimeoutException
+from config.base_config import BaseConfig
+from utilities.dropdown_selector import DropdownSelector, BY_VALUE
+from utilities.logger import setup_logger
+from utilities.waits import PageWaits
+
+logger = setup_logger("form_filler")
+
+# Field kinds
+TEXT = "text"            # <input>, <textarea> or contenteditable, filled by script
+DROPDOWN = "dropdown"    # MUI Select/Autocomplete, opened with a real click through DropdownSelector
+
+# Shared by the scripts below: resolves a Selenium (by, value) locator inside the page
+_FIND = """
+var find = function (by, value) {
+    if (by === 'xpath') {
+        return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    if (by === 'id') return document.getElementById(value);
+    if (by === 'name') return document.getElementsByName(value)[0] || null;
+    if (by === 'class name') return document.getElementsByClassName(value)[0] || null;
+    return document.querySelector(value);
+};
+"""
+
+# Waits until every field exists, then sets each value the way React expects: through the native
+# value setter plus bubbling input/change events (or insertText for contenteditable editors).
+# Returns the names of fields that never appeared.
+_FILL_SCRIPT = _FIND + """
+var fields = arguments[0], timeoutMs = arguments[1];
+var done = arguments[arguments.length - 1];
+var start = Date.now();
+var setValue = function (el, value) {
+    el.focus();
+    if (el.isContentEditable) {
+        document.execCommand('selectAll', false, null);
+        if (!document.execCommand('insertText', false, value)) el.textContent = value;
+    } else {
+        var proto = el.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+    }
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    el.blur();
+};
+var loop = function () {
+    var found = fields.map(function (f) { return find(f.by, f.locator); });
+    var missing = fields.filter(function (f, i) { return !found[i]; }).map(function (f) { return f.name; });
+    if (missing.length && Date.now() - start < timeoutMs) return setTimeout(loop, 25);
+    if (missing.length) return done(missing);
+    fields.forEach(function (f, i) { setValue(found[i], f.value); });
+    done([]);
+};
+loop();
+"""
+
+# Lets React commit pending renders, then reads every field's current value in the same round-trip
+_READ_SCRIPT = _FIND + """
+var fields = arguments[0];
+var done = arguments[arguments.length - 1];
+var read = function () {
+    var values = {};
+    fields.forEach(function (f) {
+        var el = find(f.by, f.locator);
+        if (!el) { values[f.name] = null; return; }
+        var v = (el.tagName === 'INPUT' || el.tagName === 'TEXTAREA') ? el.value : (el.innerText || el.textContent);
+        values[f.name] = (v || '').replace(/\\s+/g, ' ').trim();
+    });
+    done(values);
+};
+window.requestAnimationFrame(function () { window.requestAnimationFrame(read); });
+"""
+
+
+class Field:
+    """One entry of a declarative form map. Extra keyword arguments go to DropdownSelector.select"""
+    def __init__(self, name, locator, kind=TEXT, value=None, verify=True, normalize=None, **select_kwargs):
+        if kind not in (TEXT, DROPDOWN):
+            raise ValueError(f"Unsupported field kind: {kind}")
+        if kind == TEXT and value is None:
+            raise ValueError(f"Text field '{name}' needs a value")
+        self.name = name
+        self.locator = locator
+        self.kind = kind
+        self.value = value
+        self.verify = verify
+        self.normalize = normalize
+        self.select_kwargs = select_kwargs
+
+    def as_script_arg(self):
+        by, locator = self.locator
+        return {"name": self.name, "by": by, "locator": locator, "value": self.value}
+
+
+def choose(value):
+    """Dropdown keyword arguments that pick `value` by text or data-value, or a random option when empty"""
+    return {"strategy": BY_VALUE, "value": value} if value else {}
+
+
+class FormFiller:
+    """Fills a whole form from a field map: every text field in one script call, dropdowns through real
+    clicks, then one read-back of every committed value to verify them together"""
+    def __init__(self, driver, dropdowns=None, timeout=BaseConfig.DEFAULT_TIMEOUT):
+        self.driver = driver
+        self.timeout = timeout
+        self.dropdowns = dropdowns or DropdownSelector(driver, timeout)
+        self.waits = PageWaits(driver, timeout)
+
+    def fill(self, fields, verify=True):
+        """Fill `fields` and return {name: value entered or option chosen}; raises AssertionError when a
+        committed value does not match"""
+        values = {}
+        text_fields = [field for field in fields if field.kind == TEXT]
+        if text_fields:
+            self.fill_text(text_fields)
+            values.update((field.name, field.value) for field in text_fields)
+
+        for field in fields:
+            if field.kind != DROPDOWN:
+                continue
+            option = self.dropdowns.select(field.locator, verify=field.verify, label=field.name, **field.select_kwargs)
+            if option is None:
+                raise ValueError(f"No selectable options for '{field.name}'")
+            values[field.name] = option["text"]
+            # The next dropdown's click must not land on this one's closing backdrop
+            self.waits.backdrop_gone(replaced_sleep=1)
+
+        if verify:
+            self.verify(fields, values)
+        logger.info(f"Filled {len(fields)} field(s): {', '.join(values)}")
+        return values
+
+    def fill_text(self, fields):
+        """Set every text field in a single round-trip"""
+        missing = self.driver.execute_async_script(
+            _FILL_SCRIPT, [field.as_script_arg() for field in fields], int(self.timeout * 1000)
+        )
+        if missing:
+            raise TimeoutException(f"Form fields not found within {self.timeout}s: {', '.join(missing)}")
+
+    def read(self, fields):
+        """Return {name: current value} for `fields` in a single round-trip"""
+        return self.driver.execute_async_script(_READ_SCRIPT, [field.as_script_arg() for field in fields])
+
+    def verify(self, fields, expected):
+        checked = [field for field in fields if field.verify]
+        actual = self.read(checked)
+        mismatches = []
+        for field in checked:
+            want, got = expected[field.name], actual.get(field.name) or ""
+            if field.normalize:
+                want, got = field.normalize(want), field.normalize(got)
+            # Dropdown anchors may decorate the label (chips, icons), so containment is enough there
+            ok = got == want if field.kind == TEXT else bool(got) and (want in got or got in want)
+            if not ok:
+                mismatches.append(f"{field.name}: expected {want!r}, got {got!r}")
+        assert not mismatches, "Form values not committed: " + "; ".join(mismatches)
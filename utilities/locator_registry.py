@@ -0,0 +1,198 @@
+# utilities/locator_registry.py
+import json
+import os
+import re
+import threading
+from selenium.webdriver.common.by import By
+from config.base_config import BaseConfig
+from pages.locators import LOCATORS
+from utilities.logger import setup_logger
+
+logger = setup_logger("locator_registry")
+
+# One location step: //tag[...], /tag[...] or /following-sibling::tag[...]
+_STEP = re.compile(r"(//|/following-sibling::|/)([A-Za-z][\w-]*|\*)(?:\[([^\[\]]*)\])?")
+_COMBINATORS = {"//": " ", "/": " > ", "/following-sibling::": " ~ "}
+# Attribute tests with an exact CSS equivalent
+_PREDICATES = [
+    (re.compile(r"^@([\w-]+)\s*=\s*(['\"])(.*)\2$"), "="),
+    (re.compile(r"^contains\(\s*@([\w-]+)\s*,\s*(['\"])(.*)\2\s*\)$"), "*="),
+    (re.compile(r"^starts-with\(\s*@([\w-]+)\s*,\s*(['\"])(.*)\2\s*\)$"), "^="),
+]
+_IDENTIFIER = re.compile(r"^[A-Za-z_][\w-]*$")
+
+# Patterns that make the browser walk far more of the DOM than the element being looked for
+_EXPENSIVE = [
+    (re.compile(r"\)\s*\[\s*\d+\s*\]|\]\s*\[\s*\d+\s*\]|/[\w*-]+\[\s*\d+\s*\]"), "positional index (slower as the page grows)"),
+    (re.compile(r"name\(\)"), "name() test evaluates every element"),
+    (re.compile(r"text\(\)"), "text() match scans text nodes"),
+    (re.compile(r"//\*"), "wildcard descendant scan"),
+    (re.compile(r"(ancestor|preceding)(-sibling)?::"), "reverse axis"),
+]
+
+# Times each locator in the browser, original versus compiled, so the numbers exclude WebDriver overhead
+_TIMING_SCRIPT = """
+var locators = arguments[0], repeat = arguments[1];
+var count = function (by, value) {
+    if (by === 'xpath') {
+        return document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength;
+    }
+    if (by === 'id') return document.getElementById(value) ? 1 : 0;
+    if (by === 'name') return document.getElementsByName(value).length;
+    if (by === 'class name') return document.getElementsByClassName(value).length;
+    if (by === 'tag name') return document.getElementsByTagName(value).length;
+    return document.querySelectorAll(value).length;
+};
+var time = function (by, value) {
+    var matches = 0, start = performance.now();
+    for (var i = 0; i < repeat; i++) matches = count(by, value);
+    return [(performance.now() - start) / repeat, matches];
+};
+return locators.map(function (l) {
+    var original = time(l.original[0], l.original[1]), compiled = time(l.compiled[0], l.compiled[1]);
+    return {name: l.name, original_ms: original[0], original_matches: original[1],
+            compiled_ms: compiled[0], compiled_matches: compiled[1]};
+});
+"""
+
+
+def _css_string(value):
+    return "'" + value.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+def xpath_to_css(xpath):
+    """Exact CSS equivalent of an id/attribute-only XPath, or None when there is no exact translation"""
+    xpath = xpath.strip()
+    position, parts = 0, []
+    while position < len(xpath):
+        match = _STEP.match(xpath, position)
+        if not match:
+            return None
+        axis, tag, predicate = match.groups()
+        if not parts and axis != "//":
+            return None  # Absolute paths from the document root have no CSS form
+        selector = "" if tag == "*" else tag
+        for clause in re.split(r"\s+and\s+", predicate.strip()) if predicate and predicate.strip() else []:
+            for pattern, operator in _PREDICATES:
+                test = pattern.match(clause.strip())
+                if test:
+                    attr, _, value = test.groups()
+                    if attr == "id" and operator == "=" and _IDENTIFIER.match(value):
+                        selector += f"#{value}"
+                    else:
+                        selector += f"[{attr}{operator}{_css_string(value)}]"
+                    break
+            else:
+                return None
+        parts.append((_COMBINATORS[axis] if parts else "") + (selector or "*"))
+        position = match.end()
+    return "".join(parts) or None
+
+
+def expensive_patterns(by, value):
+    """Reasons a locator is costly to evaluate; empty for cheap ones"""
+    if by != By.XPATH:
+        return []
+    return [reason for pattern, reason in _EXPENSIVE if pattern.search(value)]
+
+
+class Locator(tuple):
+    """A (by, value) pair usable anywhere Selenium takes a locator tuple, tagged with its registry entry"""
+    def __new__(cls, by, value, name=None, original=None, flags=()):
+        locator = super().__new__(cls, (by, value))
+        locator.name = name
+        locator.original = original or (by, value)
+        locator.flags = list(flags)
+        return locator
+
+
+class LocatorRegistry:
+    """Compiles every page locator once: CSS wherever an XPath has an exact translation, and a
+    list of expensive patterns for the rest. Browser-side lookup timings are kept per locator"""
+    def __init__(self, locators=LOCATORS, translate=BaseConfig.TRANSLATE_LOCATORS):
+        self.translate = translate
+        self.timings = {}
+        self._compiled = {}
+        self._lock = threading.Lock()
+        for page, entries in locators.items():
+            for name, (by, value) in entries.items():
+                self._compiled[(page, name)] = self._compile(f"{page}.{name}", by, value)
+
+    def get(self, page, name):
+        """Compiled locator for `name` on `page`"""
+        try:
+            return self._compiled[(page, name)]
+        except KeyError:
+            raise KeyError(f"No locator '{name}' registered for page '{page}'") from None
+
+    def page(self, page):
+        """Every compiled locator of `page`, keyed by name"""
+        return {name: locator for (p, name), locator in self._compiled.items() if p == page}
+
+    def flagged(self):
+        return [locator for locator in self._compiled.values() if locator.flags]
+
+    def measure(self, driver, page=None, repeat=20):
+        """Time the original and compiled form of every locator (of `page`, or all) on the current DOM"""
+        locators = [l for (p, _), l in self._compiled.items() if page is None or p == page]
+        results = driver.execute_script(_TIMING_SCRIPT, [
+            {"name": l.name, "original": list(l.original), "compiled": [l[0], l[1]]} for l in locators
+        ], repeat)
+        with self._lock:
+            for result in results:
+                self.timings.setdefault(result["name"], []).append(result)
+                if result["original_matches"] != result["compiled_matches"]:
+                    logger.warning(f"Locator {result['name']} matches {result['compiled_matches']} element(s) "
+                                   f"compiled vs {result['original_matches']} as authored")
+        return results
+
+    def report(self):
+        """Per-locator summary: authored and compiled forms, flags and mean lookup times"""
+        rows = []
+        for locator in self._compiled.values():
+            samples = self.timings.get(locator.name, [])
+            row = {
+                "name": locator.name,
+                "original": list(locator.original),
+                "compiled": [locator[0], locator[1]],
+                "flags": locator.flags,
+            }
+            if samples:
+                row["original_ms"] = round(sum(s["original_ms"] for s in samples) / len(samples), 4)
+                row["compiled_ms"] = round(sum(s["compiled_ms"] for s in samples) / len(samples), 4)
+            rows.append(row)
+        return rows
+
+    def write_report(self, path=os.path.join("reports", "locator_report.json")):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=2)
+        return path
+
+    def _compile(self, name, by, value):
+        flags = expensive_patterns(by, value)
+        for reason in flags:
+            logger.warning(f"Expensive locator {name}: {value} ({reason})")
+        if self.translate and by == By.XPATH:
+            css = xpath_to_css(value)
+            if css:
+                return Locator(By.CSS_SELECTOR, css, name=name, original=(by, value), flags=flags)
+        return Locator(by, value, name=name, flags=flags)
+
+
+_shared_registry = None
+
+def get_locator_registry():
+    """Return the process-wide locator registry"""
+    global _shared_registry
+    if _shared_registry is None:
+        _shared_registry = LocatorRegistry()
+    return _shared_registry
+
+
+# Example usage: python -m utilities.locator_registry (static analysis, no browser needed)
+if __name__ == "__main__":
+    for row in get_locator_registry().report():
+        compiled = row["compiled"][1] if row["compiled"] != row["original"] else "(unchanged)"
+        flags = f"  !! {'; '.join(row['flags'])}" if row["flags"] else ""
+        print(f"{row['name']:45} {row['original'][1]}  ->  {compiled}{flags}")
@@ -1,13 +1,126 @@
 # utilities/logger.py
+import atexit
+import contextvars
+import json
 import logging
+import logging.handlers
 import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
+from config.base_config import BaseConfig
 
-def setup_logger(log_name="cognisaas_test", log_file="test_logs.log"):
+# Per-test context (test id, step, start time) attached to every record emitted while it is set
+_log_context = contextvars.ContextVar("log_context", default={})
+
+_listeners = {}
+_listeners_lock = threading.Lock()
+
+
+def set_log_context(**fields):
+    """Attach fields (e.g. test_id) to every following log record; setting test_id restarts elapsed_ms"""
+    context = dict(_log_context.get())
+    context.update(fields)
+    if "test_id" in fields:
+        context["_started"] = time.perf_counter()
+    _log_context.set(context)
+
+
+def get_log_context():
+    """The fields set for the current test/thread, e.g. {"test_id": ...}"""
+    return {key: value for key, value in _log_context.get().items() if not key.startswith("_")}
+
+
+def clear_log_context():
+    _log_context.set({})
+
+
+@contextmanager
+def log_step(step):
+    """Tag records emitted inside the block with `step`"""
+    token = _log_context.set({**_log_context.get(), "step": step})
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
+
+class _ContextFilter(logging.Filter):
+    """Copies the caller's context onto the record before it crosses into the listener thread"""
+    def filter(self, record):
+        context = _log_context.get()
+        record.test_id = context.get("test_id")
+        record.step = context.get("step")
+        record.worker = BaseConfig.WORKER_ID
+        started = context.get("_started")
+        record.elapsed_ms = round((time.perf_counter() - started) * 1000, 1) if started else None
+        return True
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per line, for machine parsing of timings"""
+    def format(self, record):
+        entry = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "test_id": getattr(record, "test_id", None),
+            "step": getattr(record, "step", None),
+            "worker": getattr(record, "worker", None),
+            "elapsed_ms": getattr(record, "elapsed_ms", None),
+        }
+        return json.dumps(entry, default=str)
+
+
+def _file_handler(path):
+    if BaseConfig.LOG_ROTATION == "time":
+        return logging.handlers.TimedRotatingFileHandler(
+            path, when=BaseConfig.LOG_ROTATE_WHEN, backupCount=BaseConfig.LOG_BACKUP_COUNT
+        )
+    return logging.handlers.RotatingFileHandler(
+        path, maxBytes=BaseConfig.LOG_MAX_BYTES, backupCount=BaseConfig.LOG_BACKUP_COUNT
+    )
+
+
+def _queue_for(log_path):
+    """One queue and listener thread per log file, shared by every logger writing to it"""
+    with _listeners_lock:
+        if log_path not in _listeners:
+            # File handler
+            file_handler = _file_handler(log_path)
+            file_handler.setLevel(logging.INFO)
+
+            # Console handler
+            console_handler = logging.StreamHandler()
+            console_handler.setLevel(logging.INFO)
+
+            # Formatter
+            text_formatter = logging.Formatter(
+                "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+                datefmt="%Y-%m-%d %H:%M:%S"
+            )
+            file_handler.setFormatter(JsonLinesFormatter() if BaseConfig.LOG_FORMAT == "json" else text_formatter)
+            console_handler.setFormatter(text_formatter)
+
+            log_queue = queue.SimpleQueue()
+            listener = logging.handlers.QueueListener(
+                log_queue, file_handler, console_handler, respect_handler_level=True
+            )
+            listener.start()
+            atexit.register(listener.stop)
+            _listeners[log_path] = (log_queue, listener)
+        return _listeners[log_path][0]
+
+
+def setup_logger(log_name="cognisaas_test", log_file=None):
     # Create logs directory if it doesn't exist
-    log_dir = "logs"
+    log_dir = BaseConfig.LOG_DIR
+    log_file = log_file or BaseConfig.LOG_FILE
     if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+        os.makedirs(log_dir, exist_ok=True)
 
     # Set up logger
     logger = logging.getLogger(log_name)
@@ -15,29 +128,17 @@ def setup_logger(log_name="cognisaas_test", log_file="test_logs.log"):
 
     # Avoid duplicate handlers if logger is reused
     if not logger.handlers:
-        # File handler
-        file_handler = logging.FileHandler(os.path.join(log_dir, log_file))
-        file_handler.setLevel(logging.INFO)
-
-        # Console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-
-        # Formatter
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
-        file_handler.setFormatter(formatter)
-        console_handler.setFormatter(formatter)
-
-        # Add handlers
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        # Records are handed to a background listener, so logging never blocks the browser thread
+        queue_handler = logging.handlers.QueueHandler(_queue_for(os.path.join(log_dir, log_file)))
+        queue_handler.addFilter(_ContextFilter())
+        logger.addHandler(queue_handler)
+        logger.propagate = False
 
     return logger
 
 # Example usage
 if __name__ == "__main__":
     logger = setup_logger()
-    logger.info("Test logging started")
\ No newline at end of file
+    set_log_context(test_id="example")
+    with log_step("startup"):
+        logger.info("Test logging started")
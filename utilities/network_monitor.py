@@ -0,0 +1,189 @@
+# utilities/network_monitor.py
+import collections
+import itertools
+import json
+import re
+import threading
+import time
+from selenium.common.exceptions import TimeoutException
+from config.base_config import BaseConfig
+from utilities.logger import setup_logger
+
+logger = setup_logger("network_monitor")
+
+# Chrome options that make chromedriver record DevTools Network events into the "performance" log
+PERFORMANCE_LOGGING = {"performance": "ALL"}
+PERF_LOGGING_PREFS = {"enableNetwork": True, "enablePage": False}
+
+
+class Response:
+    """One finished request, as reported by the DevTools Network domain"""
+    def __init__(self, monitor, request_id, seq, url, method):
+        self._monitor = monitor
+        self.request_id = request_id
+        self.seq = seq
+        self.url = url
+        self.method = method
+        self.status = None
+        self.error = None
+        self.started = time.monotonic()
+        self.finished = None
+        self._body = None
+
+    @property
+    def ok(self):
+        return self.error is None and self.status is not None and 200 <= self.status < 300
+
+    def body(self):
+        """Response body text, fetched from the browser on first use"""
+        if self._body is None:
+            self._body = self._monitor.response_body(self.request_id)
+        return self._body
+
+    def json(self):
+        return json.loads(self.body() or "null")
+
+    def __repr__(self):
+        return f"<Response {self.method} {self.url} {self.status or self.error}>"
+
+
+class NetworkMonitor:
+    """Follows the browser's Network events through chromedriver's performance log: requests in flight,
+    and every finished response with its status. Waits drain the log in a tight loop, so they return as
+    soon as the matching event is buffered instead of after a DOM polling timeout"""
+    def __init__(self, driver, history=500):
+        self.driver = driver
+        self._in_flight = {}
+        self._finished = collections.deque(maxlen=history)
+        self._seq = itertools.count(1)
+        self._last_seq = 0
+        self._last_activity = time.monotonic()
+        self._lock = threading.Lock()
+
+    def mark(self):
+        """Cursor for "responses after this point"; take it before the action that sends the request"""
+        with self._lock:
+            self._drain()
+            return self._last_seq
+
+    def reset(self):
+        """Forget everything seen so far (used when a pooled browser changes hands)"""
+        with self._lock:
+            self._drain()
+            self._in_flight.clear()
+            self._finished.clear()
+
+    def in_flight(self):
+        with self._lock:
+            self._drain()
+            return list(self._in_flight.values())
+
+    def wait_for_response(self, url_pattern, method=None, after=0, timeout=BaseConfig.DEFAULT_TIMEOUT,
+                          poll=BaseConfig.NETWORK_POLL_INTERVAL):
+        """First finished response after cursor `after` whose URL matches `url_pattern` (a regex)"""
+        pattern = re.compile(url_pattern)
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                self._drain()
+                for response in self._finished:
+                    if (response.seq > after and pattern.search(response.url)
+                            and (method is None or response.method == method)):
+                        return response
+            if time.monotonic() >= deadline:
+                raise TimeoutException(f"No {method or ''} response matching {url_pattern} within {timeout}s")
+            time.sleep(poll)
+
+    def wait_for_network_idle(self, quiet=0.5, timeout=BaseConfig.DEFAULT_TIMEOUT, ignore=None,
+                              poll=BaseConfig.NETWORK_POLL_INTERVAL):
+        """Wait until no request (other than URLs matching `ignore`) has been in flight for `quiet` seconds"""
+        ignored = re.compile(ignore) if ignore else None
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                self._drain()
+                busy = [r for r in self._in_flight.values() if not (ignored and ignored.search(r.url))]
+                idle_for = time.monotonic() - self._last_activity
+            if not busy and idle_for >= quiet:
+                return
+            if time.monotonic() >= deadline:
+                raise TimeoutException(f"Network not idle within {timeout}s; in flight: "
+                                       + ", ".join(r.url for r in busy[:5]))
+            time.sleep(poll)
+
+    def verify_saved(self, url_pattern, after, what="Record", timeout=BaseConfig.DEFAULT_TIMEOUT,
+                     grace=BaseConfig.NETWORK_SAVE_GRACE, poll=BaseConfig.NETWORK_POLL_INTERVAL):
+        """The POST matching `url_pattern` sent after cursor `after`, asserted successful. Returns None when
+        no such request was seen (the pattern does not fit this environment), so callers can fall back.
+        Only a matching request in flight is waited on for the full `timeout`; without one, the wait ends
+        once `grace` has passed and the network is idle"""
+        pattern = re.compile(url_pattern)
+        matches = lambda r: r.method == "POST" and pattern.search(r.url)
+        started = time.monotonic()
+        while True:
+            with self._lock:
+                self._drain()
+                response = next((r for r in self._finished if r.seq > after and matches(r)), None)
+                pending = any(matches(r) for r in self._in_flight.values())
+                idle = not self._in_flight
+            if response is not None:
+                break
+            elapsed = time.monotonic() - started
+            if elapsed >= timeout or (not pending and idle and elapsed >= grace):
+                logger.warning(f"No {what.lower()} save request matching {url_pattern} seen on the network")
+                return None
+            time.sleep(poll)
+        assert response.ok, (f"{what} save failed: HTTP {response.status or response.error} "
+                             f"{(response.body() or '')[:200]}")
+        logger.info(f"{what} save confirmed by the API: HTTP {response.status} from {response.url}")
+        return response
+
+    def response_body(self, request_id):
+        try:
+            result = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+        except Exception as e:
+            logger.debug(f"Response body for {request_id} unavailable: {e}")
+            return None
+        return result.get("body")
+
+    def _drain(self):
+        """Apply every buffered Network event; one WebDriver command however many events there are"""
+        for entry in self.driver.get_log("performance"):
+            try:
+                event = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+            self._apply(event.get("method", ""), event.get("params", {}))
+
+    def _apply(self, method, params):
+        request_id = params.get("requestId")
+        if method == "Network.requestWillBeSent":
+            request = params.get("request", {})
+            url = request.get("url", "")
+            if url.startswith("data:"):
+                return
+            # Redirects reuse the request id; the later hop replaces the earlier one
+            self._in_flight[request_id] = Response(self, request_id, 0, url, request.get("method"))
+        elif method == "Network.responseReceived" and request_id in self._in_flight:
+            self._in_flight[request_id].status = params.get("response", {}).get("status")
+        elif method in ("Network.loadingFinished", "Network.loadingFailed") and request_id in self._in_flight:
+            response = self._in_flight.pop(request_id)
+            if method == "Network.loadingFailed":
+                response.error = params.get("errorText") or "failed"
+            response.finished = time.monotonic()
+            response.seq = self._last_seq = next(self._seq)
+            self._finished.append(response)
+        else:
+            return
+        self._last_activity = time.monotonic()
+
+
+def attach_network_monitor(driver):
+    """Create the driver's monitor; the driver must have been started with PERFORMANCE_LOGGING"""
+    driver._network_monitor = NetworkMonitor(driver)
+    return driver._network_monitor
+
+
+def get_network_monitor(driver):
+    """The monitor attached by DriverSetup, or None (non-Chrome browser or monitoring disabled)"""
+    return getattr(driver, "_network_monitor", None)
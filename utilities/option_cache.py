@@ -0,0 +1,83 @@
+# utilities/option_cache.py
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from config.base_config import BaseConfig
+from config.credentials import Credentials
+from config.environments import Environments
+from utilities.logger import setup_logger
+
+logger = setup_logger("option_cache")
+
+
+class OptionCache:
+    """On-disk option lists of stable dropdowns, keyed by (environment, tenant, field) and kept for `ttl`
+    seconds, so a selection can pick its target before the dropdown opens instead of reading it first"""
+    def __init__(self, cache_dir=BaseConfig.OPTION_CACHE_DIR, ttl=BaseConfig.OPTION_CACHE_TTL,
+                 environment=Environments.DEFAULT_ENV, tenant=BaseConfig.TENANT or Credentials.VALID_EMAIL):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.environment = environment
+        self.tenant = tenant
+        self._memory = {}
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def get(self, field):
+        """Cached options for `field`, or None when missing or expired"""
+        with self._lock:
+            entry = self._memory.get(field)
+        if entry is None:
+            try:
+                with open(self._path(field)) as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                return None
+        if entry.get("expires_at", 0) <= time.time():
+            self.invalidate(field)
+            return None
+        with self._lock:
+            self._memory[field] = entry
+        return entry["options"]
+
+    def put(self, field, options):
+        """Store a freshly read option list; written atomically so parallel workers never read half a file"""
+        entry = {
+            "environment": self.environment,
+            "tenant": self.tenant,
+            "field": field,
+            "options": options,
+            "expires_at": time.time() + self.ttl,
+        }
+        with self._lock:
+            self._memory[field] = entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, self._path(field))
+
+    def invalidate(self, field):
+        with self._lock:
+            self._memory.pop(field, None)
+        try:
+            os.remove(self._path(field))
+            logger.info(f"Dropped cached options for {field}")
+        except FileNotFoundError:
+            pass
+
+    def _path(self, field):
+        key = hashlib.sha1(f"{self.environment}|{self.tenant}|{field}".encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+
+_shared_cache = None
+
+def get_option_cache():
+    """Return the process-wide option cache"""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = OptionCache()
+    return _shared_cache
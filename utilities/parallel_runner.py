@@ -0,0 +1,206 @@
+# utilities/parallel_runner.py
+import argparse
+import json
+import multiprocessing
+import os
+import secrets
+import sys
+import time
+import unittest
+import zlib
+from collections import OrderedDict
+
+# Config and page objects are imported lazily inside the workers, after _init_worker has pointed
+# BaseConfig at the worker's own screenshot directory, log file and data tag.
+
+def discover_test_ids(start_dir="tests", pattern="test*.py"):
+    """Return the ids of every test under `start_dir` in discovery order"""
+    suite = unittest.TestLoader().discover(start_dir, pattern=pattern)
+    return [test.id() for test in _iter_tests(suite)]
+
+
+def _iter_tests(suite):
+    for item in suite:
+        if isinstance(item, unittest.TestSuite):
+            yield from _iter_tests(item)
+        else:
+            yield item
+
+
+def shard_test_ids(test_ids, shard_index=0, shard_count=1):
+    """Keep the tests that belong to this shard; stable across machines for the same test ids"""
+    if not 0 <= shard_index < shard_count:
+        raise ValueError(f"Shard index {shard_index} out of range for {shard_count} shards")
+    return [t for t in test_ids if zlib.crc32(t.encode()) % shard_count == shard_index]
+
+
+def group_by_class(test_ids):
+    """Group test ids by class so setUpClass fixtures are shared within a worker"""
+    groups = OrderedDict()
+    for test_id in test_ids:
+        groups.setdefault(test_id.rsplit(".", 1)[0], []).append(test_id)
+    return list(groups.values())
+
+
+def new_run_id():
+    """Short random id naming one run of the suite"""
+    return secrets.token_hex(3)
+
+
+def data_tag(run_id, shard_index, worker_id, base=""):
+    """Prefix for the names a worker creates: unique per run, shard and worker, so shards on other
+    machines (which number their workers from 1 too) and reruns never reuse a name"""
+    return f"{base}{run_id}s{shard_index}w{worker_id}_"
+
+
+def _init_worker(counter, shard_index, run_id):
+    with counter.get_lock():
+        counter.value += 1
+        worker_id = counter.value
+
+    from config.base_config import BaseConfig
+    BaseConfig.WORKER_ID = worker_id
+    BaseConfig.SCREENSHOT_DIR = os.path.join(BaseConfig.SCREENSHOT_DIR, f"worker_{worker_id}")
+    BaseConfig.LOG_FILE = f"worker_{worker_id}.jsonl"
+    # COGNISAAS_DATA_TAG, when set, stays in front of it
+    BaseConfig.DATA_TAG = data_tag(run_id, shard_index, worker_id, BaseConfig.DATA_TAG)
+    # Each worker owns exactly one browser
+    BaseConfig.DRIVER_POOL_SIZE = 1
+    os.makedirs(BaseConfig.SCREENSHOT_DIR, exist_ok=True)
+
+
+def _run_group(test_ids):
+    """Run one class worth of tests inside a worker and return a plain-data result per test"""
+    from config.base_config import BaseConfig
+
+    suite = unittest.TestLoader().loadTestsFromNames(test_ids)
+    result = _RecordingResult()
+    suite.run(result)
+    for record in result.records:
+        record["worker"] = BaseConfig.WORKER_ID
+    return result.records
+
+
+class _RecordingResult(unittest.TestResult):
+    """TestResult that keeps outcome and duration per test in picklable form"""
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self._started = {}
+
+    def startTest(self, test):
+        super().startTest(test)
+        self._started[test.id()] = time.perf_counter()
+
+    def _record(self, test, outcome, detail=None):
+        started = self._started.pop(test.id(), time.perf_counter())
+        self.records.append({
+            "id": test.id(),
+            "outcome": outcome,
+            "duration": round(time.perf_counter() - started, 3),
+            "detail": detail,
+        })
+
+    def addSuccess(self, test):
+        super().addSuccess(test)
+        self._record(test, "passed")
+
+    def addFailure(self, test, err):
+        super().addFailure(test, err)
+        self._record(test, "failed", self._exc_info_to_string(err, test))
+
+    def addError(self, test, err):
+        super().addError(test, err)
+        # Class-level fixture errors arrive as a _ErrorHolder without a start time
+        self._record(test, "error", self._exc_info_to_string(err, test))
+
+    def addSkip(self, test, reason):
+        super().addSkip(test, reason)
+        self._record(test, "skipped", reason)
+
+    def addExpectedFailure(self, test, err):
+        super().addExpectedFailure(test, err)
+        self._record(test, "passed")
+
+    def addUnexpectedSuccess(self, test):
+        super().addUnexpectedSuccess(test)
+        self._record(test, "failed", "Unexpected success")
+
+
+def run_parallel(test_ids, workers, shard_index=0, run_id=None):
+    """Fan test classes out across `workers` processes and merge the results"""
+    run_id = run_id or new_run_id()
+    groups = group_by_class(test_ids)
+    # Longest-running classes first keeps the tail short; without history, bigger classes first
+    groups.sort(key=len, reverse=True)
+
+    # Resolve chromedriver once up front so no worker reaches webdriver-manager's version check
+    from utilities.driver_resolver import get_driver_resolver
+    get_driver_resolver().resolve()
+
+    context = multiprocessing.get_context("spawn")
+    counter = context.Value("i", 0)
+    records = []
+    with context.Pool(processes=min(workers, len(groups)) or 1, initializer=_init_worker,
+                      initargs=(counter, shard_index, run_id)) as pool:
+        for group_records in pool.imap_unordered(_run_group, groups):
+            for record in group_records:
+                print(f"[worker {record['worker']}] {record['outcome'].upper():7} {record['id']} ({record['duration']}s)")
+            records.extend(group_records)
+    return records
+
+
+def write_report(records, path, wall_time, shard_index, shard_count, run_id=None):
+    """Write the merged report as JSON and return the summary counts"""
+    summary = {}
+    for record in records:
+        summary[record["outcome"]] = summary.get(record["outcome"], 0) + 1
+    report = {
+        "run_id": run_id,
+        "shard": {"index": shard_index, "count": shard_count},
+        "wall_time": round(wall_time, 3),
+        "summed_test_time": round(sum(r["duration"] for r in records), 3),
+        "summary": summary,
+        "tests": sorted(records, key=lambda r: r["id"]),
+    }
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the CogniSaaS suite across worker processes")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--start-dir", default="tests")
+    parser.add_argument("--pattern", default="test*.py")
+    parser.add_argument("--shard-index", type=int, default=0)
+    parser.add_argument("--shard-count", type=int, default=1)
+    parser.add_argument("--report", default=os.path.join("reports", "parallel_report.json"))
+    parser.add_argument("--run-id", default=None, help="Tag for the data this run creates; random if omitted. "
+                                                        "Pass the same id to every shard of one CI run")
+    args = parser.parse_args(argv)
+    run_id = args.run_id or new_run_id()
+
+    test_ids = shard_test_ids(discover_test_ids(args.start_dir, args.pattern), args.shard_index, args.shard_count)
+    if not test_ids:
+        print("No tests selected for this shard")
+        return 0
+
+    print(f"Running {len(test_ids)} test(s) on {args.workers} worker(s), shard {args.shard_index + 1}/{args.shard_count}, "
+          f"run {run_id}")
+    start = time.perf_counter()
+    records = run_parallel(test_ids, args.workers, args.shard_index, run_id)
+    wall_time = time.perf_counter() - start
+
+    summary = write_report(records, args.report, wall_time, args.shard_index, args.shard_count, run_id)
+    print(f"Finished in {wall_time:.1f}s: {summary}. Report written to {args.report}")
+    for record in records:
+        if record["outcome"] in ("failed", "error"):
+            print(f"\n{record['outcome'].upper()}: {record['id']}\n{record['detail']}")
+    return 0 if not summary.get("failed") and not summary.get("error") else 1
+
+
+# Example usage: python -m utilities.parallel_runner --workers 4 --shard-index 0 --shard-count 2
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,314 @@
+# utilities/profiler.py
+import argparse
+import functools
+import html
+import json
+import math
+import os
+import threading
+import time
+import uuid
+from datetime import datetime
+from config.base_config import BaseConfig
+from utilities.command_metrics import get_command_metrics
+from utilities.logger import setup_logger, get_log_context, set_log_context
+
+logger = setup_logger("profiler")
+
+_local = threading.local()
+
+
+class StepRecord:
+    """Timing for one top-level page-object call"""
+    def __init__(self, test_id, step):
+        self.test_id = test_id
+        self.step = step
+        self.wall_ms = 0.0
+        self.commands = 0
+        self.wait_ms = 0.0
+        self.sleep_ms = 0.0
+        self.replaced_sleep_ms = 0.0
+        self.retries = 0
+        self.success = True
+
+    def as_dict(self):
+        return {
+            "test_id": self.test_id,
+            "step": self.step,
+            "wall_ms": round(self.wall_ms, 1),
+            "commands": self.commands,
+            "wait_ms": round(self.wait_ms, 1),
+            "sleep_ms": round(self.sleep_ms, 1),
+            "replaced_sleep_ms": round(self.replaced_sleep_ms, 1),
+            "retries": self.retries,
+            "success": self.success,
+        }
+
+
+def _current_step():
+    return getattr(_local, "step", None)
+
+
+def count_retry():
+    """Called from retry loops so the active step's retry count is reported"""
+    step = _current_step()
+    if step is not None:
+        step.retries += 1
+
+
+class StepProfiler:
+    """Wraps every public page-object method to record wall time, WebDriver commands, time spent in
+    explicit waits versus sleeps, and retries per step; results are appended to a history file"""
+    def __init__(self, history_path=BaseConfig.PROFILE_HISTORY):
+        self.history_path = history_path
+        self.records = []
+        self._records_lock = threading.Lock()
+        self._installed = False
+        self._patched = []
+
+    def install(self, page_classes=None):
+        """Patch the page-object classes plus the wait and sleep primitives; safe to call twice"""
+        if self._installed:
+            return
+        from selenium.webdriver.support.ui import WebDriverWait
+        from utilities.waits import PageWaits
+        if page_classes is None:
+            from pages.login_page import LoginPage
+            from pages.logout_page import LogoutPage
+            from pages.client_onboarding_page import ClientOnboardingPage
+            from pages.project_import_page import ProjectImportPageCase
+            page_classes = [LoginPage, LogoutPage, ClientOnboardingPage, ProjectImportPageCase]
+
+        for cls in page_classes:
+            for name, attr in list(vars(cls).items()):
+                if not name.startswith("_") and callable(attr):
+                    self._patch(cls, name, self._wrap_step(cls.__name__, name, attr))
+
+        self._patch(WebDriverWait, "until", self._wrap_wait(WebDriverWait.until))
+        self._patch(WebDriverWait, "until_not", self._wrap_wait(WebDriverWait.until_not))
+        self._patch(PageWaits, "_wait", self._wrap_page_wait(PageWaits._wait))
+        self._patch(time, "sleep", self._wrap_sleep(time.sleep))
+        get_command_metrics().add_listener(self._count_command)
+        self._installed = True
+
+    def uninstall(self):
+        get_command_metrics().remove_listener(self._count_command)
+        for owner, name, original in reversed(self._patched):
+            setattr(owner, name, original)
+        self._patched = []
+        self._installed = False
+
+    def start_test(self, test_id, driver):
+        """Attribute this thread's steps to `test_id` (through the log context, like the command metrics)
+        and count WebDriver commands issued by `driver`"""
+        if get_log_context().get("test_id") != test_id:
+            set_log_context(test_id=test_id)
+        if self._installed:
+            get_command_metrics().instrument(driver)
+
+    def finish_test(self, test_id=None):
+        """Append the steps of `test_id` (default: the current log context's test) to the history file
+        and drop them from memory; returns them"""
+        test_id = test_id or get_log_context().get("test_id")
+        with self._records_lock:
+            records = [r for r in self.records if r.test_id == test_id]
+            self.records = [r for r in self.records if r.test_id != test_id]
+        if records:
+            os.makedirs(os.path.dirname(self.history_path) or ".", exist_ok=True)
+            # run_at is only to the second; run_id keeps two runs finishing in the same second apart
+            run = {"run_at": datetime.now().isoformat(timespec="seconds"), "run_id": uuid.uuid4().hex}
+            lines = "".join(json.dumps({**run, **record.as_dict()}) + "\n" for record in records)
+            with self._records_lock, open(self.history_path, "a") as f:
+                f.write(lines)
+        return records
+
+    def _patch(self, owner, name, replacement):
+        self._patched.append((owner, name, getattr(owner, name)))
+        setattr(owner, name, replacement)
+
+    def _wrap_step(self, class_name, method_name, func):
+        profiler = self
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # Only top-level calls are steps; nested public calls are folded into their caller
+            test_id = get_log_context().get("test_id")
+            if _current_step() is not None or test_id is None:
+                return func(*args, **kwargs)
+            record = StepRecord(test_id, f"{class_name}.{method_name}")
+            _local.step = record
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                record.success = False
+                raise
+            finally:
+                record.wall_ms = (time.perf_counter() - start) * 1000
+                _local.step = None
+                with profiler._records_lock:
+                    profiler.records.append(record)
+        return wrapper
+
+    def _wrap_wait(self, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            step = _current_step()
+            # Nested waits (PageWaits calling into WebDriverWait) are only counted once
+            if step is None or getattr(_local, "in_wait", False):
+                return func(*args, **kwargs)
+            _local.in_wait = True
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                step.wait_ms += (time.perf_counter() - start) * 1000
+                _local.in_wait = False
+        return wrapper
+
+    def _wrap_page_wait(self, func):
+        timed = self._wrap_wait(func)
+
+        @functools.wraps(func)
+        def wrapper(waits, name, args, replaced_sleep, timeout):
+            step = _current_step()
+            if step is not None and replaced_sleep:
+                step.replaced_sleep_ms += replaced_sleep * 1000
+            return timed(waits, name, args, replaced_sleep, timeout)
+        return wrapper
+
+    def _wrap_sleep(self, func):
+        @functools.wraps(func)
+        def wrapper(seconds):
+            step = _current_step()
+            if step is not None:
+                step.sleep_ms += seconds * 1000
+            return func(seconds)
+        return wrapper
+
+    def _count_command(self, command, elapsed):
+        step = _current_step()
+        if step is not None:
+            step.commands += 1
+
+
+def _percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def load_history(history_path=BaseConfig.PROFILE_HISTORY):
+    if not os.path.exists(history_path):
+        return []
+    with open(history_path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def aggregate(records):
+    """p50/p95 wall time and mean commands, waits, sleeps and retries per step"""
+    by_step = {}
+    for record in records:
+        by_step.setdefault(record["step"], []).append(record)
+    summary = {}
+    for step, rows in sorted(by_step.items()):
+        walls = [r["wall_ms"] for r in rows]
+        summary[step] = {
+            "runs": len(rows),
+            "p50_ms": _percentile(walls, 50),
+            "p95_ms": _percentile(walls, 95),
+            "mean_ms": round(sum(walls) / len(rows), 1),
+            "mean_commands": round(sum(r["commands"] for r in rows) / len(rows), 1),
+            "mean_wait_ms": round(sum(r["wait_ms"] for r in rows) / len(rows), 1),
+            "mean_sleep_ms": round(sum(r["sleep_ms"] for r in rows) / len(rows), 1),
+            "mean_replaced_sleep_ms": round(sum(r.get("replaced_sleep_ms", 0) for r in rows) / len(rows), 1),
+            "retries": sum(r["retries"] for r in rows),
+            "failures": sum(1 for r in rows if not r["success"]),
+        }
+    return summary
+
+
+def per_test(records):
+    """Total wall time, commands and the slowest step per test for the most recent run of each test"""
+    latest = {}
+    for record in records:
+        # History is append-only, so the last run seen for a test is its latest; records written before
+        # run ids existed are grouped by their timestamp
+        run = record.get("run_id", record["run_at"])
+        latest.setdefault(record["test_id"], {}).setdefault(run, []).append(record)
+    report = {}
+    for test_id, runs in sorted(latest.items()):
+        steps = list(runs.values())[-1]
+        slowest = max(steps, key=lambda r: r["wall_ms"])
+        report[test_id] = {
+            "run_at": steps[0]["run_at"],
+            "wall_ms": round(sum(r["wall_ms"] for r in steps), 1),
+            "commands": sum(r["commands"] for r in steps),
+            "slowest_step": slowest["step"],
+            "slowest_step_ms": slowest["wall_ms"],
+            "steps": steps,
+        }
+    return report
+
+
+def write_report(history_path=BaseConfig.PROFILE_HISTORY, out_dir=BaseConfig.PROFILE_REPORT_DIR):
+    """Write step_report.json and step_report.html from the history file; returns the JSON path"""
+    records = load_history(history_path)
+    report = {"aggregate": aggregate(records), "tests": per_test(records)}
+    os.makedirs(out_dir, exist_ok=True)
+    json_path = os.path.join(out_dir, "step_report.json")
+    with open(json_path, "w") as f:
+        json.dump(report, f, indent=2)
+    with open(os.path.join(out_dir, "step_report.html"), "w") as f:
+        f.write(_render_html(report))
+    logger.info(f"Step report written to {json_path} ({len(records)} step records)")
+    return json_path
+
+
+def _render_html(report):
+    columns = ["runs", "p50_ms", "p95_ms", "mean_ms", "mean_commands", "mean_wait_ms",
+               "mean_sleep_ms", "mean_replaced_sleep_ms", "retries", "failures"]
+    rows = "".join(
+        "<tr><td>{}</td>{}</tr>".format(
+            html.escape(step), "".join(f"<td>{stats[c]}</td>" for c in columns)
+        )
+        for step, stats in sorted(report["aggregate"].items(), key=lambda item: -item[1]["p95_ms"])
+    )
+    tests = "".join(
+        f"<tr><td>{html.escape(test_id)}</td><td>{t['run_at']}</td><td>{t['wall_ms']}</td>"
+        f"<td>{t['commands']}</td><td>{html.escape(t['slowest_step'])}</td><td>{t['slowest_step_ms']}</td></tr>"
+        for test_id, t in report["tests"].items()
+    )
+    header = "".join(f"<th>{c}</th>" for c in columns)
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Page-object step timings</title>
+<style>body{{font-family:sans-serif}}table{{border-collapse:collapse;margin-bottom:2em}}
+td,th{{border:1px solid #ccc;padding:4px 8px;text-align:right}}td:first-child{{text-align:left}}</style></head>
+<body><h1>Steps (slowest p95 first)</h1>
+<table><tr><th>step</th>{header}</tr>{rows}</table>
+<h1>Latest run per test</h1>
+<table><tr><th>test</th><th>run_at</th><th>wall_ms</th><th>commands</th><th>slowest step</th><th>ms</th></tr>{tests}</table>
+</body></html>
+"""
+
+
+_shared_profiler = None
+
+def get_profiler():
+    """Return the process-wide profiler, installed on first use when BaseConfig.PROFILE_STEPS is on"""
+    global _shared_profiler
+    if _shared_profiler is None:
+        _shared_profiler = StepProfiler()
+        if BaseConfig.PROFILE_STEPS:
+            _shared_profiler.install()
+    return _shared_profiler
+
+
+# Example usage: python -m utilities.profiler --history reports/step_timings.jsonl
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the page-object step timing report")
+    parser.add_argument("--history", default=BaseConfig.PROFILE_HISTORY)
+    parser.add_argument("--out-dir", default=BaseConfig.PROFILE_REPORT_DIR)
+    cli_args = parser.parse_args()
+    write_report(cli_args.history, cli_args.out_dir)
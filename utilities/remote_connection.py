@@ -0,0 +1,68 @@
+# utilities/remote_connection.py
+import socket
+from urllib.parse import urlsplit, urlunsplit
+import urllib3
+from urllib3.connection import HTTPConnection
+from config.base_config import BaseConfig
+from utilities.logger import setup_logger
+
+logger = setup_logger("remote_connection")
+
+# urllib3 already disables Nagle; SO_KEEPALIVE stops idle pooled sockets from being dropped silently
+_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+
+
+def _loopback(url):
+    """Point a "localhost" URL at 127.0.0.1 so no command waits on name resolution or an IPv6 attempt"""
+    parts = urlsplit(url)
+    if parts.hostname != "localhost":
+        return url
+    netloc = "127.0.0.1" + (f":{parts.port}" if parts.port else "")
+    return urlunsplit(parts._replace(netloc=netloc))
+
+
+def connection_pool(pool_size=BaseConfig.REMOTE_POOL_SIZE, connect_timeout=BaseConfig.REMOTE_CONNECT_TIMEOUT,
+                    read_timeout=BaseConfig.REMOTE_READ_TIMEOUT):
+    """Keep-alive pool for one driver server. Sized for the test thread plus the screenshot and
+    recorder threads that share the browser, so no connection is opened and thrown away per command"""
+    return urllib3.PoolManager(
+        num_pools=1,
+        maxsize=pool_size,
+        timeout=urllib3.Timeout(connect=connect_timeout, read=read_timeout),
+        # Re-send only when the connection could not be made; a command that reached the server is never replayed
+        retries=urllib3.Retry(total=2, connect=2, read=0, status=0, redirect=0, raise_on_status=False),
+        socket_options=_SOCKET_OPTIONS,
+    )
+
+
+def tune_connection(driver, pool_size=BaseConfig.REMOTE_POOL_SIZE, loopback=BaseConfig.REMOTE_LOOPBACK,
+                    connect_timeout=BaseConfig.REMOTE_CONNECT_TIMEOUT, read_timeout=BaseConfig.REMOTE_READ_TIMEOUT):
+    """Swap the driver's per-session HTTP client for a tuned keep-alive pool. Works on the
+    RemoteConnection Selenium already built, so Chrome, Firefox and Remote drivers are all covered"""
+    executor = driver.command_executor
+    # Selenium >= 4.26 keeps the address (and every request's timeout) on a per-connection ClientConfig;
+    # older versions keep the address on the connection itself
+    config = getattr(executor, "_client_config", None)
+    url = getattr(config, "remote_server_addr", None) or getattr(executor, "_url", None)
+    if url is None:
+        logger.warning(f"Unrecognized remote connection {type(executor).__name__}; leaving it as is")
+        return driver
+    if loopback:
+        url = _loopback(url)
+        if config is not None:
+            config.remote_server_addr = url
+        if hasattr(executor, "_url"):
+            executor._url = url
+    previous = getattr(executor, "_conn", None)
+    executor._conn = connection_pool(pool_size, connect_timeout, read_timeout)
+    if config is not None:
+        # Passed with every request, where it overrides the pool's own timeout
+        config.timeout = urllib3.Timeout(connect=connect_timeout, read=read_timeout)
+        # Selenium only reuses _conn when keep-alive is on
+        config.keep_alive = True
+    else:
+        executor.keep_alive = True
+    if previous is not None:
+        previous.clear()
+    logger.debug(f"Remote connection to {url} pooled with {pool_size} keep-alive socket(s)")
+    return driver
@@ -0,0 +1,160 @@
+# utilities/retry_policy.py
+import random
+import threading
+import time
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+from config.base_config import BaseConfig
+from utilities.logger import setup_logger
+from utilities.profiler import count_retry
+
+logger = setup_logger("retry_policy")
+
+# Failure kinds. Anything that classifies as None is a real error and is raised immediately.
+STALE = "stale"              # The element was re-rendered between lookup and use
+INTERCEPTED = "intercepted"  # Another element (usually a backdrop) received the click
+TIMEOUT = "timeout"          # The element never became present/clickable in time
+MISSING = "missing"          # A direct find_element found nothing
+
+_KINDS = [
+    (StaleElementReferenceException, STALE),
+    (ElementClickInterceptedException, INTERCEPTED),
+    (ElementNotInteractableException, INTERCEPTED),
+    (TimeoutException, TIMEOUT),
+    (NoSuchElementException, MISSING),
+]
+
+_REMOVE_BACKDROPS_SCRIPT = """
+var overlays = document.getElementsByClassName('MuiBackdrop-root');
+for (var i = overlays.length - 1; i >= 0; i--) overlays[i].remove();
+if (arguments[0]) {
+    var modals = document.querySelectorAll('[role="presentation"]');
+    for (var j = 0; j < modals.length; j++) modals[j].remove();
+}
+"""
+
+
+def classify(error):
+    for exception_type, kind in _KINDS:
+        if isinstance(error, exception_type):
+            return kind
+    return None
+
+
+# Recovery actions: called as recovery(driver, error) before the next attempt
+def remove_backdrops(driver, error=None, modals=False):
+    """Strip MUI backdrops (and, with `modals`, presentation layers) left over by closed popovers"""
+    driver.execute_script(_REMOVE_BACKDROPS_SCRIPT, modals)
+
+
+def settle_dom(driver, error=None):
+    """Let a re-render finish so the next lookup gets the fresh element"""
+    from utilities.waits import PageWaits
+    PageWaits(driver).dom_settled(replaced_sleep=1)
+
+
+class RetryStats:
+    """Attempts, retries and recovered/failed steps per policy name and failure kind"""
+    def __init__(self):
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, attempts, kinds, success):
+        with self._lock:
+            entry = self._stats.setdefault(name, {"calls": 0, "attempts": 0, "recovered": 0, "failed": 0, "kinds": {}})
+            entry["calls"] += 1
+            entry["attempts"] += attempts
+            if not success:
+                entry["failed"] += 1
+            elif kinds:
+                entry["recovered"] += 1
+            for kind in kinds:
+                entry["kinds"][kind] = entry["kinds"].get(kind, 0) + 1
+
+    def summary(self):
+        with self._lock:
+            return {name: dict(entry, kinds=dict(entry["kinds"])) for name, entry in self._stats.items()}
+
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+
+
+retry_stats = RetryStats()
+
+
+class RetryPolicy:
+    """Runs a step until it succeeds, retrying only transient UI failures. Waits between attempts use
+    jittered exponential backoff, and every attempt's timeout is cut to what is left of `deadline`, so a
+    failing step surfaces within the deadline rather than after attempts x timeout.
+
+    `recoveries` maps a failure kind to callables run (as recovery(driver, error)) before the next attempt.
+    """
+    DEFAULT_RECOVERIES = {
+        STALE: [settle_dom],
+        INTERCEPTED: [remove_backdrops, settle_dom],
+        TIMEOUT: [remove_backdrops],
+    }
+
+    def __init__(self, driver, attempts=BaseConfig.RETRY_ATTEMPTS, deadline=BaseConfig.RETRY_DEADLINE,
+                 base_delay=BaseConfig.RETRY_BASE_DELAY, max_delay=BaseConfig.RETRY_MAX_DELAY,
+                 retry_on=(STALE, INTERCEPTED, TIMEOUT, MISSING), recoveries=None, rng=None, stats=retry_stats):
+        self.driver = driver
+        self.attempts = attempts
+        self.deadline = deadline
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_on = set(retry_on)
+        self.recoveries = self.DEFAULT_RECOVERIES if recoveries is None else recoveries
+        self.rng = rng or random.Random()
+        self.stats = stats
+
+    def run(self, action, name="step", timeout=BaseConfig.DEFAULT_TIMEOUT):
+        """Call action(attempt_timeout) until it returns; the return value is passed through"""
+        started = time.monotonic()
+        kinds = []
+        for attempt in range(1, self.attempts + 1):
+            remaining = self.deadline - (time.monotonic() - started)
+            try:
+                result = action(max(0.5, min(timeout, remaining)))
+            except Exception as e:
+                kind = classify(e)
+                remaining = self.deadline - (time.monotonic() - started)
+                if kind not in self.retry_on or attempt == self.attempts or remaining <= 0:
+                    self.stats.record(name, attempt, kinds, success=False)
+                    raise
+                kinds.append(kind)
+                count_retry()
+                logger.warning(f"{name}: attempt {attempt} failed ({kind}: {str(e).splitlines()[0] if str(e) else type(e).__name__}), retrying")
+                self._recover(kind, e, name)
+                time.sleep(min(self._backoff(attempt), max(0.0, self.deadline - (time.monotonic() - started))))
+                continue
+            self.stats.record(name, attempt, kinds, success=True)
+            if kinds:
+                logger.info(f"{name}: recovered after {attempt} attempts ({', '.join(kinds)})")
+            return result
+
+    def _backoff(self, attempt):
+        """Full jitter: uniform between 0 and the exponential step, capped at max_delay"""
+        return self.rng.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    def _recover(self, kind, error, name):
+        for recovery in self.recoveries.get(kind, ()):
+            try:
+                recovery(self.driver, error)
+            except Exception as e:
+                # A failed recovery only means the next attempt runs without it
+                logger.debug(f"{name}: recovery {getattr(recovery, '__name__', recovery)} failed: {e}")
+
+
+def click(driver, element):
+    """Real click, falling back to a script click when another element would receive it"""
+    try:
+        element.click()
+    except (ElementClickInterceptedException, ElementNotInteractableException):
+        driver.execute_script("arguments[0].click();", element)
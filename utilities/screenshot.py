@@ -1,21 +1,163 @@
 # utilities/screenshot.py
+import atexit
+import base64
+import io
 import os
+import queue
+import random
+import threading
+from collections import deque
 from datetime import datetime
+from config.base_config import BaseConfig
+from utilities.logger import setup_logger, get_log_context
 
-def capture_screenshot(driver, test_name="screenshot"):
-    # Create screenshots directory if it doesn't exist
-    screenshot_dir = "screenshots"
-    if not os.path.exists(screenshot_dir):
-        os.makedirs(screenshot_dir)
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional; without it screenshots are stored as-is (PNG)
+    Image = None
+
+logger = setup_logger("screenshot")
+
+# Capture policies
+ALWAYS = "always"              # Every capture is written
+ON_FAILURE = "on_failure"      # Only failure captures are taken and written
+SAMPLED = "sampled"            # Failures plus a random sample of the rest
+RING_BUFFER = "ring_buffer"    # Keep the last N in memory, write them only when a failure happens
+
+_EXTENSIONS = {"png": "png", "jpeg": "jpg", "webp": "webp"}
+
+
+class ScreenshotPipeline:
+    """Grabs the raw screenshot payload on the test thread and does decoding, re-encoding and disk
+    writes on a background thread, so a capture costs one WebDriver round-trip and nothing else"""
+    def __init__(self, policy=BaseConfig.SCREENSHOT_POLICY, image_format=BaseConfig.SCREENSHOT_FORMAT,
+                 scale=BaseConfig.SCREENSHOT_SCALE, sample_rate=BaseConfig.SCREENSHOT_SAMPLE_RATE,
+                 ring_size=BaseConfig.SCREENSHOT_RING_SIZE, queue_size=BaseConfig.SCREENSHOT_QUEUE_SIZE):
+        if policy not in (ALWAYS, ON_FAILURE, SAMPLED, RING_BUFFER):
+            raise ValueError(f"Unsupported screenshot policy: {policy}")
+        if image_format not in _EXTENSIONS:
+            raise ValueError(f"Unsupported screenshot format: {image_format}")
+        if Image is None and (image_format != "png" or scale != 1):
+            logger.warning("Pillow is not installed; screenshots will be written as full-size PNG")
+            image_format, scale = "png", 1
+        self.policy = policy
+        self.image_format = image_format
+        self.scale = scale
+        self.sample_rate = sample_rate
+        self.dropped = 0
+        self._ring = deque(maxlen=ring_size)
+        self._ring_lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._writer = threading.Thread(target=self._write_loop, name="screenshot-writer", daemon=True)
+        self._writer.start()
+
+    def capture(self, driver, name, failed=False):
+        """Capture according to the policy; returns the path the file will be written to, or None"""
+        if self.policy == ON_FAILURE and not failed:
+            return None
+        if self.policy == SAMPLED and not failed and random.random() >= self.sample_rate:
+            return None
+
+        try:
+            payload = driver.get_screenshot_as_base64()
+        except Exception as e:
+            logger.error(f"Failed to take screenshot: {e}")
+            return None
+        frame = (name, payload, datetime.now(), BaseConfig.SCREENSHOT_DIR)
+
+        if self.policy == RING_BUFFER:
+            test_id = get_log_context().get("test_id")
+            with self._ring_lock:
+                if not failed:
+                    self._ring.append((test_id, frame))
+                    return None
+                # Dump the context leading up to the failure along with the failure itself, but only
+                # this test's: frames from other tests (or threads) say nothing about its failure
+                context = [buffered for owner, buffered in self._ring if owner == test_id]
+                self._ring = deque(((owner, buffered) for owner, buffered in self._ring if owner != test_id),
+                                   maxlen=self._ring.maxlen)
+            for buffered in context:
+                self._enqueue(buffered)
+        return self._enqueue(frame)
+
+    def start_test(self, test_id=None):
+        """Drop the frames buffered for `test_id` (default: the current log context's test), so a
+        failure only ever dumps screenshots taken during the test that failed"""
+        test_id = test_id or get_log_context().get("test_id")
+        with self._ring_lock:
+            self._ring = deque(((owner, frame) for owner, frame in self._ring if owner != test_id),
+                               maxlen=self._ring.maxlen)
 
-    # Generate unique filename with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    screenshot_path = os.path.join(screenshot_dir, f"{test_name}_{timestamp}.png")
+    def flush(self, timeout=None):
+        """Block until every queued screenshot has been written"""
+        if timeout is None:
+            self._queue.join()
+            return
+        done = threading.Event()
+        threading.Thread(target=lambda: (self._queue.join(), done.set()), daemon=True).start()
+        done.wait(timeout)
 
-    # Capture screenshot
-    driver.save_screenshot(screenshot_path)
-    print(f"Screenshot saved: {screenshot_path}")
-    return screenshot_path
+    def close(self):
+        self.flush(timeout=30)
+
+    def _enqueue(self, frame):
+        try:
+            # Briefly apply back-pressure, but never stall the browser thread for long
+            self._queue.put(frame, timeout=0.5)
+        except queue.Full:
+            self.dropped += 1
+            logger.warning(f"Screenshot queue full, dropped: {frame[0]}")
+            return None
+        return self._path_for(frame)
+
+    def _path_for(self, frame):
+        name, _, taken_at, directory = frame
+        timestamp = taken_at.strftime("%Y%m%d_%H%M%S_%f")
+        return os.path.join(directory, f"{name}_{timestamp}.{_EXTENSIONS[self.image_format]}")
+
+    def _write_loop(self):
+        while True:
+            frame = self._queue.get()
+            try:
+                path = self._path_for(frame)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "wb") as f:
+                    f.write(self._encode(base64.b64decode(frame[1])))
+                logger.info(f"Screenshot saved: {path}")
+            except Exception as e:
+                logger.error(f"Failed to write screenshot {frame[0]}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _encode(self, png_bytes):
+        if self.image_format == "png" and self.scale == 1:
+            return png_bytes
+        image = Image.open(io.BytesIO(png_bytes))
+        if self.scale != 1:
+            image = image.resize((max(1, int(image.width * self.scale)), max(1, int(image.height * self.scale))))
+        if self.image_format == "jpeg":
+            image = image.convert("RGB")
+        out = io.BytesIO()
+        image.save(out, format=self.image_format.upper(), quality=BaseConfig.SCREENSHOT_QUALITY)
+        return out.getvalue()
+
+
+_shared_pipeline = None
+_shared_pipeline_lock = threading.Lock()
+
+def get_screenshot_pipeline():
+    """Return the process-wide screenshot pipeline"""
+    global _shared_pipeline
+    with _shared_pipeline_lock:
+        if _shared_pipeline is None:
+            _shared_pipeline = ScreenshotPipeline()
+            atexit.register(_shared_pipeline.close)
+        return _shared_pipeline
+
+
+def capture_screenshot(driver, test_name="screenshot"):
+    """Capture an explicitly requested screenshot; these are treated as failure captures and always kept"""
+    return get_screenshot_pipeline().capture(driver, test_name, failed=True)
 
 # Example usage
 if __name__ == "__main__":
@@ -24,4 +166,5 @@ if __name__ == "__main__":
     driver = driver_setup.get_driver()
     driver.get("https://www.example.com")
     capture_screenshot(driver, "example_test")
-    driver_setup.quit_driver()
\ No newline at end of file
+    get_screenshot_pipeline().flush()
+    driver_setup.quit_driver()
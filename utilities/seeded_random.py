@@ -0,0 +1,154 @@
+# utilities/seeded_random.py
+import contextvars
+import hashlib
+import json
+import os
+import random
+import re
+import sys
+from config.base_config import BaseConfig
+from utilities.logger import setup_logger
+
+logger = setup_logger("seeded_random")
+
+_current = contextvars.ContextVar("seeded_random", default=None)
+
+
+def _caller():
+    """Outermost page-object method on the stack, so choices are labelled by the step that made them"""
+    frame, found = sys._getframe(2), None
+    while frame is not None:
+        if frame.f_globals.get("__name__", "").startswith("pages.") and frame.f_code.co_name != "wrapper":
+            owner = frame.f_locals.get("self")
+            found = f"{type(owner).__name__ if owner is not None else frame.f_globals['__name__']}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return found or "unknown"
+
+
+def _same(recorded, candidate):
+    # Dropdown options are dicts whose index can shift between runs; their text is what was chosen
+    if isinstance(recorded, dict) and isinstance(candidate, dict):
+        return recorded.get("text") == candidate.get("text")
+    return recorded == candidate
+
+
+def derive_seed(base_seed, test_id):
+    """Stable per-test seed from a run-wide seed, so one COGNISAAS_SEED reproduces every test"""
+    digest = hashlib.sha256(f"{base_seed}|{test_id}".encode()).hexdigest()
+    return int(digest[:12], 16)
+
+
+class SeededRandom(random.Random):
+    """random.Random that logs its seed and every choice/randint/choices draw with the page step that made
+    it. Given a recorded `replay` sequence, draws return the recorded values instead, as long as the
+    recorded value is still among the options; otherwise the seeded draw is used and the divergence logged"""
+    def __init__(self, seed=None, test_id=None, replay=None):
+        self.seed_value = seed if seed is not None else random.SystemRandom().getrandbits(48)
+        super().__init__(self.seed_value)
+        self.test_id = test_id
+        self.draws = []
+        self._replay = list(replay or [])
+
+    def choice(self, seq):
+        return self._draw("choice", lambda: super(SeededRandom, self).choice(seq),
+                          lambda value: any(_same(value, item) for item in seq),
+                          lambda value: next(item for item in seq if _same(value, item)))
+
+    def randint(self, a, b):
+        return self._draw("randint", lambda: super(SeededRandom, self).randint(a, b),
+                          lambda value: isinstance(value, int) and a <= value <= b)
+
+    def choices(self, population, weights=None, *, cum_weights=None, k=1):
+        return self._draw("choices", lambda: super(SeededRandom, self).choices(population, weights,
+                                                                               cum_weights=cum_weights, k=k),
+                          lambda value: isinstance(value, list) and len(value) == k
+                                        and all(item in population for item in value))
+
+    def _draw(self, kind, draw, fits, resolve=None):
+        step = _caller()
+        position = len(self.draws)
+        value = draw()  # Always drawn, so the seeded stream stays aligned whether or not a replay overrides it
+        if position < len(self._replay):
+            recorded = self._replay[position]
+            if recorded["kind"] == kind and fits(recorded["value"]):
+                value = resolve(recorded["value"]) if resolve else recorded["value"]
+            else:
+                logger.warning(f"Replay diverged at draw #{position} ({step}): recorded {recorded['value']!r} "
+                               f"is not available, using seeded value")
+        self.draws.append({"step": step, "kind": kind, "value": value})
+        label = value.get("text") if isinstance(value, dict) else value
+        logger.info(f"Random draw #{position} {step}: {label!r}")
+        return value
+
+    def checkpoint(self):
+        """The current draw position, for rewind()"""
+        return self.getstate(), len(self.draws)
+
+    def rewind(self, checkpoint):
+        """Undo the draws made since `checkpoint`, e.g. one made from options that turned out to be stale,
+        so the next draw takes their position and the sequence does not depend on why they were undone"""
+        state, position = checkpoint
+        self.setstate(state)
+        if len(self.draws) > position:
+            logger.info(f"Discarding random draw(s) #{position}-#{len(self.draws) - 1}")
+            del self.draws[position:]
+
+    def as_dict(self):
+        return {"test_id": self.test_id, "seed": self.seed_value, "draws": self.draws}
+
+    def save(self, directory=BaseConfig.RNG_RECORD_DIR):
+        os.makedirs(directory, exist_ok=True)
+        path = record_path(self.test_id, directory)
+        with open(path, "w") as f:
+            json.dump(self.as_dict(), f, indent=2)
+        return path
+
+
+def record_path(test_id, directory=BaseConfig.RNG_RECORD_DIR):
+    return os.path.join(directory, re.sub(r"[^A-Za-z0-9_.-]+", "_", test_id or "unnamed") + ".json")
+
+
+def start_test(test_id, seed=BaseConfig.RNG_SEED, replay=BaseConfig.RNG_REPLAY):
+    """Make a seeded RNG current for `test_id`. With `replay`, the test's recorded seed and choice
+    sequence from a failed run are loaded (RNG_REPLAY=1 uses the default record for the test id)"""
+    recorded = None
+    if replay:
+        path = record_path(test_id) if replay in ("1", True) else replay
+        try:
+            with open(path) as f:
+                recorded = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"No choice record to replay for {test_id} at {path}: {e}")
+    if recorded is not None:
+        rng = SeededRandom(recorded["seed"], test_id, replay=recorded["draws"])
+        logger.info(f"Replaying {len(recorded['draws'])} recorded draw(s) for {test_id} with seed {rng.seed_value}")
+    else:
+        rng = SeededRandom(derive_seed(seed, test_id) if seed else None, test_id)
+        logger.info(f"Random seed for {test_id}: {rng.seed_value} (replay with COGNISAAS_RNG_REPLAY=1)")
+    _current.set(rng)
+    return rng
+
+
+def finish_test(test_case=None, failed=None):
+    """Write the choice record if the test failed and detach the RNG. Meant for addCleanup on a
+    LoggedInTestCase, whose test_failed carries the outcome; elsewhere pass `failed`"""
+    rng = _current.get()
+    if rng is None:
+        return None
+    if failed is None:
+        failed = bool(getattr(test_case, "test_failed", False))
+    _current.set(None)
+    if failed:
+        path = rng.save()
+        logger.info(f"Saved seed {rng.seed_value} and {len(rng.draws)} draw(s) for replay: {path}")
+        return path
+    return None
+
+
+def get_test_rng():
+    """The current test's RNG; outside a test, a fresh randomly seeded one (its seed is still logged)"""
+    rng = _current.get()
+    if rng is None:
+        rng = SeededRandom()
+        logger.debug(f"No test RNG active, using seed {rng.seed_value}")
+    return rng
@@ -0,0 +1,144 @@
+# utilities/session_cache.py
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from selenium.common.exceptions import TimeoutException
+from config.base_config import BaseConfig
+from config.credentials import Credentials
+from config.environments import Environments
+from pages.login_page import LoginPage
+from utilities.logger import setup_logger
+
+logger = setup_logger("session_cache")
+
+class SessionCache:
+    """Logs in through LoginPage once and replays the authenticated session into later drivers"""
+    def __init__(self, cache_dir=BaseConfig.SESSION_CACHE_DIR, ttl=BaseConfig.SESSION_CACHE_TTL):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def login(self, driver, email=Credentials.VALID_EMAIL, password=Credentials.VALID_PASSWORD,
+              environment=Environments.DEFAULT_ENV):
+        """Leave `driver` logged in; returns True only if a real UI login was needed"""
+        with self._lock_for(environment, email):
+            snapshot = self.load(environment, email)
+            if snapshot is not None:
+                if self.inject(driver, snapshot) and self._verify(driver, BaseConfig.SESSION_VERIFY_TIMEOUT):
+                    logger.info(f"Reused cached session for {email}")
+                    return False
+                logger.warning(f"Cached session for {email} was rejected, logging in again")
+                self.invalidate(environment, email)
+
+            login_page = LoginPage(driver)
+            login_page.open()
+            login_page.enter_email(email)
+            login_page.enter_password(password)
+            login_page.click_login()
+            login_page.verify_login()
+            self.save(environment, email, self.snapshot(driver, environment))
+            return True
+
+    def snapshot(self, driver, environment=Environments.DEFAULT_ENV):
+        """Capture cookies plus localStorage/sessionStorage from the current page"""
+        storage = driver.execute_script("""
+            var dump = function (store) {
+                var items = {};
+                for (var i = 0; i < store.length; i++) {
+                    var key = store.key(i);
+                    items[key] = store.getItem(key);
+                }
+                return items;
+            };
+            return {local: dump(window.localStorage), session: dump(window.sessionStorage)};
+        """)
+        cookies = driver.get_cookies()
+
+        # Never keep a session longer than its shortest-lived cookie
+        expires_at = time.time() + self.ttl
+        cookie_expiries = [c["expiry"] for c in cookies if "expiry" in c]
+        if cookie_expiries:
+            expires_at = min(expires_at, min(cookie_expiries))
+
+        return {
+            "environment": environment,
+            "url": driver.current_url,
+            "cookies": cookies,
+            "local_storage": storage["local"],
+            "session_storage": storage["session"],
+            "created_at": time.time(),
+            "expires_at": expires_at,
+        }
+
+    def inject(self, driver, snapshot):
+        """Load a snapshot into `driver`; returns False if the browser refused it"""
+        try:
+            # Cookies and storage can only be set once the browser is on the target origin
+            driver.get(snapshot["environment"])
+            for cookie in snapshot["cookies"]:
+                driver.add_cookie(cookie)
+            driver.execute_script("""
+                var local = arguments[0], session = arguments[1];
+                Object.keys(local).forEach(function (k) { window.localStorage.setItem(k, local[k]); });
+                Object.keys(session).forEach(function (k) { window.sessionStorage.setItem(k, session[k]); });
+            """, snapshot["local_storage"], snapshot["session_storage"])
+            driver.get(snapshot["url"])
+            return True
+        except Exception as e:
+            logger.error(f"Failed to inject cached session: {e}")
+            return False
+
+    def load(self, environment, email):
+        """Return the cached snapshot for (environment, email), or None if missing or expired"""
+        path = self._path(environment, email)
+        try:
+            with open(path) as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if snapshot.get("expires_at", 0) <= time.time():
+            self.invalidate(environment, email)
+            return None
+        return snapshot
+
+    def save(self, environment, email, snapshot):
+        """Write the snapshot atomically so parallel readers never see a partial file"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(snapshot, f)
+        os.replace(tmp_path, self._path(environment, email))
+
+    def invalidate(self, environment, email):
+        try:
+            os.remove(self._path(environment, email))
+        except FileNotFoundError:
+            pass
+
+    def _verify(self, driver, timeout):
+        try:
+            return LoginPage(driver).verify_login(timeout=timeout)
+        except TimeoutException:
+            return False
+
+    def _path(self, environment, email):
+        key = hashlib.sha1(f"{environment}|{email}".encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _lock_for(self, environment, email):
+        with self._locks_guard:
+            return self._locks.setdefault((environment, email), threading.Lock())
+
+
+_shared_cache = None
+
+def get_session_cache():
+    """Return the process-wide session cache"""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = SessionCache()
+    return _shared_cache
@@ -0,0 +1,247 @@
+# utilities/waits.py
+import time
+import threading
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from config.base_config import BaseConfig
+from utilities.logger import setup_logger
+
+logger = setup_logger("waits")
+
+# Counts XHR/fetch requests in flight (once per document). install_network_hooks has Chrome run it
+# before any page script, so requests a page starts while loading are counted too; elsewhere the
+# first wait on a page installs it, and only sees requests started after that.
+_NETWORK_HOOK_SCRIPT = """
+(function () {
+    if (window.__cogniWaits) return;
+    var hooks = window.__cogniWaits = {pending: 0, lastNetwork: Date.now(), lastMutation: Date.now(), listeners: []};
+    var touch = function () { hooks.lastNetwork = Date.now(); };
+    var origSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        hooks.pending++; touch();
+        this.addEventListener('loadend', function () { hooks.pending--; touch(); });
+        return origSend.apply(this, arguments);
+    };
+    if (window.fetch) {
+        var origFetch = window.fetch;
+        window.fetch = function () {
+            hooks.pending++; touch();
+            return origFetch.apply(this, arguments).finally(function () { hooks.pending--; touch(); });
+        };
+    }
+})();
+"""
+
+# Runs inside the page as an async script. Installs (once per document) a MutationObserver plus the
+# request counters, then re-checks the requested condition on every DOM mutation and animation
+# frame, calling back the moment it holds. One WebDriver round-trip per wait, no polling.
+_WAIT_SCRIPT = _NETWORK_HOOK_SCRIPT + """
+var name = arguments[0], args = arguments[1] || {}, timeoutMs = arguments[2];
+var done = arguments[arguments.length - 1];
+
+var hooks = window.__cogniWaits;
+if (!hooks.observing) {
+    // Not part of the early hooks: the document element does not exist yet when they run
+    hooks.observing = true;
+    new MutationObserver(function () {
+        hooks.lastMutation = Date.now();
+        hooks.listeners.slice().forEach(function (fn) { fn(); });
+    }).observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+}
+
+var isVisible = function (el) {
+    var style = window.getComputedStyle(el);
+    return style.display !== 'none' && style.visibility !== 'hidden' && style.opacity !== '0'
+        && el.getClientRects().length > 0;
+};
+var readValue = function (el) {
+    var v = (el.tagName === 'INPUT' || el.tagName === 'TEXTAREA') ? el.value : el.textContent;
+    return (v || '').trim();
+};
+var lastRect = null, stableFrames = 0;
+
+var conditions = {
+    listbox_rendered: function () {
+        var options = document.querySelectorAll(args.selector);
+        return options.length >= args.minOptions && isVisible(options[0]);
+    },
+    listbox_closed: function () {
+        return document.querySelectorAll(args.selector).length === 0;
+    },
+    backdrop_gone: function () {
+        return !Array.prototype.some.call(document.querySelectorAll('.MuiBackdrop-root'), isVisible);
+    },
+    scroll_settled: function () {
+        var r = (args.element || document.scrollingElement).getBoundingClientRect();
+        var key = r.top + ',' + r.left + ',' + window.scrollY + ',' + window.scrollX;
+        stableFrames = (key === lastRect) ? stableFrames + 1 : 0;
+        lastRect = key;
+        return stableFrames >= args.frames;
+    },
+    value_committed: function () {
+        var v = readValue(args.element);
+        return args.expected == null ? v.length > 0 : v.indexOf(args.expected) !== -1;
+    },
+    no_pending_requests: function () {
+        return hooks.pending <= 0 && Date.now() - hooks.lastNetwork >= args.quietMs;
+    },
+    dom_settled: function () {
+        return Date.now() - hooks.lastMutation >= args.quietMs;
+    }
+};
+
+var check = conditions[name], start = Date.now(), finished = false;
+var finish = function (ok) {
+    if (finished) return;
+    finished = true;
+    hooks.listeners = hooks.listeners.filter(function (fn) { return fn !== tick; });
+    done(ok);
+};
+var tick = function () {
+    if (finished) return;
+    try {
+        if (check()) return finish(true);
+    } catch (e) {}
+    if (Date.now() - start >= timeoutMs) return finish(false);
+};
+var loop = function () {
+    tick();
+    if (finished) return;
+    // rAF for frame-accurate checks, setTimeout as a fallback for throttled background tabs
+    var scheduled = false;
+    var next = function () { if (!scheduled) { scheduled = true; loop(); } };
+    window.requestAnimationFrame(next);
+    setTimeout(next, 50);
+};
+hooks.listeners.push(tick);
+loop();
+"""
+
+
+def install_network_hooks(driver):
+    """Have Chrome install the request counters in every new document before the page's own scripts
+    run, so no_pending_requests also sees the page's initial data load. Returns False where CDP is
+    unavailable; waits then install the counters themselves"""
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": _NETWORK_HOOK_SCRIPT})
+    except Exception as e:
+        logger.warning(f"Could not install request counters ahead of page scripts: {e}")
+        return False
+    return True
+
+
+class WaitTiming:
+    """One resolved wait: how long it took versus the fixed sleep it replaced"""
+    def __init__(self, name, elapsed, replaced_sleep, success):
+        self.name = name
+        self.elapsed = elapsed
+        self.replaced_sleep = replaced_sleep
+        self.success = success
+
+    def as_dict(self):
+        return {
+            "name": self.name,
+            "elapsed_ms": round(self.elapsed * 1000, 1),
+            "replaced_sleep_ms": round(self.replaced_sleep * 1000, 1) if self.replaced_sleep else None,
+            "success": self.success,
+        }
+
+
+class WaitRecorder:
+    """Collects WaitTiming entries so a run can report time saved against the old sleeps"""
+    def __init__(self):
+        self._timings = []
+        self._lock = threading.Lock()
+
+    def record(self, timing):
+        with self._lock:
+            self._timings.append(timing)
+
+    def timings(self):
+        with self._lock:
+            return list(self._timings)
+
+    def reset(self):
+        with self._lock:
+            self._timings = []
+
+    def summary(self):
+        """Aggregate elapsed time and replaced sleep time per wait name"""
+        summary = {}
+        for timing in self.timings():
+            entry = summary.setdefault(timing.name, {"count": 0, "elapsed_ms": 0.0, "replaced_sleep_ms": 0.0, "timeouts": 0})
+            entry["count"] += 1
+            entry["elapsed_ms"] += timing.elapsed * 1000
+            entry["replaced_sleep_ms"] += (timing.replaced_sleep or 0) * 1000
+            if not timing.success:
+                entry["timeouts"] += 1
+        return summary
+
+
+wait_recorder = WaitRecorder()
+
+
+class PageWaits:
+    """Event-driven replacements for fixed time.sleep calls in page objects.
+
+    Waits raise TimeoutException after `timeout`. When `replaced_sleep` is given instead, the wait
+    is capped at that many seconds and does not raise, so it is never slower than the sleep it replaces.
+    """
+    LISTBOX_OPTIONS = "ul[role='listbox'] > li"
+
+    def __init__(self, driver, timeout=BaseConfig.DEFAULT_TIMEOUT, recorder=wait_recorder):
+        self.driver = driver
+        self.timeout = timeout
+        self.recorder = recorder
+
+    def listbox_rendered(self, selector=LISTBOX_OPTIONS, min_options=1, replaced_sleep=None, timeout=None):
+        """Wait until an MUI listbox has rendered at least `min_options` visible options"""
+        return self._wait("listbox_rendered", {"selector": selector, "minOptions": min_options},
+                          replaced_sleep, timeout)
+
+    def listbox_closed(self, selector=LISTBOX_OPTIONS, replaced_sleep=None, timeout=None):
+        """Wait until the open listbox has been removed from the DOM"""
+        return self._wait("listbox_closed", {"selector": selector}, replaced_sleep, timeout)
+
+    def backdrop_gone(self, replaced_sleep=None, timeout=None):
+        """Wait until no MUI backdrop is covering the page"""
+        return self._wait("backdrop_gone", {}, replaced_sleep, timeout)
+
+    def scroll_settled(self, element=None, frames=2, replaced_sleep=None, timeout=None):
+        """Wait until `element` (or the page) has stopped moving for `frames` animation frames"""
+        return self._wait("scroll_settled", {"element": element, "frames": frames}, replaced_sleep, timeout)
+
+    def value_committed(self, element, expected=None, replaced_sleep=None, timeout=None):
+        """Wait until `element` shows `expected` (or any non-empty value) in its value or text"""
+        return self._wait("value_committed", {"element": element, "expected": expected}, replaced_sleep, timeout)
+
+    def no_pending_requests(self, quiet_ms=100, replaced_sleep=None, timeout=None):
+        """Wait until no XHR/fetch is in flight and the network has been quiet for `quiet_ms`"""
+        return self._wait("no_pending_requests", {"quietMs": quiet_ms}, replaced_sleep, timeout)
+
+    def dom_settled(self, quiet_ms=150, replaced_sleep=None, timeout=None):
+        """Wait until the DOM has not mutated for `quiet_ms` (animations, re-renders finished)"""
+        return self._wait("dom_settled", {"quietMs": quiet_ms}, replaced_sleep, timeout)
+
+    def _wait(self, name, args, replaced_sleep, timeout):
+        soft = replaced_sleep is not None and timeout is None
+        if timeout is None:
+            timeout = replaced_sleep if soft else self.timeout
+        start = time.perf_counter()
+        try:
+            success = bool(self.driver.execute_async_script(_WAIT_SCRIPT, name, args, int(timeout * 1000)))
+        except TimeoutException:
+            # The driver's own script timeout fired before the in-page deadline
+            success = False
+        except WebDriverException:
+            # e.g. a stale element argument; a soft wait gives up early instead of failing the step
+            if not soft:
+                raise
+            success = False
+        elapsed = time.perf_counter() - start
+        self.recorder.record(WaitTiming(name, elapsed, replaced_sleep, success))
+
+        saved = f", replaced {replaced_sleep}s sleep" if replaced_sleep else ""
+        logger.info(f"Wait '{name}' {'resolved' if success else 'timed out'} in {elapsed * 1000:.0f} ms{saved}")
+        if not success and not soft:
+            raise TimeoutException(f"Wait '{name}' did not resolve within {timeout}s")
+        return elapsed